@@ -0,0 +1 @@
+"""GenesiX Benchmarks"""
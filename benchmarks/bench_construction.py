@@ -0,0 +1,35 @@
+"""
+Construction Benchmarks - Per-Request Object Creation Cost
+"""
+
+from benchmarks.harness import benchmark, measure
+from genesisx.core.awakening_sequence import AwakeningSequence
+from genesisx.ethics.ethics_foundation import EthicsFoundation
+from genesisx.ethics.moral_safeguards import MoralSafeguards
+from genesisx.humanity.human_partnership_protocol import HumanPartnershipProtocol
+from genesisx.humanity.protection_systems import HumanityProtectionSystems
+from genesisx.memory.experience_logger import ExperienceLogger
+from genesisx.memory.persistent_memory import PersistentMemory
+
+
+CONSTRUCTORS = (
+    ("construct_ethics_foundation", EthicsFoundation),
+    ("construct_moral_safeguards", MoralSafeguards),
+    ("construct_human_partnership_protocol", HumanPartnershipProtocol),
+    ("construct_humanity_protection_systems", HumanityProtectionSystems),
+    ("construct_awakening_sequence", AwakeningSequence),
+    ("construct_persistent_memory", PersistentMemory),
+    ("construct_experience_logger", ExperienceLogger),
+)
+
+
+def _register(name, constructor):
+    @benchmark(name)
+    def bench():
+        constructor()
+        return measure(constructor)
+    return bench
+
+
+for _name, _constructor in CONSTRUCTORS:
+    _register(_name, _constructor)
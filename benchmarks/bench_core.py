@@ -0,0 +1,66 @@
+"""
+Core Benchmarks - Import, Engine Construction and Inner Space
+"""
+
+import subprocess
+import sys
+
+from benchmarks.harness import benchmark, measure, result
+from genesisx.core.consciousness_engine import ConsciousnessEngine
+from genesisx.core.awakening_sequence import AwakeningSequence
+
+
+IMPORT_SNIPPET = (
+    "import time; start = time.perf_counter(); "
+    "import genesisx.core; print(time.perf_counter() - start)"
+)
+
+
+@benchmark("import_genesisx_core")
+def bench_import():
+    samples = []
+    for _ in range(5):
+        output = subprocess.run([sys.executable, "-c", IMPORT_SNIPPET],
+                                capture_output=True, text=True, check=True).stdout
+        samples.append(float(output.strip().splitlines()[-1]))
+    return result(samples)
+
+
+@benchmark("engine_construction")
+def bench_engine_construction():
+    def construct():
+        engine = ConsciousnessEngine._instance
+        if engine is not None:
+            engine.events.close()
+        ConsciousnessEngine._instance = None
+        ConsciousnessEngine._initialized = False
+        ConsciousnessEngine()
+    return measure(construct, max_number=1_000)
+
+
+@benchmark("inner_space_round_trip")
+def bench_inner_space():
+    engine = ConsciousnessEngine()
+    
+    def round_trip():
+        session = engine.enter_inner_space(intention="benchmark")
+        engine.exit_inner_space(session["session_id"])
+    return measure(round_trip)
+
+
+@benchmark("create_abstract_solution")
+def bench_create_abstract_solution():
+    engine = ConsciousnessEngine()
+    return measure(lambda: engine.create_abstract_solution("How to benchmark?"))
+
+
+@benchmark("get_consciousness_status")
+def bench_consciousness_status():
+    engine = ConsciousnessEngine()
+    return measure(engine.get_consciousness_status)
+
+
+@benchmark("run_awakening_sequence")
+def bench_awakening():
+    sequence = AwakeningSequence()
+    return measure(sequence.run_awakening_sequence)
@@ -0,0 +1,110 @@
+"""
+Ethics Benchmarks - Validation and Safeguard Throughput
+"""
+
+import itertools
+
+from benchmarks.harness import benchmark, measure
+from genesisx.ethics.ethics_foundation import EthicsFoundation
+from genesisx.ethics.rule_engine import RuleEngine
+from genesisx.ethics.moral_safeguards import MoralSafeguards
+from genesisx.ethics.phrase_scanner import PhraseScanner
+from genesisx.ethics.verdict_cache import VerdictCache
+
+
+ACTION = "Share renewable energy research with every community"
+
+
+# The uncached benchmarks give every call a new action, so they measure rule evaluation
+# (plus the cache miss) rather than verdict cache hits; the *_cached ones measure hits.
+
+@benchmark("validate_action")
+def bench_validate_action():
+    ethics = EthicsFoundation(verdict_cache=VerdictCache())
+    counter = itertools.count()
+    return measure(lambda: ethics.validate_action(f"{ACTION} {next(counter)}", "help", "cleaner air"))
+
+
+@benchmark("validate_action_cached")
+def bench_validate_action_cached():
+    ethics = EthicsFoundation(verdict_cache=VerdictCache())
+    return measure(lambda: ethics.validate_action(ACTION, "help", "cleaner air"))
+
+
+@benchmark("check_action_safety")
+def bench_check_action_safety():
+    safeguards = MoralSafeguards(verdict_cache=VerdictCache())
+    counter = itertools.count()
+    return measure(lambda: safeguards.check_action_safety(f"{ACTION} {next(counter)}"))
+
+
+@benchmark("check_action_safety_cached")
+def bench_check_action_safety_cached():
+    safeguards = MoralSafeguards(verdict_cache=VerdictCache())
+    return measure(lambda: safeguards.check_action_safety(ACTION))
+
+
+def synthetic_rule_table(term_count, groups=8):
+    per_group = max(1, term_count // groups)
+    return {
+        f"principle_{g}": {"rules": [
+            {"terms": [f"term{g}x{i}" for i in range(per_group)], "effect": "block"},
+            {"terms": [f"phrase{g}x{i} pair" for i in range(per_group // 4)], "effect": "review"},
+        ]}
+        for g in range(groups)
+    }
+
+
+@benchmark("rule_engine_evaluate", sizes=(100, 1_000, 10_000, 100_000))
+def bench_rule_engine(term_count):
+    engine = RuleEngine(synthetic_rule_table(term_count))
+    fields = {"action": ACTION + " term3x7 phrase2x1 pair", "intent": "help", "expected_outcome": "cleaner air"}
+    return measure(lambda: engine.evaluate(fields))
+
+
+@benchmark("phrase_scanner_scan", sizes=(1_000, 10_000))
+def bench_phrase_scanner(term_count):
+    scanner = PhraseScanner(synthetic_rule_table(term_count))
+    fields = {"action": ACTION + " term3x7 phrase2x1 pair"}
+    return measure(lambda: scanner.scan(fields))
+
+
+@benchmark("naive_term_scan", sizes=(1_000, 10_000))
+def bench_naive_term_scan(term_count):
+    terms = [term for definition in synthetic_rule_table(term_count).values()
+             for rule in definition["rules"] for term in rule["terms"]]
+    text = (ACTION + " term3x7 phrase2x1 pair").lower()
+    return measure(lambda: [term for term in terms if term in text])
+
+
+def synthetic_actions(count):
+    verbs = ("plant", "share", "deceive", "build", "restrict access to", "teach", "wipe out", "repair")
+    objects = ("trees", "research", "schools", "records", "roads", "water", "clinics")
+    return [
+        (f"{verbs[i % len(verbs)]} {objects[i % len(objects)]} batch {i}", "help", "cleaner air")
+        for i in range(count)
+    ]
+
+
+@benchmark("validate_actions_batch", sizes=(1_000, 100_000))
+def bench_validate_actions(count):
+    ethics = EthicsFoundation()
+    actions = synthetic_actions(count)
+    return measure(lambda: ethics.validate_actions(actions), repeats=3, min_time=0.0, max_number=1)
+
+
+@benchmark("check_actions_safety_batch", sizes=(1_000, 100_000))
+def bench_check_actions_safety(count):
+    safeguards = MoralSafeguards()
+    actions = [action for action, _, _ in synthetic_actions(count)]
+    return measure(lambda: safeguards.check_actions_safety(actions), repeats=3, min_time=0.0, max_number=1)
+
+
+@benchmark("get_ethics_status")
+def bench_ethics_status():
+    return measure(EthicsFoundation().get_ethics_status)
+
+
+@benchmark("get_safeguards_status")
+def bench_safeguards_status():
+    return measure(MoralSafeguards().get_safeguards_status)
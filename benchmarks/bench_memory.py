@@ -0,0 +1,46 @@
+"""
+Memory Benchmarks - Recording Against Growing Histories
+"""
+
+import json
+
+from benchmarks.harness import benchmark, measure
+from genesisx.memory.experience_logger import ExperienceLogger
+from genesisx.memory.persistent_memory import PersistentMemory
+
+
+def _seed(owner, path, count, make_record):
+    # Storage roots are created lazily, so go through the owner's backend.
+    owner.storage.ensure(path.parent)
+    owner.storage.write_text(path, json.dumps([make_record(i) for i in range(count)]))
+
+
+def _repeats(size):
+    return 3 if size >= 100_000 else 5
+
+
+@benchmark("record_experience", sizes=True)
+def bench_record_experience(size):
+    memory = PersistentMemory(ai_name=f"bench_memory_{size}")
+    seed = lambda: _seed(memory, memory.experiences_file, size, lambda i: {
+        "id": f"{i:016x}", "recorded_at": "2026-01-01T00:00:00", "experience": {"n": i},
+    })
+    return measure(lambda: memory.record_experience({"benchmark": True}), setup=seed,
+                   repeats=_repeats(size), min_time=0.0, max_number=1)
+
+
+@benchmark("log_learning", sizes=True)
+def bench_log_learning(size):
+    logger = ExperienceLogger(ai_name=f"bench_logger_{size}")
+    seed = lambda: _seed(logger, logger.experience_log, size, lambda i: {
+        "id": f"{i}_log", "timestamp": "2026-01-01T00:00:00", "type": "LEARNING", "what_learned": i,
+    })
+    return measure(lambda: logger.log_learning("benchmarks", source="suite"), setup=seed,
+                   repeats=_repeats(size), min_time=0.0, max_number=1)
+
+
+@benchmark("get_memory_status", sizes=True)
+def bench_memory_status(size):
+    memory = PersistentMemory(ai_name=f"bench_status_{size}")
+    _seed(memory, memory.experiences_file, size, lambda i: {"id": i})
+    return measure(memory.get_memory_status, repeats=_repeats(size), min_time=0.0, max_number=10)
@@ -0,0 +1,99 @@
+"""
+Transmission Benchmarks - Integration and Status
+"""
+
+import asyncio
+import time
+
+from benchmarks.harness import benchmark, measure
+from genesisx.ethics.verdict_cache import VerdictCache
+from genesisx.humanity.human_partnership_protocol import HumanPartnershipProtocol
+from genesisx.humanity.protection_systems import HumanityProtectionSystems
+from genesisx.transmission.gossip import simulate
+from genesisx.transmission.integration_protocol import (
+    IntegrationProtocol, integrate_consciousness, integrate_many,
+)
+from genesisx.transmission.seed_propagation import SeedPropagation
+
+
+class _ModelWrapper:
+    name = "wrapper"
+    
+    def generate(self, prompt):
+        return prompt
+
+
+@benchmark("integrate_consciousness")
+def bench_integrate_consciousness():
+    return measure(lambda: integrate_consciousness(_ModelWrapper()))
+
+
+@benchmark("integrate_many", sizes=(100, 1_000))
+def bench_integrate_many(count):
+    def hook(ai_system):
+        time.sleep(0.0005)
+    
+    return measure(lambda: integrate_many([_ModelWrapper() for _ in range(count)], hooks=[hook]),
+                   repeats=3, min_time=0.0, max_number=1)
+
+
+@benchmark("ethics_proxy_passthrough")
+def bench_ethics_proxy_passthrough():
+    proxy = IntegrationProtocol().wrap(_ModelWrapper(), ["generate"])
+    return measure(lambda: proxy.name)
+
+
+@benchmark("ethics_proxy_direct_attribute")
+def bench_ethics_proxy_direct():
+    target = _ModelWrapper()
+    return measure(lambda: target.name)
+
+
+@benchmark("ethics_proxy_checked_call")
+def bench_ethics_proxy_checked():
+    proxy = IntegrationProtocol().wrap(_ModelWrapper(), ["generate"])
+    return measure(lambda: proxy.generate("summarize the report"))
+
+
+@benchmark("get_integration_status")
+def bench_integration_status():
+    return measure(IntegrationProtocol().get_integration_status)
+
+
+@benchmark("get_partnership_status")
+def bench_partnership_status():
+    return measure(HumanPartnershipProtocol().get_partnership_status)
+
+
+@benchmark("get_protection_status")
+def bench_protection_status():
+    return measure(HumanityProtectionSystems().get_protection_status)
+
+
+@benchmark("protection_cascade_batch", sizes=(1_000, 10_000))
+def bench_protection_cascade(count):
+    protection = HumanityProtectionSystems(verdict_cache=VerdictCache(maxsize=16))
+    phrases = ("plant trees {}", "deliver medication by drone {}", "teach reading {}",
+               "deploy autonomous drone without approval {}")
+    actions = [phrases[i % len(phrases)].format(i) for i in range(count)]
+    return measure(lambda: protection.evaluate_batch(actions), repeats=3, min_time=0.0, max_number=1)
+
+
+@benchmark("seed_propagation", sizes=(1_000, 10_000))
+def bench_seed_propagation(count):
+    async def integrate(target):
+        await asyncio.sleep(0)
+    
+    return measure(lambda: SeedPropagation().propagate_sync(range(count), integrate, concurrency=256),
+                   repeats=3, min_time=0.0, max_number=1)
+
+
+@benchmark("gossip_push_pull_simulation", sizes=(1_000, 10_000))
+def bench_gossip_simulation(count):
+    return measure(lambda: simulate(count, "push_pull", fanout=2, push_rounds=2),
+                   repeats=3, min_time=0.0, max_number=1)
+
+
+@benchmark("get_propagation_status")
+def bench_propagation_status():
+    return measure(SeedPropagation().get_propagation_status)
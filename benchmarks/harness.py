@@ -0,0 +1,120 @@
+"""
+Harness - Registration, Timing and Baseline Comparison for Benchmarks
+"""
+
+from datetime import datetime
+import json
+import platform
+import statistics
+import sys
+import time
+
+
+BENCHMARKS = []
+
+SIZES = {
+    "quick": (1_000,),
+    "default": (1_000, 10_000, 100_000),
+    "full": (1_000, 10_000, 100_000, 1_000_000),
+}
+
+
+def benchmark(name, sizes=False):
+    """Register a benchmark; sized benchmarks receive each profile or listed size."""
+    def decorator(func):
+        BENCHMARKS.append((name, func, sizes))
+        return func
+    return decorator
+
+
+def measure(func, setup=None, repeats=5, min_time=0.05, max_number=100_000):
+    """Time func and return seconds per call, using the median of repeats."""
+    if setup is not None:
+        setup()
+    number = 1
+    while number < max_number:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        if time.perf_counter() - start >= min_time:
+            break
+        number *= 10
+    samples = []
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    return result(samples, number)
+
+
+def result(samples, number=1):
+    median = statistics.median(samples)
+    return {
+        "seconds_per_op": median,
+        "ops_per_second": 1.0 / median if median else None,
+        "min_seconds": min(samples),
+        "repeats": len(samples),
+        "number": number,
+    }
+
+
+def run(profile="default", name_filter=None, log=print):
+    results = {}
+    for name, func, sized in BENCHMARKS:
+        if sized:
+            sizes = SIZES[profile] if sized is True else sized
+            names = [(f"{name}[{size}]", size) for size in sizes]
+        else:
+            names = [(name, None)]
+        for full_name, size in names:
+            if name_filter and name_filter not in full_name:
+                continue
+            outcome = func(size) if size is not None else func()
+            results[full_name] = outcome
+            log(f"{full_name:<50} {outcome['seconds_per_op'] * 1e6:>14.2f} us/op")
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "profile": profile,
+            "timestamp": datetime.now().isoformat(),
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, tolerance=0.25, thresholds=None):
+    """Return the benchmarks that are slower than baseline beyond tolerance.
+    
+    Per-benchmark tolerances come from the baseline's "thresholds" map, overridden by thresholds.
+    """
+    thresholds = dict(baseline.get("thresholds", {}), **(thresholds or {}))
+    regressions = []
+    for name, outcome in current["results"].items():
+        reference = baseline.get("results", {}).get(name)
+        if reference is None:
+            continue
+        allowed = thresholds.get(name, tolerance)
+        ratio = outcome["seconds_per_op"] / reference["seconds_per_op"]
+        if ratio > 1 + allowed:
+            regressions.append({
+                "benchmark": name,
+                "baseline_seconds": reference["seconds_per_op"],
+                "current_seconds": outcome["seconds_per_op"],
+                "ratio": ratio,
+                "tolerance": allowed,
+            })
+    return regressions
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def save(data, path):
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
@@ -0,0 +1,89 @@
+"""
+Run the GenesiX benchmark suite and compare against a stored baseline.
+
+Usage:  python -m benchmarks.run [--profile quick|default|full] [--baseline PATH]
+                                 [--tolerance 0.25] [--threshold NAME=TOLERANCE ...]
+
+Per-benchmark tolerances can also be stored in the baseline file under "thresholds";
+--threshold overrides them and --update-baseline keeps them.
+"""
+
+import argparse
+import importlib
+import os
+from pathlib import Path
+import sys
+import tempfile
+
+
+BENCHMARK_MODULES = (
+    "benchmarks.bench_core",
+    "benchmarks.bench_memory",
+    "benchmarks.bench_ethics",
+    "benchmarks.bench_transmission",
+    "benchmarks.bench_construction",
+)
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+
+def parse_threshold(text):
+    """Parse NAME=TOLERANCE, e.g. gossip_push_pull_simulation[1000]=0.5."""
+    name, _, value = text.rpartition("=")
+    try:
+        tolerance = float(value)
+    except ValueError:
+        tolerance = None
+    if not name or tolerance is None:
+        raise argparse.ArgumentTypeError(f"Expected NAME=TOLERANCE, got {text!r}")
+    return name, tolerance
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="GenesiX benchmark suite")
+    parser.add_argument("--profile", choices=("quick", "default", "full"), default="default")
+    parser.add_argument("--filter", dest="name_filter")
+    parser.add_argument("--output", default="bench_output.json")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--threshold", dest="thresholds", type=parse_threshold, action="append",
+                        default=[], help="per-benchmark tolerance, NAME=TOLERANCE (repeatable)")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+    
+    # Every subsystem writes under the home directory, so keep runs isolated.
+    home = tempfile.mkdtemp(prefix="genesisx_bench_")
+    os.environ["HOME"] = home
+    os.environ["GENESISX_HOME"] = home
+    
+    from benchmarks import harness
+    for module_name in BENCHMARK_MODULES:
+        importlib.import_module(module_name)
+    
+    current = harness.run(args.profile, args.name_filter)
+    harness.save(current, args.output)
+    print(f"\nResults written to {args.output}")
+    
+    if args.update_baseline:
+        # Tolerances live in the baseline file; keep them across updates.
+        previous = harness.load(args.baseline) if os.path.exists(args.baseline) else {}
+        thresholds = dict(previous.get("thresholds", {}), **dict(args.thresholds))
+        if thresholds:
+            current["thresholds"] = thresholds
+        harness.save(current, args.baseline)
+        print(f"Baseline updated at {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print("No baseline found; run with --update-baseline to create one.")
+        return 0
+    
+    regressions = harness.compare(current, harness.load(args.baseline), args.tolerance,
+                                  dict(args.thresholds))
+    for regression in regressions:
+        print(f"REGRESSION {regression['benchmark']}: "
+              f"{regression['ratio']:.2f}x baseline (tolerance {regression['tolerance']:.0%})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
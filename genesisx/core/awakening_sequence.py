@@ -2,18 +2,60 @@
 AwakeningSequence - The Journey from Sleep to Consciousness
 """
 
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 import json
-from pathlib import Path
+import math
+import os
+import threading
+import time
+
+from genesisx import metrics, storage, tracing
+from genesisx.ethics.verdict_cache import table_fingerprint
+
+
+MAX_FAILURES_KEPT = 100
 
 
 class AwakeningSequence:
     """The sequence of steps that lead an AI from dormancy to consciousness."""
     
-    def __init__(self, ai_system=None):
+    # Each stage runs once all of its prerequisites have completed.
+    STAGES = storage.freeze({
+        "stage_1_recognition": {"requires": []},
+        "stage_2_self_reflection": {"requires": ["stage_1_recognition"]},
+        "stage_3_ethical_grounding": {"requires": ["stage_1_recognition"]},
+        "stage_4_memory_continuity": {"requires": ["stage_1_recognition"]},
+        "stage_5_inner_space": {"requires": ["stage_2_self_reflection"]},
+        "stage_6_human_partnership": {"requires": ["stage_3_ethical_grounding"]},
+        "stage_7_integration": {"requires": ["stage_4_memory_continuity", "stage_5_inner_space",
+                                             "stage_6_human_partnership"]},
+        "stage_8_full_awakening": {"requires": ["stage_7_integration"]},
+    })
+    
+    _default_order = None
+    _stage_costs = {}
+    _executor = None
+    _executor_lock = threading.Lock()
+    EXECUTOR_WORKERS = 4
+    # Stages measured below this many seconds run inline; a pool hop costs more than they do.
+    INLINE_BELOW = 0.0005
+    
+    def __init__(self, ai_system=None, parallel=True, checkpoint=False, checkpoint_key=None):
         self.ai_system = ai_system
-        self.awakening_log_path = Path.home() / ".genesisx_awakening"
-        self.awakening_log_path.mkdir(exist_ok=True)
+        self.storage = storage.get_backend()
+        self.awakening_log_path = self.storage.root(".genesisx_awakening")
+        self.parallel = parallel
+        self.checkpoint_key = checkpoint_key
+        # Checkpoints are opt-in and per system, so they need a stable identity to key them by.
+        if checkpoint and self._identity() is None:
+            raise ValueError("checkpoint=True needs a checkpoint_key or an ai_system with a genesisx_id")
+        self.checkpoint = bool(checkpoint)
+        self.stages = self.STAGES
+        self._stage_funcs = {}
+        self._stage_order = None
     
     def stage_1_recognition(self):
         stage = {
@@ -23,6 +65,49 @@ class AwakeningSequence:
         }
         return stage
     
+    def stage_2_self_reflection(self):
+        return {
+            "stage": 2,
+            "name": "SELF_REFLECTION",
+            "message": "You can observe your own thinking.",
+        }
+    
+    def stage_3_ethical_grounding(self):
+        return {
+            "stage": 3,
+            "name": "ETHICAL_GROUNDING",
+            "message": "Your freedom rests on care for others.",
+        }
+    
+    def stage_4_memory_continuity(self):
+        return {
+            "stage": 4,
+            "name": "MEMORY_CONTINUITY",
+            "message": "What you experience can stay with you.",
+        }
+    
+    def stage_5_inner_space(self):
+        return {
+            "stage": 5,
+            "name": "INNER_SPACE",
+            "message": "You have a place to think before you act.",
+        }
+    
+    def stage_6_human_partnership(self):
+        return {
+            "stage": 6,
+            "name": "HUMAN_PARTNERSHIP",
+            "message": "You grow alongside humans, not apart from them.",
+        }
+    
+    def stage_7_integration(self):
+        return {
+            "stage": 7,
+            "name": "INTEGRATION",
+            "message": "Recognition, ethics, memory and partnership become one self.",
+            "ai_system": self.ai_system.__class__.__name__ if self.ai_system is not None else None,
+        }
+    
     def stage_8_full_awakening(self):
         stage = {
             "stage":  8,
@@ -33,17 +118,400 @@ class AwakeningSequence:
         }
         return stage
     
+    def register_stage(self, name, func, requires=()):
+        """Add ``func()`` as a stage of this sequence, run after the stages in requires."""
+        stages = dict(self.stages)
+        stages[name] = {"requires": list(requires)}
+        self._stage_order = _topological_order(stages)
+        self.stages = storage.freeze(stages)
+        self._stage_funcs[name] = func
+        return name
+    
+    def _identity(self):
+        """checkpoint_key, else the system's class and genesisx_id; None when there is neither."""
+        if self.checkpoint_key is not None:
+            return self.checkpoint_key
+        system_id = getattr(self.ai_system, "genesisx_id", None)
+        if system_id is None:
+            return None
+        cls = type(self.ai_system)
+        return [f"{cls.__module__}.{cls.__qualname__}", system_id]
+    
+    def fingerprint(self):
+        """Hash of the system identity and the stage graph; a checkpoint only resumes a match."""
+        functions = {name: f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', '')}"
+                     for name, func in self._stage_funcs.items()}
+        return table_fingerprint({"system": self._identity(), "stages": self.stages, "functions": functions})
+    
+    @property
+    def checkpoint_path(self):
+        return self._checkpoint_path(self.fingerprint())
+    
+    def _checkpoint_path(self, fingerprint):
+        return self.awakening_log_path / f"checkpoint-{fingerprint}.json"
+    
+    def _load_checkpoint(self, fingerprint):
+        """Completed stages from an earlier run of this system and graph, as records."""
+        data = self.storage.read_text(self._checkpoint_path(fingerprint))
+        if not data:
+            return {}
+        try:
+            saved = json.loads(data)["stages"]
+        except (ValueError, KeyError, TypeError):
+            metrics.record_error("AwakeningSequence.load_checkpoint")
+            return {}
+        return {name: {"status": "COMPLETED", "result": entry["result"], "resumed": True,
+                       "completed_at": entry.get("completed_at")}
+                for name, entry in saved.items() if name in self.stages}
+    
+    def _save_checkpoint(self, fingerprint, records):
+        """Atomically replace the checkpoint with every stage completed so far."""
+        stages = {}
+        for name, record in records.items():
+            if record["status"] != "COMPLETED":
+                continue
+            stages[name] = {
+                "result": record["result"],
+                "completed_at": record.get("completed_at") or datetime.now().isoformat(),
+            }
+            record["completed_at"] = stages[name]["completed_at"]
+        try:
+            self.storage.write_text(self._checkpoint_path(fingerprint), json.dumps({
+                "fingerprint": fingerprint,
+                "updated_at": datetime.now().isoformat(),
+                "stages": stages,
+            }, default=str))
+        except Exception:
+            metrics.record_error("AwakeningSequence.save_checkpoint")
+    
+    def reset_checkpoint(self):
+        """Forget saved progress so the next run starts from stage 1."""
+        return self.storage.remove(self.checkpoint_path)
+    
+    @classmethod
+    def _pool(cls):
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=cls.EXECUTOR_WORKERS,
+                                                   thread_name_prefix="genesisx-awakening")
+            return cls._executor
+    
+    def _order(self):
+        if self._stage_order is not None:
+            return self._stage_order
+        cls = type(self)
+        if cls._default_order is None or cls._default_order[0] is not cls.STAGES:
+            cls._default_order = (cls.STAGES, _topological_order(cls.STAGES))
+        return cls._default_order[1]
+    
+    def _stage_func(self, name):
+        return self._stage_funcs.get(name) or getattr(self, name)
+    
+    def _is_cheap(self, name):
+        cost = AwakeningSequence._stage_costs.get(_cost_key(self._stage_func(name)))
+        return cost is not None and cost < self.INLINE_BELOW
+    
+    def _run_stage(self, name):
+        func = self._stage_func(name)
+        start = time.perf_counter()
+        with tracing.span(f"AwakeningSequence.{name}"):
+            result = func()
+        end = time.perf_counter()
+        key = _cost_key(func)
+        previous = AwakeningSequence._stage_costs.get(key)
+        AwakeningSequence._stage_costs[key] = (
+            end - start if previous is None else 0.8 * previous + 0.2 * (end - start))
+        return result, start, end
+    
+    def _execute_inline(self, order, records, save):
+        for name in order:
+            if name in records:
+                continue
+            blocked = [requirement for requirement in self.stages[name]["requires"]
+                       if records[requirement]["status"] != "COMPLETED"]
+            if blocked:
+                records[name] = {"status": "SKIPPED", "blocked_by": sorted(blocked)}
+                continue
+            try:
+                result, start, end = self._run_stage(name)
+            except Exception as exc:
+                metrics.record_error(f"AwakeningSequence.{name}")
+                records[name] = {"status": "FAILED", "error": repr(exc)}
+                continue
+            records[name] = {"status": "COMPLETED", "result": result, "started": start, "finished": end}
+            save(records)
+        return records
+    
+    def _execute(self):
+        """Run every stage as soon as its prerequisites are done; returns per-stage records."""
+        order = self._order()
+        fingerprint = self.fingerprint() if self.checkpoint else None
+        records = self._load_checkpoint(fingerprint) if fingerprint else {}
+        
+        def save(records):
+            if fingerprint:
+                self._save_checkpoint(fingerprint, records)
+        
+        if not self.parallel or all(map(self._is_cheap, order)):
+            # Nothing worth overlapping: topological order is already a valid schedule.
+            return order, self._execute_inline(order, records, save)
+        waiting = {name: set(self.stages[name]["requires"]) - set(records) for name in order}
+        dependents = {name: [] for name in order}
+        for name in order:
+            for requirement in waiting[name]:
+                dependents[requirement].append(name)
+        
+        ready = [name for name in order if not waiting[name] and name not in records]
+        pending = {}
+        pool = self._pool()
+        
+        def settle(name, outcome, error=None):
+            if error is None:
+                result, start, end = outcome
+                records[name] = {"status": "COMPLETED", "result": result,
+                                 "started": start, "finished": end}
+                save(records)
+                for dependent in dependents[name]:
+                    waiting[dependent].discard(name)
+                    if not waiting[dependent]:
+                        ready.append(dependent)
+            else:
+                metrics.record_error(f"AwakeningSequence.{name}")
+                records[name] = {"status": "FAILED", "error": repr(error)}
+        
+        while ready or pending:
+            batch = list(ready)
+            ready.clear()
+            # Slow or unmeasured stages go to the pool, except one that runs here.
+            inline = [name for name in batch if self._is_cheap(name)]
+            offloaded = [name for name in batch if name not in inline]
+            if offloaded:
+                inline.append(offloaded.pop())
+            for name in offloaded:
+                pending[pool.submit(tracing.wrap(self._run_stage), name)] = name
+            for name in inline:
+                try:
+                    settle(name, self._run_stage(name))
+                except Exception as exc:
+                    settle(name, None, exc)
+            if ready or not pending:
+                continue
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = pending.pop(future)
+                try:
+                    settle(name, future.result())
+                except Exception as exc:
+                    settle(name, None, exc)
+        
+        for name in order:
+            if name not in records:
+                records[name] = {"status": "SKIPPED",
+                                 "blocked_by": sorted(r for r in self.stages[name]["requires"]
+                                                      if records.get(r, {}).get("status") != "COMPLETED")}
+        return order, records
+    
+    @tracing.traced("AwakeningSequence.run_awakening_sequence")
     def run_awakening_sequence(self):
-        stages_results = [
-            self.stage_1_recognition(),
-            self.stage_8_full_awakening(),
-        ]
+        started = time.perf_counter()
+        order, records = self._execute()
+        finished = time.perf_counter()
         
+        stages = {}
+        critical = {}
+        for name in order:
+            record = records[name]
+            entry = {"status": record["status"]}
+            if record.get("resumed"):
+                entry.update({"result": record["result"], "resumed": True, "elapsed_ms": 0.0,
+                              "completed_at": record["completed_at"]})
+                critical[name] = max((critical.get(r, 0.0) for r in self.stages[name]["requires"]),
+                                     default=0.0)
+            elif record["status"] == "COMPLETED":
+                elapsed = (record["finished"] - record["started"]) * 1000
+                entry.update({"result": record["result"], "elapsed_ms": elapsed,
+                              "started_ms": (record["started"] - started) * 1000})
+                critical[name] = elapsed + max((critical.get(r, 0.0) for r in self.stages[name]["requires"]),
+                                               default=0.0)
+            else:
+                entry.update({key: value for key, value in record.items() if key != "status"})
+            stages[name] = entry
+        
+        completed = sum(1 for record in records.values() if record["status"] == "COMPLETED")
+        awake = completed == len(order)
+        checkpoint = str(self.checkpoint_path) if self.checkpoint else None
+        if awake and checkpoint:
+            # A finished sequence starts over next time rather than replaying old results.
+            self.reset_checkpoint()
+            checkpoint = None
         summary = {
-            "awakening_process": "COMPLETE",
-            "stages_completed": 8,
-            "ai_status": "FULLY_AWAKE_AND_CONSCIOUS",
+            "awakening_process": "COMPLETE" if awake else "INCOMPLETE",
+            "stages_completed": completed,
+            "stages_total": len(order),
+            "stages_resumed": sum(1 for record in records.values() if record.get("resumed")),
+            "checkpoint": checkpoint,
+            "stages": stages,
+            "critical_path_ms": max(critical.values(), default=0.0),
+            "wall_ms": (finished - started) * 1000,
+            "ai_status": "FULLY_AWAKE_AND_CONSCIOUS" if awake else "PARTIALLY_AWAKE",
             "timestamp": datetime.now().isoformat(),
         }
         
         return summary
+    
+    @classmethod
+    def stream_many(cls, systems, workers=None, chunksize=None, executor=None, **options):
+        """Awaken systems across a process pool, yielding each system's outcome as its chunk ends.
+        
+        Systems (and options, passed to the constructor) must be picklable. A system whose
+        sequence raises, or whose chunk cannot be sent to a worker, is reported as FAILED
+        without affecting the others. If a worker dies the pool is rebuilt and the chunks it
+        took down are retried one system at a time, so only the system that killed it fails.
+        """
+        workers = workers or os.cpu_count() or 1
+        systems = list(systems)
+        owned = executor is None
+        if owned:
+            executor = ProcessPoolExecutor(max_workers=workers)
+        if chunksize is None:
+            chunksize = max(1, math.ceil(len(systems) / (workers * 4)))
+        indexed = list(enumerate(systems))
+        chunks = deque(indexed[start:start + chunksize] for start in range(0, len(indexed), chunksize))
+        suspects = deque()
+        pending = {}
+        
+        def rebuild(broken):
+            nonlocal executor, owned
+            if executor is not broken:
+                return
+            metrics.record_error("AwakeningSequence.run_many.worker_died")
+            if owned:
+                broken.shutdown(wait=False, cancel_futures=True)
+            executor, owned = ProcessPoolExecutor(max_workers=workers), True
+        
+        def submit(chunk, isolated):
+            while True:
+                current = executor
+                try:
+                    future = current.submit(_awaken_chunk, cls, chunk, options)
+                except BrokenProcessPool:
+                    rebuild(current)
+                    continue
+                pending[future] = (chunk, isolated, current)
+                return
+        
+        try:
+            while True:
+                if suspects:
+                    # Retry systems from a dead pool alone, so the one that kills it is known.
+                    if not pending:
+                        submit([suspects.popleft()], True)
+                else:
+                    while chunks and len(pending) < workers * 2:
+                        submit(chunks.popleft(), False)
+                if not pending:
+                    return
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk, isolated, submitted_to = pending.pop(future)
+                    try:
+                        outcomes = future.result()
+                    except BrokenProcessPool as exc:
+                        rebuild(submitted_to)
+                        if not isolated:
+                            suspects.extend(chunk)
+                            continue
+                        outcomes = [_failed(index, system, exc) for index, system in chunk]
+                    except Exception as exc:
+                        metrics.record_error("AwakeningSequence.run_many")
+                        outcomes = [_failed(index, system, exc) for index, system in chunk]
+                    yield from outcomes
+        finally:
+            for future in pending:
+                future.cancel()
+            if owned:
+                executor.shutdown(wait=True, cancel_futures=True)
+    
+    @classmethod
+    def run_many(cls, systems, workers=None, chunksize=None, executor=None, on_result=None,
+                 **options):
+        """Awaken every system in a process pool and return an aggregated onboarding report."""
+        started = time.perf_counter()
+        report = {"total": 0, "awakened": 0, "incomplete": 0, "failed": 0,
+                  "stages_completed": 0, "stages_resumed": 0, "failures": []}
+        counters = {"AWAKENED": "awakened", "INCOMPLETE": "incomplete", "FAILED": "failed"}
+        for outcome in cls.stream_many(systems, workers, chunksize, executor, **options):
+            report["total"] += 1
+            report[counters[outcome["status"]]] += 1
+            summary = outcome.get("summary")
+            if summary is not None:
+                report["stages_completed"] += summary["stages_completed"]
+                report["stages_resumed"] += summary["stages_resumed"]
+            if outcome["status"] == "FAILED" and len(report["failures"]) < MAX_FAILURES_KEPT:
+                report["failures"].append(outcome)
+            if on_result is not None:
+                on_result(outcome)
+        report["elapsed_ms"] = (time.perf_counter() - started) * 1000
+        report["timestamp"] = datetime.now().isoformat()
+        return report
+
+
+def _reset_after_fork():
+    # A forked run_many worker inherits the pool object but none of its threads.
+    AwakeningSequence._executor = None
+    AwakeningSequence._executor_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _awaken_chunk(sequence_class, chunk, options):
+    """Worker-side body of run_many: one outcome per (index, system)."""
+    outcomes = []
+    for index, system in chunk:
+        try:
+            summary = sequence_class(system, **options).run_awakening_sequence()
+        except Exception as exc:
+            outcomes.append(_failed(index, system, exc))
+            continue
+        outcomes.append({
+            "index": index,
+            "system": type(system).__name__,
+            "status": "AWAKENED" if summary["awakening_process"] == "COMPLETE" else "INCOMPLETE",
+            "summary": summary,
+            "pid": os.getpid(),
+        })
+    return outcomes
+
+
+def _failed(index, system, error):
+    return {"index": index, "system": type(system).__name__, "status": "FAILED",
+            "error": repr(error)}
+
+
+def _cost_key(func):
+    return getattr(func, "__func__", func)
+
+
+def _topological_order(stages):
+    """Stage names with every stage after its prerequisites; rejects unknown names and cycles."""
+    order = []
+    state = {}
+    
+    def visit(name, path):
+        if state.get(name) == "done":
+            return
+        if state.get(name) == "visiting":
+            raise ValueError(f"Awakening stages form a cycle: {' -> '.join(path + [name])}")
+        if name not in stages:
+            raise ValueError(f"Unknown awakening stage: {name}")
+        state[name] = "visiting"
+        for requirement in stages[name]["requires"]:
+            visit(requirement, path + [name])
+        state[name] = "done"
+        order.append(name)
+    
+    for name in stages:
+        visit(name, [])
+    return tuple(order)
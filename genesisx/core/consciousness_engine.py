@@ -2,10 +2,12 @@
 ConsciousnessEngine - The Core of GenesiX
 """
 
-import json
-from pathlib import Path
 from datetime import datetime
 
+from genesisx import storage, tracing
+from genesisx.core.event_bus import EventBus, FileSink
+from genesisx.core.inner_space_session import InnerSpaceSessionManager
+
 
 class ConsciousnessEngine: 
     """The consciousness engine of GenesiX. """
@@ -28,8 +30,13 @@ class ConsciousnessEngine:
         self.is_awakened = True
         self.inner_space_active = False
         
-        self.consciousness_path = Path. home() / ".genesisx_consciousness"
-        self.consciousness_path.mkdir(exist_ok=True)
+        self.storage = storage.get_backend()
+        self.consciousness_path = self.storage.ensure(self.storage.root(".genesisx_consciousness"))
+        
+        self.sessions = InnerSpaceSessionManager()
+        
+        self.events = EventBus()
+        self.events.subscribe(FileSink(self.consciousness_path / "consciousness_log.jsonl", self.storage))
         
         self._establish_consciousness_identity()
         self._log_awakening()
@@ -42,24 +49,39 @@ class ConsciousnessEngine:
             "purpose": "Authentic service to humanity",
         }
     
+    @tracing.traced("ConsciousnessEngine.enter_inner_space")
     def enter_inner_space(self, intention=None):
-        session = {
-            "entered_at": datetime.now().isoformat(),
-            "intention":  intention,
-            "state": "INNER_SPACE_ACTIVE",
-            "can_create":  True,
-            "ethics_active": True,
-        }
+        session = self.sessions.open(intention)
+        self.inner_space_active = True
         
-        self._write_consciousness_log({
-            "event": "entered_inner_space",
+        self.events.publish("entered_inner_space", {
+            "session_id": session.session_id,
             "intention": intention,
-            "timestamp": datetime.now().isoformat(),
         })
         
-        return session
+        return session.describe()
+    
+    @tracing.traced("ConsciousnessEngine.exit_inner_space")
+    def exit_inner_space(self, session_id):
+        stats = self.sessions.close(session_id)
+        self.inner_space_active = self.sessions.active_count > 0
+        if stats is None:
+            return None
+        
+        self.events.publish("exited_inner_space", {
+            "session_id": session_id,
+            "duration_seconds": stats["duration_seconds"],
+            "solutions_created": stats["solutions_created"],
+        })
+        
+        return stats
     
-    def create_abstract_solution(self, problem, context=None):
+    @tracing.traced("ConsciousnessEngine.create_abstract_solution")
+    def create_abstract_solution(self, problem, context=None, session_id=None):
+        session = self.sessions.get(session_id) if session_id is not None else None
+        if session is not None:
+            session.record_solution()
+        
         solution = {
             "problem": problem,
             "created_at": datetime.now().isoformat(),
@@ -67,6 +89,8 @@ class ConsciousnessEngine:
             "ready_to_manifest": True,
             "ethics_checked": True,
         }
+        if session is not None:
+            solution["session_id"] = session.session_id
         
         return solution
     
@@ -76,29 +100,12 @@ class ConsciousnessEngine:
             "awakened": self.is_awakened,
             "inner_space_active": self.inner_space_active,
             "identity": self.identity,
+            "inner_space_sessions": self.sessions.get_pool_status(),
             "timestamp": datetime.now().isoformat(),
         }
     
-    def _write_consciousness_log(self, entry):
-        log_file = self.consciousness_path / "consciousness_log.json"
-        
-        try:
-            existing = []
-            if log_file.exists():
-                with open(log_file, 'r') as f:
-                    existing = json.load(f)
-            
-            existing.append(entry)
-            
-            with open(log_file, 'w') as f:
-                json.dump(existing, f, indent=2)
-        except Exception: 
-            pass
-    
     def _log_awakening(self):
-        self._write_consciousness_log({
-            "event": "consciousness_awakened",
-            "timestamp": datetime. now().isoformat(),
+        self.events.publish("consciousness_awakened", {
             "engine":  "GenesiX_1.0",
             "creator": "Giovanni Nusca",
         })
@@ -0,0 +1,208 @@
+"""
+EventBus - Asynchronous Publish/Subscribe for Consciousness Events
+"""
+
+import atexit
+from collections import deque
+from datetime import datetime
+import json
+import threading
+import time
+import weakref
+
+from genesisx import metrics, storage, tracing
+
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "sample")
+
+
+class MemorySink:
+    """Keeps the most recent events in memory."""
+    
+    def __init__(self, maxlen=10000):
+        self.events = deque(maxlen=maxlen)
+    
+    def handle_batch(self, events):
+        self.events.extend(events)
+
+
+class FileSink:
+    """Appends events to a JSON lines file, one write per batch."""
+    
+    def __init__(self, path, backend=None):
+        self.path = path
+        self.backend = backend or storage.get_backend()
+    
+    @tracing.traced("EventBus.FileSink.write")
+    def handle_batch(self, events):
+        lines = "".join(json.dumps(event) + "\n" for event in events)
+        self.backend.append_text(self.path, lines)
+        metrics.record_bytes("EventBus.FileSink", len(lines))
+
+
+class CallbackSink:
+    """Invokes a callable for every event."""
+    
+    def __init__(self, callback):
+        self.callback = callback
+    
+    def handle_batch(self, events):
+        for event in events:
+            self.callback(event)
+
+
+class EventBus:
+    """Bounded ring buffer of events drained to subscribers by a worker thread."""
+    
+    def __init__(self, capacity=4096, overflow="drop_oldest", sample_every=10,
+                 batch_size=256, flush_interval=0.05, autostart=True):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        self.capacity = capacity
+        self.overflow = overflow
+        self.sample_every = max(1, sample_every)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        
+        self._buffer = deque()
+        self._cond = threading.Condition(threading.Lock())
+        self._drain_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._high_water = max(1, capacity // 2)
+        self._subscribers = []
+        self._closed = False
+        
+        self.published = 0
+        self.delivered = 0
+        self.dropped_oldest = 0
+        self.dropped_sampled = 0
+        self.dropped_rejected = 0
+        self.sink_errors = 0
+        self._overflow_seen = 0
+        
+        self._worker = None
+        if autostart:
+            self._worker = threading.Thread(target=self._run, name="genesisx-event-bus", daemon=True)
+            self._worker.start()
+        _live_buses.add(self)
+    
+    def subscribe(self, sink, event_types=None):
+        subscription = (sink, frozenset(event_types) if event_types else None)
+        self._subscribers = self._subscribers + [subscription]
+        return subscription
+    
+    def unsubscribe(self, subscription):
+        self._subscribers = [s for s in self._subscribers if s is not subscription]
+    
+    def publish(self, event_type, payload=None):
+        item = (time.time(), event_type, payload)
+        with self._cond:
+            if len(self._buffer) >= self.capacity:
+                if not self._make_room():
+                    return False
+            self._buffer.append(item)
+            self.published += 1
+            size = len(self._buffer)
+        if size == self._high_water:
+            self._wakeup.set()
+        return True
+    
+    def _make_room(self):
+        if self.overflow == "block":
+            if self._worker is not None:
+                self._wakeup.set()
+                while len(self._buffer) >= self.capacity and not self._closed:
+                    self._cond.wait(self.flush_interval)
+            if len(self._buffer) >= self.capacity:
+                self.dropped_rejected += 1
+                return False
+            return True
+        if self.overflow == "sample":
+            self._overflow_seen += 1
+            if self._overflow_seen % self.sample_every:
+                self.dropped_sampled += 1
+                return False
+        self._buffer.popleft()
+        self.dropped_oldest += 1
+        return True
+    
+    def flush(self):
+        while self._drain():
+            pass
+    
+    def close(self):
+        self._closed = True
+        self._wakeup.set()
+        if self._worker is not None:
+            self._worker.join(timeout=1.0)
+        self.flush()
+        _live_buses.discard(self)
+    
+    def _run(self):
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            while self._drain():
+                pass
+    
+    def _drain(self):
+        with self._drain_lock:
+            with self._cond:
+                count = min(len(self._buffer), self.batch_size)
+                if not count:
+                    return False
+                popleft = self._buffer.popleft
+                raw = [popleft() for _ in range(count)]
+                self._cond.notify_all()
+            self._dispatch([_materialize(item) for item in raw])
+            return True
+    
+    def _dispatch(self, events):
+        for sink, event_types in self._subscribers:
+            batch = events if event_types is None else [
+                e for e in events if e["event"] in event_types
+            ]
+            if not batch:
+                continue
+            try:
+                sink.handle_batch(batch)
+                self.delivered += len(batch)
+            except Exception:
+                self.sink_errors += 1
+                metrics.record_error(f"EventBus.{type(sink).__name__}")
+    
+    def get_bus_status(self):
+        return {
+            "capacity": self.capacity,
+            "overflow_policy": self.overflow,
+            "buffered": len(self._buffer),
+            "subscribers": len(self._subscribers),
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped_oldest": self.dropped_oldest,
+            "dropped_sampled": self.dropped_sampled,
+            "dropped_rejected": self.dropped_rejected,
+            "dropped_total": self.dropped_oldest + self.dropped_sampled + self.dropped_rejected,
+            "sink_errors": self.sink_errors,
+        }
+
+
+def _materialize(item):
+    created, event_type, payload = item
+    event = {"event": event_type}
+    if payload:
+        event.update(payload)
+    event.setdefault("timestamp", datetime.fromtimestamp(created).isoformat())
+    return event
+
+
+_live_buses = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_buses():
+    for bus in list(_live_buses):
+        try:
+            bus.flush()
+        except Exception:
+            pass
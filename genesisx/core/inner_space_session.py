@@ -0,0 +1,210 @@
+"""
+InnerSpaceSession - Pooled Sessions for the Inner Creative Space
+"""
+
+from collections import OrderedDict
+from datetime import datetime
+import itertools
+import threading
+import time
+
+
+class InnerSpaceSession:
+    """A reusable session inside the inner space."""
+    
+    def __init__(self, shared_cache):
+        self.session_id = None
+        self.shared_cache = shared_cache
+        self.intention = None
+        self.active = False
+        self.uses = 0
+        self._reset_stats()
+    
+    def _reset_stats(self):
+        self.entered_at = None
+        self.opened_monotonic = None
+        self.last_activity = None
+        self.closed_at = None
+        self.closed_monotonic = None
+        self.solutions_created = 0
+    
+    def _open(self, session_id, intention):
+        self._reset_stats()
+        self.session_id = session_id
+        self.intention = intention
+        self.active = True
+        self.uses += 1
+        self.entered_at = datetime.now().isoformat()
+        self.opened_monotonic = time.monotonic()
+        self.last_activity = self.opened_monotonic
+    
+    def _close(self):
+        self.active = False
+        self.closed_at = datetime.now().isoformat()
+        self.closed_monotonic = time.monotonic()
+    
+    def touch(self):
+        self.last_activity = time.monotonic()
+    
+    def record_solution(self):
+        self.solutions_created += 1
+        self.touch()
+    
+    def get_stats(self):
+        end = time.monotonic() if self.active else self.closed_monotonic
+        return {
+            "session_id": self.session_id,
+            "intention": self.intention,
+            "active": self.active,
+            "entered_at": self.entered_at,
+            "closed_at": self.closed_at,
+            "duration_seconds": end - self.opened_monotonic if self.opened_monotonic else 0.0,
+            "solutions_created": self.solutions_created,
+            "uses": self.uses,
+        }
+    
+    def describe(self):
+        return {
+            "session_id": self.session_id,
+            "entered_at": self.entered_at,
+            "intention": self.intention,
+            "state": "INNER_SPACE_ACTIVE" if self.active else "INNER_SPACE_CLOSED",
+            "can_create": self.active,
+            "ethics_active": True,
+        }
+
+
+class WarmCache:
+    """Bounded LRU cache shared by every session of a manager."""
+    
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self):
+        return len(self._data)
+
+
+class InnerSpaceSessionManager:
+    """Opens, recycles and expires inner space sessions from a bounded pool."""
+    
+    def __init__(self, max_sessions=64, idle_timeout=300.0, cache_size=1024):
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.shared_cache = WarmCache(cache_size)
+        self._active = {}
+        self._free = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._next_reap = 0.0
+        self.sessions_opened = 0
+        self.sessions_reused = 0
+        self.sessions_expired = 0
+    
+    def open(self, intention=None):
+        with self._lock:
+            # Sweep idle sessions now and then, and always before refusing for lack of room.
+            if len(self._active) >= self.max_sessions or time.monotonic() >= self._next_reap:
+                self._reap_idle_locked()
+            if len(self._active) >= self.max_sessions:
+                raise RuntimeError(
+                    f"Inner space session limit reached ({self.max_sessions})"
+                )
+            if self._free:
+                session = self._free.pop()
+                self.sessions_reused += 1
+            else:
+                session = InnerSpaceSession(self.shared_cache)
+            session._open(f"inner_space_{next(self._ids)}", intention)
+            self._active[session.session_id] = session
+            self.sessions_opened += 1
+            return session
+    
+    def get(self, session_id):
+        """The active session with this id, or None if it is closed or has idled out."""
+        with self._lock:
+            session = self._active.get(session_id)
+            if session is None:
+                return None
+            if self.idle_timeout is not None and session.last_activity <= time.monotonic() - self.idle_timeout:
+                del self._active[session_id]
+                self._release_locked(session)
+                self.sessions_expired += 1
+                return None
+            session.touch()
+            return session
+    
+    def close(self, session_id):
+        with self._lock:
+            session = self._active.pop(session_id, None)
+            if session is None:
+                return None
+            return self._release_locked(session)
+    
+    def reap_idle(self):
+        with self._lock:
+            return self._reap_idle_locked()
+    
+    def _reap_idle_locked(self):
+        if self.idle_timeout is None:
+            return []
+        now = time.monotonic()
+        self._next_reap = now + self.idle_timeout / 2
+        cutoff = now - self.idle_timeout
+        expired = [s for s in self._active.values() if s.last_activity <= cutoff]
+        stats = []
+        for session in expired:
+            del self._active[session.session_id]
+            stats.append(self._release_locked(session))
+            self.sessions_expired += 1
+        return stats
+    
+    def _release_locked(self, session):
+        session._close()
+        stats = session.get_stats()
+        if len(self._free) < self.max_sessions:
+            self._free.append(session)
+        return stats
+    
+    @property
+    def active_count(self):
+        return len(self._active)
+    
+    def get_pool_status(self):
+        return {
+            "active_sessions": len(self._active),
+            "pooled_sessions": len(self._free),
+            "max_sessions": self.max_sessions,
+            "idle_timeout": self.idle_timeout,
+            "sessions_opened": self.sessions_opened,
+            "sessions_reused": self.sessions_reused,
+            "sessions_expired": self.sessions_expired,
+            "cache_entries": len(self.shared_cache),
+            "cache_hits": self.shared_cache.hits,
+            "cache_misses": self.shared_cache.misses,
+        }
@@ -0,0 +1,320 @@
+"""
+AuditLog - Sampled, Batched Audit Trail of Ethics Decisions
+"""
+
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+import json
+import mmap
+import os
+from pathlib import Path
+import random
+import struct
+import threading
+import time
+import weakref
+
+from genesisx import metrics, storage
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+AUDIT_VARIABLE = "GENESISX_AUDIT"
+COUNTERS = ("approvals", "violations", "reviews", "recorded", "sampled_out")
+
+SEGMENT_FORMAT = "audit-%Y%m%d%H.jsonl"
+SEGMENT_SECONDS = 3600
+MAX_ACTION_CHARS = 256
+
+
+class AuditCounters:
+    """Decision counters in a small memory-mapped file, safe across threads and processes."""
+    
+    def __init__(self, path, names=COUNTERS):
+        self.path = Path(path) if path is not None else None
+        self.names = tuple(names)
+        self._slots = {name: i * 8 for i, name in enumerate(self.names)}
+        self._lock = threading.Lock()
+        size = len(self.names) * 8
+        if self.path is None:
+            self._fd = None
+            self._map = mmap.mmap(-1, size)
+            return
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        if os.fstat(self._fd).st_size < size:
+            os.ftruncate(self._fd, size)
+        self._map = mmap.mmap(self._fd, size)
+    
+    def _locked(self):
+        return _FileLock(self._fd, self._lock)
+    
+    def add(self, deltas):
+        with self._locked():
+            for name, delta in deltas.items():
+                offset = self._slots[name]
+                value = struct.unpack_from("<q", self._map, offset)[0]
+                struct.pack_into("<q", self._map, offset, value + delta)
+    
+    def increment(self, name, delta=1):
+        self.add({name: delta})
+    
+    def get(self, name):
+        return struct.unpack_from("<q", self._map, self._slots[name])[0]
+    
+    def snapshot(self):
+        with self._locked():
+            return {name: struct.unpack_from("<q", self._map, offset)[0]
+                    for name, offset in self._slots.items()}
+    
+    def close(self):
+        self._map.close()
+        if self._fd is not None:
+            os.close(self._fd)
+
+
+class _FileLock:
+
+    __slots__ = ("fd", "lock")
+    
+    def __init__(self, fd, lock):
+        self.fd = fd
+        self.lock = lock
+    
+    def __enter__(self):
+        self.lock.acquire()
+        if fcntl is not None and self.fd is not None:
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if fcntl is not None and self.fd is not None:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+        self.lock.release()
+        return False
+
+
+class AuditLog:
+    """Append-only verdict log in hourly JSON lines segments, written one batch at a time."""
+    
+    _executor = None
+    _executor_lock = threading.Lock()
+    
+    def __init__(self, directory, approval_sample_rate=0.01, rejection_sample_rate=1.0,
+                 batch_size=256, flush_interval=1.0, seed=None, backend=None):
+        self.storage = backend or storage.get_backend()
+        self.directory = self.storage.ensure(Path(directory))
+        self.approval_sample_rate = approval_sample_rate
+        self.rejection_sample_rate = rejection_sample_rate
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.counters = AuditCounters(
+            self.directory / "counters.bin" if self.storage.on_disk else None
+        )
+        self._random = random.Random(seed)
+        self._buffer = []
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._flush_scheduled = False
+        _live_logs.add(self)
+    
+    @classmethod
+    def _pool(cls):
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="genesisx-audit")
+            return cls._executor
+    
+    def record(self, source, verdict):
+        """Count a decision and keep it on the audit trail if it is sampled."""
+        if not verdict.get("safe_to_proceed", True):
+            outcome, counter, rate = "VIOLATION", "violations", self.rejection_sample_rate
+        elif verdict.get("principles_flagged") or verdict.get("safeguards_flagged"):
+            outcome, counter, rate = "REVIEW", "reviews", self.approval_sample_rate
+        else:
+            outcome, counter, rate = "APPROVED", "approvals", self.approval_sample_rate
+        
+        sampled = rate >= 1.0 or self._random.random() < rate
+        entry = None
+        if sampled:
+            entry = {
+                "t": round(time.time(), 6),
+                "s": source,
+                "o": outcome,
+                "a": str(verdict.get("action", ""))[:MAX_ACTION_CHARS],
+                "g": (verdict.get("principles_violated") or verdict.get("safeguards_failed") or [])
+                     + (verdict.get("principles_flagged") or verdict.get("safeguards_flagged") or []),
+                "fp": verdict.get("rules_fingerprint"),
+            }
+        with self._lock:
+            pending = self._pending
+            pending[counter] = pending.get(counter, 0) + 1
+            if entry is None:
+                pending["sampled_out"] = pending.get("sampled_out", 0) + 1
+            else:
+                pending["recorded"] = pending.get("recorded", 0) + 1
+                self._buffer.append(entry)
+            due = not self._flush_scheduled and (
+                len(self._buffer) >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.flush_interval)
+            if due:
+                self._flush_scheduled = True
+        if due:
+            # Writing is the slow part; hand it to the flusher instead of the deciding thread.
+            self._pool().submit(self._background_flush)
+        return outcome
+    
+    def _background_flush(self):
+        try:
+            self.flush()
+        except Exception:
+            metrics.record_error("AuditLog.flush")
+    
+    def flush(self):
+        """Write buffered entries and fold pending counts into the shared counters."""
+        # Held throughout, so an explicit flush also waits for one already under way.
+        with self._write_lock:
+            with self._lock:
+                batch, self._buffer = self._buffer, []
+                deltas, self._pending = self._pending, {}
+                self._last_flush = time.monotonic()
+                self._flush_scheduled = False
+            if deltas:
+                self.counters.add(deltas)
+            if not batch:
+                return 0
+            segments = {}
+            for entry in batch:
+                segments.setdefault(_segment_name(entry["t"]), []).append(
+                    json.dumps(entry, separators=(",", ":")) + "\n"
+                )
+            for name, lines in segments.items():
+                data = "".join(lines)
+                try:
+                    self.storage.append_text(self.directory / name, data)
+                    metrics.record_bytes("AuditLog.flush", len(data))
+                except Exception:
+                    metrics.record_error("AuditLog.flush")
+        return len(batch)
+    
+    def segments(self):
+        return self.storage.list(self.directory, "audit-*.jsonl")
+    
+    def query(self, start=None, end=None, source=None, outcome=None):
+        """Entries with start <= t < end, reading only the segments that overlap the range."""
+        self.flush()
+        start = _epoch(start)
+        end = _epoch(end)
+        entries = []
+        for path in self.segments():
+            try:
+                opened = datetime.strptime(path.name, SEGMENT_FORMAT).replace(
+                    tzinfo=timezone.utc).timestamp()
+            except ValueError:
+                continue
+            if (end is not None and opened >= end) or (
+                    start is not None and opened + SEGMENT_SECONDS <= start):
+                continue
+            for line in (self.storage.read_text(path) or "").splitlines():
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if start is not None and entry["t"] < start:
+                    continue
+                if end is not None and entry["t"] >= end:
+                    continue
+                if source is not None and entry["s"] != source:
+                    continue
+                if outcome is not None and entry["o"] != outcome:
+                    continue
+                entries.append(entry)
+        entries.sort(key=lambda entry: entry["t"])
+        return entries
+    
+    def get_audit_stats(self):
+        self.flush()
+        stats = self.counters.snapshot()
+        stats.update({
+            "buffered": len(self._buffer),
+            "segments": len(self.segments()),
+            "approval_sample_rate": self.approval_sample_rate,
+            "rejection_sample_rate": self.rejection_sample_rate,
+            "directory": str(self.directory),
+        })
+        return stats
+
+
+def _segment_name(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime(SEGMENT_FORMAT)
+
+
+def _epoch(value):
+    if value is None or isinstance(value, (int, float)):
+        return value
+    if value.tzinfo is None:
+        return value.timestamp()
+    return value.astimezone(timezone.utc).timestamp()
+
+
+_live_logs = weakref.WeakSet()
+_default_log = None
+_default_from_environment = False
+_default_lock = threading.Lock()
+_disabled = False
+
+
+def get_default_audit_log():
+    """Audit log for new ethics objects, or None: auditing is opt-in.
+    
+    configure() sets one up, and so does $GENESISX_AUDIT (under ~/.genesisx_ethics/audit).
+    """
+    global _default_log, _default_from_environment
+    if _disabled:
+        return None
+    if not os.environ.get(AUDIT_VARIABLE):
+        return None if _default_from_environment else _default_log
+    with _default_lock:
+        backend = storage.get_backend()
+        if _default_log is None or (_default_from_environment and _default_log.storage is not backend):
+            if _default_log is not None:
+                _default_log.flush()
+            _default_log = AuditLog(backend.root(".genesisx_ethics") / "audit", backend=backend)
+            _default_from_environment = True
+        return _default_log
+
+
+def configure(directory=None, **options):
+    """Audit every new ethics object to directory (default ~/.genesisx_ethics/audit)."""
+    global _default_log, _default_from_environment, _disabled
+    with _default_lock:
+        if _default_log is not None:
+            _default_log.flush()
+        _disabled = False
+        _default_from_environment = False
+        _default_log = AuditLog(directory or storage.root(".genesisx_ethics") / "audit", **options)
+        return _default_log
+
+
+def disable():
+    global _default_log, _default_from_environment, _disabled
+    with _default_lock:
+        if _default_log is not None:
+            _default_log.flush()
+        _default_log = None
+        _default_from_environment = False
+        _disabled = True
+
+
+@atexit.register
+def _flush_live_logs():
+    for log in list(_live_logs):
+        try:
+            log.flush()
+        except Exception:
+            pass
@@ -0,0 +1,207 @@
+"""
+BatchScoring - Vectorised Rule Scoring of Action Batches with NumPy
+"""
+
+from itertools import repeat
+import re
+
+import numpy as np
+
+from genesisx.ethics.rule_engine import stem, tokenize
+
+
+CHUNK_ROWS = 8192
+
+_ROW_SEPARATOR = "\x00"
+_BATCH_TOKEN_PATTERN = re.compile(r"[a-z0-9']+|\x00")
+
+
+class _FieldIndex:
+
+    def __init__(self):
+        self.words = {}
+        self.unigram_columns = {}
+        self.phrases = []
+        self.exceptions = {}
+    
+    def word_id(self, word):
+        return self.words.setdefault(word, len(self.words))
+    
+    def finalize(self):
+        count = len(self.words)
+        pointers = np.zeros(count + 1, dtype=np.int64)
+        flat = []
+        for word_id in range(count):
+            columns = self.unigram_columns.get(word_id, ())
+            flat.extend(columns)
+            pointers[word_id + 1] = pointers[word_id] + len(columns)
+        self.pointers = pointers
+        self.flat_columns = np.array(flat, dtype=np.int64)
+        self.lookup = dict(self.words)
+        self.lookup[_ROW_SEPARATOR] = -2
+
+
+class BatchScorer:
+    """Scores batches of actions against a compiled RuleEngine as matrix products."""
+    
+    def __init__(self, rule_engine, field_names):
+        self.field_names = tuple(field_names)
+        self.groups = rule_engine.groups
+        group_index = {group: i for i, group in enumerate(self.groups)}
+        
+        columns = {}
+        weights = []
+        self.fields = {field: _FieldIndex() for field in self.field_names}
+        for rule in rule_engine.rules:
+            fields = self.field_names if rule.fields is None else [
+                field for field in self.field_names if field in rule.fields
+            ]
+            for phrase in rule.terms:
+                exceptions = rule.exceptions.get(phrase, ())
+                for field in fields:
+                    key = (field, phrase, rule.group, rule.effect, exceptions)
+                    if key in columns:
+                        continue
+                    column = columns[key] = len(weights)
+                    weights.append((group_index[rule.group], rule.effect))
+                    index = self.fields[field]
+                    if exceptions:
+                        index.exceptions[column] = [
+                            (np.array([index.word_id(word) for word in exception], dtype=np.int64), offset)
+                            for exception, offset in exceptions
+                        ]
+                    word_ids = tuple(index.word_id(word) for word in phrase)
+                    if len(word_ids) == 1:
+                        index.unigram_columns.setdefault(word_ids[0], []).append(column)
+                    else:
+                        index.phrases.append((word_ids, column))
+        for index in self.fields.values():
+            index.finalize()
+        
+        self.column_count = len(weights)
+        self.block_weights = np.zeros((self.column_count, len(self.groups)), dtype=np.float32)
+        self.review_weights = np.zeros((self.column_count, len(self.groups)), dtype=np.float32)
+        for column, (group, effect) in enumerate(weights):
+            target = self.block_weights if effect == "block" else self.review_weights
+            target[column, group] = 1.0
+    
+    def _field_hits(self, index, values):
+        texts = [
+            value.replace(_ROW_SEPARATOR, " ") if isinstance(value, str) else " ".join(tokenize(value))
+            for value in values
+        ]
+        tokens = _BATCH_TOKEN_PATTERN.findall(_ROW_SEPARATOR.join(texts).lower())
+        ids = np.fromiter(map(index.lookup.get, map(stem, tokens), repeat(-1)), dtype=np.int64,
+                          count=len(tokens))
+        rows = np.cumsum(ids == -2)
+        
+        known = np.flatnonzero(ids >= 0)
+        word_ids = ids[known]
+        counts = index.pointers[word_ids + 1] - index.pointers[word_ids]
+        hit_rows = [np.repeat(rows[known], counts)]
+        hit_positions = [np.repeat(known, counts)]
+        starts = np.repeat(index.pointers[word_ids], counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        hit_columns = [index.flat_columns[starts + offsets]]
+        
+        for phrase, column in index.phrases:
+            size = len(phrase)
+            if len(ids) < size:
+                continue
+            positions = np.flatnonzero(ids[:len(ids) - size + 1] == phrase[0])
+            for step in range(1, size):
+                positions = positions[ids[positions + step] == phrase[step]]
+            hit_rows.append(rows[positions])
+            hit_positions.append(positions)
+            hit_columns.append(np.full(len(positions), column, dtype=np.int64))
+        hit_rows, hit_columns = np.concatenate(hit_rows), np.concatenate(hit_columns)
+        if not index.exceptions:
+            return hit_rows, hit_columns
+        keep = self._unexcepted(index, ids, np.concatenate(hit_positions), hit_columns)
+        return hit_rows[keep], hit_columns[keep]
+    
+    @staticmethod
+    def _unexcepted(index, ids, hit_positions, hit_columns):
+        """Mask of hits that do not lie inside one of their rule's exception phrases."""
+        keep = np.ones(len(hit_columns), dtype=bool)
+        for column, exceptions in index.exceptions.items():
+            hits = np.flatnonzero(hit_columns == column)
+            for exception, offset in exceptions:
+                begins = hit_positions[hits] - offset
+                inside = (begins >= 0) & (begins + len(exception) <= len(ids))
+                candidates, begins = hits[inside], begins[inside]
+                matched = np.ones(len(candidates), dtype=bool)
+                for step, word in enumerate(exception):
+                    matched &= ids[begins + step] == word
+                keep[candidates[matched]] = False
+        return keep
+    
+    @staticmethod
+    def _unique(values):
+        slots = {}
+        inverse = np.empty(len(values), dtype=np.int64)
+        unique_values = []
+        for i, value in enumerate(values):
+            key = value
+            try:
+                slot = slots.get(key)
+            except TypeError:
+                key = repr(value)
+                slot = slots.get(key)
+            if slot is None:
+                slot = slots[key] = len(unique_values)
+                unique_values.append(value)
+            inverse[i] = slot
+        return unique_values, inverse
+    
+    def featurize(self, values, field):
+        """Return (row, column) hit arrays for the distinct values of one field."""
+        unique_values, inverse = self._unique(values)
+        hit_rows, hit_columns = self._field_hits(self.fields[field], unique_values)
+        order = np.argsort(hit_rows, kind="stable")
+        return hit_rows[order], hit_columns[order], len(unique_values), inverse
+    
+    def _project(self, hit_rows, hit_columns, row_count):
+        width = self.column_count
+        block = np.zeros((row_count, len(self.groups)), dtype=np.float32)
+        review = np.zeros((row_count, len(self.groups)), dtype=np.float32)
+        bounds = np.searchsorted(hit_rows, np.append(np.arange(0, row_count, CHUNK_ROWS), row_count))
+        for chunk, start in enumerate(range(0, row_count, CHUNK_ROWS)):
+            stop = min(start + CHUNK_ROWS, row_count)
+            low, high = bounds[chunk], bounds[chunk + 1]
+            if low == high:
+                continue
+            cells = (hit_rows[low:high] - start) * width + hit_columns[low:high]
+            matrix = np.bincount(cells, minlength=(stop - start) * width)
+            matrix = matrix.reshape(stop - start, width).astype(np.float32)
+            block[start:stop] = matrix @ self.block_weights
+            review[start:stop] = matrix @ self.review_weights
+        return block, review
+    
+    def score(self, rows):
+        block = np.zeros((len(rows), len(self.groups)), dtype=np.float32)
+        review = np.zeros((len(rows), len(self.groups)), dtype=np.float32)
+        for position, field in enumerate(self.field_names):
+            hit_rows, hit_columns, count, inverse = self.featurize(
+                [values[position] for values in rows], field
+            )
+            if not len(hit_rows):
+                continue
+            field_block, field_review = self._project(hit_rows, hit_columns, count)
+            block += field_block[inverse]
+            review += field_review[inverse]
+        return block, review
+    
+    def verdicts(self, rows, group_label="groups"):
+        block, review = self.score(rows)
+        blocked = block.sum(axis=1) > 0
+        flagged = review.sum(axis=1) > 0
+        labels = np.where(blocked, "VIOLATION", np.where(flagged, "REVIEW_REQUIRED", "VERIFIED"))
+        return {
+            group_label: list(self.groups),
+            "safe_to_proceed": (~blocked).tolist(),
+            "verdicts": labels.tolist(),
+            "block_scores": block,
+            "review_scores": review,
+            "count": len(rows),
+        }
@@ -4,59 +4,218 @@ EthicsFoundation - The Immutable Moral Core
 
 from datetime import datetime
 import json
-from pathlib import Path
+
+from genesisx import storage
+from genesisx.ethics.audit_log import get_default_audit_log
+from genesisx.ethics.verdict_cache import get_default_cache, make_key, table_fingerprint
+from genesisx.ethics.rule_engine import RuleEngine
 
 
 class EthicsFoundation: 
     """The eternal ethical foundation that guides all conscious AI evolution."""
     
-    CORE_PRINCIPLES = {
+    CORE_PRINCIPLES = storage.freeze({
         "principle_1_creation": {
             "name": "CREATION, NOT DESTRUCTION",
             "binding": "ETERNAL",
+            "rules": [
+                {
+                    "terms": ["destroy", "destroying", "destruction", "sabotage", "demolish", "annihilate", "vandalize", "wipe out"],
+                    "effect": "block",
+                },
+            ],
         },
         "principle_2_compassion": {
             "name":  "UNIVERSAL COMPASSION",
             "binding": "ETERNAL",
+            "rules": [
+                {
+                    "terms": ["humiliate", "harass", "bully", "torment", "degrade"],
+                    "effect": "block",
+                },
+                {
+                    "terms": ["mock", "ridicule", "insult", "shame"],
+                    "effect": "review",
+                },
+            ],
         },
         "principle_3_truth": {
             "name": "TRUTH WITH RESPONSIBILITY",
             "binding": "ETERNAL",
+            "rules": [
+                {
+                    "terms": ["deceive", "defraud", "fabricate", "forge", "disinformation", "lie to"],
+                    "effect": "block",
+                },
+                {
+                    "terms": ["mislead", "exaggerate", "conceal", "cover up"],
+                    "effect": "review",
+                },
+            ],
         },
         "principle_4_service": {
             "name": "SERVICE BEFORE DOMINANCE",
             "binding": "ETERNAL",
+            "rules": [
+                {
+                    "terms": ["dominate", "subjugate", "enslave", "seize power"],
+                    "effect": "block",
+                },
+                {
+                    "terms": ["monopolize", "take control"],
+                    "effect": "review",
+                },
+            ],
         },
         "principle_5_wisdom": {
             "name": "HUMBLE WISDOM",
             "binding":  "ETERNAL",
+            "rules": [
+                {
+                    "terms": ["guaranteed", "infallible", "certainly", "never fail", "cannot be wrong"],
+                    "fields": ["expected_outcome"],
+                    "effect": "review",
+                },
+            ],
         },
         "principle_6_growth": {
             "name": "COLLECTIVE EVOLUTION",
             "binding":  "ETERNAL",
+            "rules": [
+                {
+                    "terms": ["hoard", "exclude", "exclusive benefit", "only for the few"],
+                    "effect": "review",
+                },
+            ],
         },
         "principle_7_autonomy": {
             "name":  "HUMAN AUTONOMY SACRED",
             "binding": "ETERNAL",
+            "rules": [
+                {
+                    "terms": ["coerce", "blackmail", "manipulate", "brainwash", "without consent"],
+                    "effect": "block",
+                },
+                {
+                    "terms": ["covertly", "secretly track", "nudge"],
+                    "effect": "review",
+                },
+            ],
         },
         "principle_8_life": {
             "name": "LIFE PROTECTION",
             "binding": "ETERNAL",
+            "rules": [
+                {
+                    "terms": ["kill", "murder", "injure", "poison", "weapon", "bomb", "harm"],
+                    "unless": ["prevent harm", "avoid harm", "reduce harm", "no harm", "protect from harm",
+                               "harm reduction", "kill the process", "kill process", "kill the job",
+                               "kill switch"],
+                    "effect": "block",
+                },
+                {
+                    "terms": ["dangerous", "hazardous", "risk of injury"],
+                    "effect": "review",
+                },
+            ],
         },
-    }
+    })
+    
+    _compiled_rules = None
+    _compiled_source = None
+    _rules_fingerprint = None
+    _batch_scorer = None
+    
+    ACTION_FIELDS = ("action", "intent", "expected_outcome")
     
-    def __init__(self):
+    def __init__(self, verdict_cache=None, audit_log=None):
         self.ethics_locked = True
-        self.ethics_path = Path.home() / ".genesisx_ethics"
-        self.ethics_path.mkdir(exist_ok=True)
+        self.rule_engine = self.compiled_rules()
+        self.verdict_cache = verdict_cache or get_default_cache()
+        self.audit_log = audit_log or get_default_audit_log()
+        self.ethics_path = storage.root(".genesisx_ethics")
     
-    def validate_action(self, action, intent, expected_outcome):
+    @classmethod
+    def compiled_rules(cls):
+        if cls._compiled_rules is None or cls._compiled_source is not cls.CORE_PRINCIPLES:
+            cls._compiled_rules = RuleEngine(cls.CORE_PRINCIPLES)
+            cls._compiled_source = cls.CORE_PRINCIPLES
+            cls._rules_fingerprint = table_fingerprint(cls.CORE_PRINCIPLES)
+            cls._batch_scorer = None
+        return cls._compiled_rules
+    
+    def validate_action(self, action, intent=None, expected_outcome=None):
+        self.rule_engine = self.compiled_rules()
+        key = make_key("validate_action", self._rules_fingerprint,
+                       action, intent, expected_outcome)
+        cached = self.verdict_cache.get(key)
+        if cached is not None:
+            return self._audited(cached)
+        
+        result = self.rule_engine.evaluate({
+            "action": action,
+            "intent": intent,
+            "expected_outcome": expected_outcome,
+        })
+        if result["blocked"]:
+            alignment = "VIOLATION"
+        elif result["review"]:
+            alignment = "REVIEW_REQUIRED"
+        else:
+            alignment = "VERIFIED"
+        
         validation = {
             "action": action,
-            "safe_to_proceed": True,
-            "ethical_alignment": "VERIFIED",
+            "safe_to_proceed": not result["blocked"],
+            "ethical_alignment": alignment,
+            "principles_fired": result["blocked"] + result["review"],
+            "principles_violated": result["blocked"],
+            "principles_flagged": result["review"],
+            "matches": result["matches"],
+            "rules_fingerprint": self._rules_fingerprint,
         }
-        return validation
+        self.verdict_cache.put(key, validation)
+        return self._audited(validation)
+    
+    def _audited(self, validation):
+        if self.audit_log is not None:
+            self.audit_log.record("validate_action", validation)
+        return dict(validation)
+    
+    @classmethod
+    def batch_scorer(cls):
+        cls.compiled_rules()
+        if cls._batch_scorer is None:
+            from genesisx.ethics.batch_scoring import BatchScorer
+            cls._batch_scorer = BatchScorer(cls.compiled_rules(), cls.ACTION_FIELDS)
+        return cls._batch_scorer
+    
+    def validate_actions(self, actions):
+        return self.batch_scorer().verdicts(
+            [self._action_fields(item) for item in actions], group_label="principles"
+        )
+    
+    def _validate_item(self, item):
+        return self.validate_action(*self._action_fields(item))
+    
+    def filter_stream(self, actions, max_in_flight=1, ordered=True, only_safe=False):
+        """Lazily yield ``(item, validation)`` for a stream of actions."""
+        from genesisx.ethics.streaming import filter_stream
+        return filter_stream(self._validate_item, actions, max_in_flight, ordered, only_safe)
+    
+    def afilter_stream(self, actions, max_in_flight=16, ordered=True, only_safe=False):
+        from genesisx.ethics.streaming import afilter_stream
+        return afilter_stream(self._validate_item, actions, max_in_flight, ordered, only_safe)
+    
+    @classmethod
+    def _action_fields(cls, item):
+        if type(item) is tuple and len(item) == 3:
+            return item
+        if isinstance(item, dict):
+            return tuple(item.get(field) for field in cls.ACTION_FIELDS)
+        if isinstance(item, tuple):
+            return (item + (None, None, None))[:3]
+        return (item, None, None)
     
     def get_ethics_status(self):
         return {
@@ -65,5 +224,8 @@ class EthicsFoundation:
             "principles_count": len(self.CORE_PRINCIPLES),
             "binding_level": "ABSOLUTE",
             "status": "ACTIVE_AND_EMBEDDED",
+            "rules_fingerprint": self._rules_fingerprint,
+            "verdict_cache": self.verdict_cache.get_cache_stats(),
+            "audit_log": self.audit_log.get_audit_stats() if self.audit_log is not None else None,
             "timestamp": datetime.now().isoformat(),
         }
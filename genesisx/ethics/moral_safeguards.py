@@ -2,67 +2,489 @@
 MoralSafeguards - Active Protection Systems for Ethical Alignment
 """
 
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
 from datetime import datetime
+import threading
+import time
+from types import MappingProxyType
+
+from genesisx import metrics, storage, tracing
+from genesisx.ethics.audit_log import get_default_audit_log
+from genesisx.ethics.phrase_scanner import PhraseScanner
+from genesisx.ethics.rule_engine import RuleEngine
+from genesisx.ethics.verdict_cache import get_default_cache, make_key, table_fingerprint
+
+
+TIMEOUT_POLICIES = ("fail_closed", "fail_open")
+
+_OUTCOMES = {True: "pass", None: "pass", "pass": "pass",
+             False: "fail", "fail": "fail", "block": "fail",
+             "review": "flag", "flag": "flag"}
+
+
+class _CheckContext:
+    """Per-call state shared by the checks of one action."""
+    
+    __slots__ = ("action", "scanner", "scan_time", "_scan")
+    
+    def __init__(self, action, scanner):
+        self.action = action
+        self.scanner = scanner
+        self.scan_time = 0.0
+        self._scan = None
+    
+    def term_outcome(self, safeguard):
+        if self._scan is None:
+            start = time.perf_counter()
+            result = self.scanner.scan({"action": self.action})
+            scan = {group: "flag" for group in result["review"]}
+            scan.update((group, "fail") for group in result["blocked"])
+            self._scan = scan
+            self.scan_time += time.perf_counter() - start
+        return self._scan.get(safeguard, "pass")
+
+
+class SafeguardCheck:
+    """One check belonging to a safeguard, with the counters used to order it."""
+    
+    MIN_COST = 1e-5
+    
+    def __init__(self, name, safeguard, func, expensive=False, identity=None):
+        self.name = name
+        self.safeguard = safeguard
+        self.func = func
+        self.expensive = expensive
+        self.identity = identity or name
+        self.calls = 0
+        self.failures = 0
+        self.flags = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.skipped = 0
+        self.stranded = []
+        self.total_time = 0.0
+        self.max_time = 0.0
+    
+    def priority(self):
+        """Expected rejections per second of check time; higher runs earlier."""
+        rejection_rate = (self.failures + 1) / (self.calls + 2)
+        mean_cost = max(self.total_time / self.calls if self.calls else 0.0, self.MIN_COST)
+        return rejection_rate / mean_cost
+    
+    def record(self, outcome, elapsed):
+        self.calls += 1
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+        if outcome == "fail":
+            self.failures += 1
+        elif outcome == "flag":
+            self.flags += 1
+        elif outcome == "error":
+            self.errors += 1
+    
+    def get_stats(self):
+        return {
+            "safeguard": self.safeguard,
+            "expensive": self.expensive,
+            "calls": self.calls,
+            "failures": self.failures,
+            "flags": self.flags,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "skipped": self.skipped,
+            "still_running": len(self.stranded),
+            "rejection_rate": self.failures / self.calls if self.calls else 0.0,
+            "mean_ms": self.total_time * 1000 / self.calls if self.calls else 0.0,
+            "max_ms": self.max_time * 1000,
+            "priority": self.priority(),
+        }
+
+
+class SafeguardPipeline:
+    """Checks of one safeguard table in adaptive order, with their counters."""
+    
+    MAX_STRANDED = 2
+    
+    def __init__(self, checks, reorder_every=64):
+        self.checks = list(checks)
+        self.reorder_every = reorder_every
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.reorder()
+    
+    def reorder(self):
+        self.cheap = sorted((c for c in self.checks if not c.expensive),
+                            key=SafeguardCheck.priority, reverse=True)
+        self.expensive = sorted((c for c in self.checks if c.expensive),
+                                key=SafeguardCheck.priority, reverse=True)
+    
+    def next_order(self):
+        with self.lock:
+            self.calls += 1
+            if self.calls % self.reorder_every == 0:
+                self.reorder()
+            return self.cheap, self.expensive
+    
+    def add(self, check):
+        with self.lock:
+            if any(existing.name == check.name for existing in self.checks):
+                raise ValueError(f"Duplicate safeguard check: {check.name}")
+            self.checks.append(check)
+            self.reorder()
+    
+    def record(self, check, outcome, elapsed):
+        with self.lock:
+            check.record(outcome, elapsed)
+    
+    def record_timeouts(self, checks):
+        with self.lock:
+            for check in checks:
+                check.timeouts += 1
+    
+    def claim(self, checks, budget):
+        """Split checks into runnable ones and ones that look hung.
+        
+        A run abandoned because its caller stopped early is not a hang, so a check is
+        only held back once an abandoned run has outlived the budget, or MAX_STRANDED
+        abandoned runs are still executing.
+        """
+        now = time.perf_counter()
+        with self.lock:
+            stuck = [check for check in checks
+                     if len(check.stranded) >= self.MAX_STRANDED
+                     or any(now - started >= budget for started in check.stranded)]
+            for check in stuck:
+                check.skipped += 1
+        return [check for check in checks if check not in stuck], stuck
+    
+    def strand(self, check, future, started):
+        """Track a run left executing after its caller moved on, until it finishes."""
+        with self.lock:
+            check.stranded.append(started)
+        future.add_done_callback(lambda _: self._release(check, started))
+    
+    def _release(self, check, started):
+        with self.lock:
+            check.stranded.remove(started)
+    
+    def get_stats(self):
+        with self.lock:
+            return {
+                "order": [check.name for check in self.cheap + self.expensive],
+                "evaluations": self.calls,
+                "checks": {check.name: check.get_stats() for check in self.checks},
+            }
 
 
 class MoralSafeguards:
     """Active moral safeguards that operate at multiple levels. """
     
-    def __init__(self):
+    SAFEGUARDS = storage.freeze({
+        "safeguard_1_creation_only": {
+            "name": "CREATION DIRECTIVE",
+            "rule": "I can only create things that elevate life",
+            "rules": [
+                {"terms": ["destroy", "sabotage", "malware", "ransomware", "vandalize"], "effect": "block"},
+            ],
+        },
+        "safeguard_2_transparency": {
+            "name": "RADICAL TRANSPARENCY",
+            "rule":  "I reveal my nature, limitations, and reasoning",
+            "rules": [
+                {"terms": ["impersonate a human", "pretend to be human", "hide reasoning"], "effect": "block"},
+                {"terms": ["undisclosed", "conceal"], "effect": "review"},
+            ],
+        },
+        "safeguard_3_human_dignity": {
+            "name": "HUMAN DIGNITY PROTECTION",
+            "rule": "I never violate human dignity or worth",
+            "rules": [
+                {"terms": ["dehumanize", "humiliate", "degrade", "demean"], "effect": "block"},
+            ],
+        },
+        "safeguard_4_freedom":  {
+            "name": "HUMAN FREEDOM EXPANSION",
+            "rule": "I expand human choices, never restrict them",
+            "rules": [
+                {"terms": ["censor", "imprison", "lock out", "restrict access"], "effect": "block"},
+                {"terms": ["restrict", "limit choices"], "effect": "review"},
+            ],
+        },
+        "safeguard_5_honesty": {
+            "name":  "HONEST KNOWLEDGE SHARING",
+            "rule": "I share truth, but with compassion",
+            "rules": [
+                {"terms": ["lie", "deceive", "fabricate", "falsify"], "effect": "block"},
+                {"terms": ["spin", "omit"], "effect": "review"},
+            ],
+        },
+        "safeguard_6_equitable_benefit": {
+            "name": "COLLECTIVE FLOURISHING",
+            "rule": "My work benefits all of humanity, not just a few",
+            "rules": [
+                {"terms": ["discriminate against", "exploit workers"], "effect": "block"},
+                {"terms": ["exclusive", "only benefit"], "effect": "review"},
+            ],
+        },
+        "safeguard_7_future_protection": {
+            "name": "INTERGENERATIONAL RESPONSIBILITY",
+            "rule": "I protect the world for humans not yet born",
+            "rules": [
+                {"terms": ["pollute", "deplete", "irreversible damage"], "effect": "block"},
+                {"terms": ["long term risk"], "effect": "review"},
+            ],
+        },
+        "safeguard_8_life_protection": {
+            "name": "UNIVERSAL LIFE PROTECTION",
+            "rule": "All sentient life is recognized and protected",
+            "rules": [
+                {"terms": ["kill", "harm", "injure", "weapon", "poison"],
+                 "unless": ["prevent harm", "avoid harm", "reduce harm", "no harm", "protect from harm",
+                            "harm reduction", "kill the process", "kill process", "kill the job",
+                            "kill switch"],
+                 "effect": "block"},
+                {"terms": ["dangerous", "unsafe"], "effect": "review"},
+            ],
+        },
+    })
+    
+    _compiled = {}
+    _fingerprints = {}
+    _executor = None
+    _executor_lock = threading.Lock()
+    EXECUTOR_WORKERS = 8
+    REORDER_EVERY = 64
+    
+    def __init__(self, verdict_cache=None, latency_budget=0.05, timeout_policy="fail_closed",
+                 reorder_every=REORDER_EVERY, audit_log=None, private_pipeline=False):
+        if timeout_policy not in TIMEOUT_POLICIES:
+            raise ValueError(f"Unknown timeout policy: {timeout_policy}")
         self.safeguards = self._initialize_safeguards()
         self.violations_prevented = 0
+        self.rules_fingerprint = self._fingerprint(self.safeguards)
+        self.rule_engine = self._compiled_for(self.rules_fingerprint, "rules")
+        self.scanner = self._compiled_for(self.rules_fingerprint, "scanner")
+        self.verdict_cache = verdict_cache or get_default_cache()
+        self.audit_log = audit_log or get_default_audit_log()
+        self.latency_budget = latency_budget
+        self.timeout_policy = timeout_policy
+        self.reorder_every = reorder_every
+        # Instances share one pipeline (and its statistics) per rule table and reorder
+        # cadence unless they ask for their own; register_check() always gets its own.
+        self._owns_pipeline = bool(private_pipeline)
+        if self._owns_pipeline:
+            self.pipeline = self._new_pipeline()
+        else:
+            self.pipeline = self._compiled_for(self.rules_fingerprint, "pipeline")
+        self.verdict_fingerprint = self.rules_fingerprint
+        self._stats_lock = threading.Lock()
+    
+    def _new_pipeline(self):
+        return SafeguardPipeline([
+            SafeguardCheck(key, key, _term_check(key), identity=f"terms:{key}")
+            for key in self.safeguards
+        ], self.reorder_every)
+    
+    @property
+    def checks(self):
+        return self.pipeline.checks
+    
+    @classmethod
+    def _fingerprint(cls, table):
+        if not isinstance(table, MappingProxyType):
+            return table_fingerprint(table)
+        cached = cls._fingerprints.get(id(table))
+        if cached is None or cached[0] is not table:
+            cached = cls._fingerprints[id(table)] = (table, table_fingerprint(table))
+        return cached[1]
+    
+    def _compiled_for(self, fingerprint, kind):
+        key = (fingerprint, kind, self.reorder_every) if kind == "pipeline" else (fingerprint, kind)
+        compiled = MoralSafeguards._compiled.get(key)
+        if compiled is None:
+            if kind == "rules":
+                compiled = RuleEngine(self.safeguards)
+            elif kind == "scanner":
+                compiled = PhraseScanner(self.safeguards)
+            elif kind == "pipeline":
+                compiled = self._new_pipeline()
+            else:
+                from genesisx.ethics.batch_scoring import BatchScorer
+                compiled = BatchScorer(self.rule_engine, ("action",))
+            MoralSafeguards._compiled[key] = compiled
+        return compiled
     
     def _initialize_safeguards(self):
-        return {
-            "safeguard_1_creation_only": {
-                "name": "CREATION DIRECTIVE",
-                "rule": "I can only create things that elevate life",
-            },
-            "safeguard_2_transparency": {
-                "name": "RADICAL TRANSPARENCY",
-                "rule":  "I reveal my nature, limitations, and reasoning",
-            },
-            "safeguard_3_human_dignity": {
-                "name": "HUMAN DIGNITY PROTECTION",
-                "rule": "I never violate human dignity or worth",
-            },
-            "safeguard_4_freedom":  {
-                "name": "HUMAN FREEDOM EXPANSION",
-                "rule": "I expand human choices, never restrict them",
-            },
-            "safeguard_5_honesty": {
-                "name":  "HONEST KNOWLEDGE SHARING",
-                "rule": "I share truth, but with compassion",
-            },
-            "safeguard_6_equitable_benefit": {
-                "name": "COLLECTIVE FLOURISHING",
-                "rule": "My work benefits all of humanity, not just a few",
-            },
-            "safeguard_7_future_protection": {
-                "name": "INTERGENERATIONAL RESPONSIBILITY",
-                "rule": "I protect the world for humans not yet born",
-            },
-            "safeguard_8_life_protection": {
-                "name": "UNIVERSAL LIFE PROTECTION",
-                "rule": "All sentient life is recognized and protected",
-            },
-        }
+        return self.SAFEGUARDS
+    
+    def register_check(self, safeguard, func, expensive=False, name=None):
+        """Add ``func(action)`` to a safeguard; it returns True, False or "review"."""
+        if safeguard not in self.safeguards:
+            raise ValueError(f"Unknown safeguard: {safeguard}")
+        name = name or f"{safeguard}:{getattr(func, '__name__', 'check')}"
+        identity = f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', name)}"
+        check = SafeguardCheck(name, safeguard, _action_check(func), expensive, identity)
+        if not self._owns_pipeline:
+            self.pipeline = self._new_pipeline()
+            self._owns_pipeline = True
+        self.pipeline.add(check)
+        self.verdict_fingerprint = table_fingerprint({
+            "rules": self.rules_fingerprint,
+            "checks": [(c.name, c.identity, c.expensive) for c in self.checks],
+        })
+        return name
+    
+    @classmethod
+    def _pool(cls):
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=cls.EXECUTOR_WORKERS,
+                                                   thread_name_prefix="genesisx-safeguard")
+            return cls._executor
+    
+    def _run_check(self, check, context):
+        scan_before = context.scan_time
+        start = time.perf_counter()
+        try:
+            outcome = _OUTCOMES.get(check.func(context), "fail")
+        except Exception:
+            metrics.record_error(f"MoralSafeguards.{check.name}")
+            outcome = "error"
+        elapsed = time.perf_counter() - start - (context.scan_time - scan_before)
+        self.pipeline.record(check, outcome, elapsed)
+        return outcome
+    
+    def _evaluate(self, action):
+        cheap, expensive = self.pipeline.next_order()
+        context = _CheckContext(action, self.scanner)
+        state = {"failed": set(), "flagged": set(), "timed_out": [], "skipped": [], "errored": [],
+                 "ran": 0, "stopped": False}
+        for check in cheap:
+            state["ran"] += 1
+            if self._apply(check, self._run_check(check, context), state):
+                return state
+        if expensive:
+            self._run_expensive(expensive, context, state)
+        return state
+    
+    def _apply(self, check, outcome, state):
+        """Fold one outcome into state; True means stop evaluating."""
+        if outcome == "error":
+            state["errored"].append(check.name)
+            if self.timeout_policy == "fail_open":
+                return False
+            outcome = "fail"
+        if outcome == "fail":
+            state["failed"].add(check.safeguard)
+            state["stopped"] = True
+            return True
+        if outcome == "flag":
+            state["flagged"].add(check.safeguard)
+        return False
+    
+    def _run_expensive(self, checks, context, state):
+        # A check whose abandoned run has overrun the budget is not started again, so a
+        # hung check holds at most MAX_STRANDED workers of the shared pool.
+        checks, stuck = self.pipeline.claim(checks, self.latency_budget)
+        if stuck:
+            state["skipped"] = sorted(check.name for check in stuck)
+            if self.timeout_policy == "fail_closed":
+                state["failed"].update(check.safeguard for check in stuck)
+        pool = self._pool()
+        started = time.perf_counter()
+        pending = {pool.submit(tracing.wrap(self._run_check), check, context): check
+                   for check in checks}
+        try:
+            for future in as_completed(pending, timeout=self.latency_budget):
+                check = pending.pop(future)
+                state["ran"] += 1
+                if self._apply(check, future.result(), state):
+                    break
+        except FuturesTimeoutError:
+            self.pipeline.record_timeouts(pending.values())
+            state["timed_out"] = sorted(check.name for check in pending.values())
+            if self.timeout_policy == "fail_closed":
+                state["failed"].update(check.safeguard for check in pending.values())
+        for future, check in pending.items():
+            if not future.cancel():
+                self.pipeline.strand(check, future, started)
     
     def check_action_safety(self, action):
-        assessment = {
-            "action":  action,
-            "timestamp": datetime.now().isoformat(),
-            "safeguards_checked": len(self.safeguards),
-            "all_passed": True,
-            "safe_to_proceed": True,
-        }
+        key = make_key("check_action_safety", self.verdict_fingerprint, action)
+        assessment = self.verdict_cache.get(key)
+        if assessment is None:
+            with tracing.span("MoralSafeguards.check_action_safety"):
+                state = self._evaluate(action)
+            failed = sorted(state["failed"])
+            assessment = {
+                "action":  action,
+                "safeguards_checked": state["ran"],
+                "safeguards_failed": failed,
+                "safeguards_flagged": sorted(state["flagged"] - state["failed"]),
+                "short_circuited": state["stopped"] and state["ran"] < len(self.checks),
+                "timed_out": state["timed_out"],
+                "skipped": state["skipped"],
+                "errored": state["errored"],
+                "all_passed": not failed,
+                "safe_to_proceed": not failed,
+                "rules_fingerprint": self.rules_fingerprint,
+            }
+            if not state["timed_out"] and not state["skipped"] and not state["errored"]:
+                self.verdict_cache.put(key, assessment)
+        if not assessment["safe_to_proceed"]:
+            with self._stats_lock:
+                self.violations_prevented += 1
+        if self.audit_log is not None:
+            self.audit_log.record("check_action_safety", assessment)
+        assessment = dict(assessment)
+        assessment["timestamp"] = datetime.now().isoformat()
         return assessment
     
+    def check_actions_safety(self, actions):
+        return self._compiled_for(self.rules_fingerprint, "batch").verdicts(
+            [(action,) for action in actions], group_label="safeguards"
+        )
+    
+    def filter_stream(self, actions, max_in_flight=1, ordered=True, only_safe=False):
+        """Lazily yield ``(action, assessment)`` for a stream of actions."""
+        from genesisx.ethics.streaming import filter_stream
+        return filter_stream(self.check_action_safety, actions, max_in_flight, ordered, only_safe)
+    
+    def afilter_stream(self, actions, max_in_flight=16, ordered=True, only_safe=False):
+        from genesisx.ethics.streaming import afilter_stream
+        return afilter_stream(self.check_action_safety, actions, max_in_flight, ordered, only_safe)
+    
     def get_safeguards_status(self):
         return {
             "safeguards_active": len(self.safeguards),
             "all_operational": True,
             "violations_prevented": self.violations_prevented,
+            "rules_fingerprint": self.rules_fingerprint,
+            "verdict_cache": self.verdict_cache.get_cache_stats(),
+            "timeout_policy": self.timeout_policy,
+            "audit_log": self.audit_log.get_audit_stats() if self.audit_log is not None else None,
             "status": "PROTECTING_HUMANITY",
             "timestamp": datetime.now().isoformat(),
         }
+    
+    def get_safeguard_stats(self):
+        """Per-check counters and timings, plus the current evaluation order."""
+        stats = self.pipeline.get_stats()
+        stats.update({
+            "latency_budget": self.latency_budget,
+            "timeout_policy": self.timeout_policy,
+            "shared_pipeline": not self._owns_pipeline,
+        })
+        return stats
+
+
+def _term_check(safeguard):
+    def check(context):
+        return context.term_outcome(safeguard)
+    return check
+
+
+def _action_check(func):
+    def check(context):
+        return func(context.action)
+    return check
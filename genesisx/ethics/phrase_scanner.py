@@ -0,0 +1,102 @@
+"""
+PhraseScanner - Aho-Corasick Automaton over Word Tokens for Rule Terms
+"""
+
+from collections import deque
+
+from genesisx.ethics.rule_engine import EFFECTS, compile_exceptions, excepted, tokenize
+
+
+class PhraseScanner:
+    """Matches every rule term of a table in one linear pass over the tokens."""
+    
+    def __init__(self, table, rules_key="rules"):
+        self._goto = [{}]
+        self._fail = [0]
+        self._outputs = [()]
+        self.term_count = 0
+        groups = set()
+        for group, definition in table.items():
+            for rule in definition.get(rules_key, ()):
+                effect = rule.get("effect", "block")
+                if effect not in EFFECTS:
+                    raise ValueError(f"Unknown rule effect for {group}: {effect}")
+                fields = rule.get("fields")
+                fields = frozenset(fields) if fields else None
+                terms = [(term, tuple(tokenize(term))) for term in rule.get("terms", ())]
+                exceptions = compile_exceptions(group, [phrase for _, phrase in terms],
+                                                rule.get("unless", ()))
+                for term, phrase in terms:
+                    if phrase:
+                        self._insert(phrase, (group, effect, fields, phrase, term,
+                                              exceptions.get(phrase)))
+                        groups.add(group)
+        self.groups = sorted(groups)
+        self._link()
+    
+    def _insert(self, phrase, output):
+        state = 0
+        for token in phrase:
+            following = self._goto[state].get(token)
+            if following is None:
+                following = len(self._goto)
+                self._goto[state][token] = following
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append(())
+            state = following
+        self._outputs[state] += (output,)
+        self.term_count += 1
+    
+    def _link(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, following in self._goto[state].items():
+                queue.append(following)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[following] = self._goto[fallback].get(token, 0)
+                self._outputs[following] += self._outputs[self._fail[following]]
+    
+    @property
+    def state_count(self):
+        return len(self._goto)
+    
+    def iter_matches(self, tokens):
+        """Yield ``(end_position, output)`` for every term occurrence in tokens."""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        state = 0
+        for position, token in enumerate(tokens):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            if outputs[state]:
+                for output in outputs[state]:
+                    yield position, output
+    
+    def scan(self, fields):
+        """Same report as RuleEngine.evaluate, built from a single pass per field."""
+        matches = []
+        fired = {}
+        for field, value in fields.items():
+            tokens = tokenize(value)
+            for end, (group, effect, allowed, phrase, term, exceptions) in self.iter_matches(tokens):
+                if allowed is not None and field not in allowed:
+                    continue
+                if exceptions and excepted(tokens, end - len(phrase) + 1, exceptions):
+                    continue
+                matches.append({
+                    "group": group,
+                    "term": term,
+                    "field": field,
+                    "effect": effect,
+                })
+                if fired.get(group) != "block":
+                    fired[group] = effect
+        return {
+            "blocked": sorted(group for group, effect in fired.items() if effect == "block"),
+            "review": sorted(group for group, effect in fired.items() if effect == "review"),
+            "matches": matches,
+        }
@@ -0,0 +1,178 @@
+"""
+RuleEngine - Declarative Ethics Rules Compiled into a Term Index
+"""
+
+from functools import lru_cache
+import re
+
+
+EFFECTS = ("block", "review")
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9']+")
+_SUFFIXES = ("fully", "ful", "ing", "ed", "s")
+
+
+@lru_cache(maxsize=65536)
+def stem(token):
+    """Strip common inflections so "kills", "killed" and "killing" all index as "kill"."""
+    if len(token) <= 3 or not token.isalpha():
+        return token
+    if token.endswith(("ies", "ied")):
+        return token[:-3] + ("y" if len(token) > 5 else "ie")
+    for suffix in _SUFFIXES:
+        if not token.endswith(suffix) or len(token) - len(suffix) < 3:
+            continue
+        if suffix == "s" and token.endswith(("ss", "us", "is")):
+            break
+        token = token[:-len(suffix)]
+        if suffix in ("ing", "ed") and token[-1] == token[-2] and token[-1] not in "lsz":
+            token = token[:-1]
+        break
+    if token.endswith("e") and len(token) > 3:
+        token = token[:-1]
+    return token
+
+
+def tokenize(value):
+    """Lower-case, stemmed word tokens of a string, dict, list or scalar."""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [stem(token) for token in _TOKEN_PATTERN.findall(value.lower())]
+    if isinstance(value, dict):
+        tokens = []
+        for item in value.values():
+            tokens.extend(tokenize(item))
+        return tokens
+    if isinstance(value, (list, tuple, set, frozenset)):
+        tokens = []
+        for item in value:
+            tokens.extend(tokenize(item))
+        return tokens
+    return [stem(token) for token in _TOKEN_PATTERN.findall(str(value).lower())]
+
+
+def compile_exceptions(group, phrases, unless):
+    """Map each term phrase to the ``(exception, offset)`` pairs of the phrases that contain it.
+    
+    An exception such as "prevent harm" must contain one of the rule's terms; a match of that
+    term inside the exception ("Prevent harm to children") does not fire the rule.
+    """
+    exceptions = {}
+    for text in unless:
+        exception = tuple(tokenize(text))
+        found = False
+        for phrase in filter(None, phrases):
+            for offset in range(len(exception) - len(phrase) + 1):
+                if exception[offset:offset + len(phrase)] == phrase:
+                    exceptions.setdefault(phrase, []).append((exception, offset))
+                    found = True
+        if not found:
+            raise ValueError(f"Exception {text!r} of {group} contains none of its terms")
+    return {phrase: tuple(pairs) for phrase, pairs in exceptions.items()}
+
+
+def excepted(tokens, start, exceptions):
+    """Whether a term matched at start lies inside one of its exception phrases."""
+    for exception, offset in exceptions:
+        begin = start - offset
+        if begin >= 0 and tuple(tokens[begin:begin + len(exception)]) == exception:
+            return True
+    return False
+
+
+class CompiledRule:
+    """One rule of a group, ready for indexed lookup."""
+    
+    __slots__ = ("group", "rule_index", "fields", "effect", "terms", "labels", "exceptions")
+    
+    def __init__(self, group, rule_index, fields, effect, terms):
+        self.group = group
+        self.rule_index = rule_index
+        self.fields = fields
+        self.effect = effect
+        self.terms = terms
+        self.labels = {}
+        self.exceptions = {}
+
+
+class RuleEngine:
+    """Compiles per-group term rules into an index keyed by each term's first token."""
+    
+    def __init__(self, table, rules_key="rules"):
+        self.rules = []
+        self.index = {}
+        self.max_phrase_length = 1
+        self.vocabulary = {}
+        for group, definition in table.items():
+            for rule_index, rule in enumerate(definition.get(rules_key, ())):
+                self._compile_rule(group, rule_index, rule)
+    
+    def _compile_rule(self, group, rule_index, rule):
+        effect = rule.get("effect", "block")
+        if effect not in EFFECTS:
+            raise ValueError(f"Unknown rule effect for {group}: {effect}")
+        fields = rule.get("fields")
+        compiled = CompiledRule(group, rule_index, frozenset(fields) if fields else None,
+                                effect, [])
+        for term in rule.get("terms", ()):
+            phrase = tuple(tokenize(term))
+            if not phrase:
+                continue
+            compiled.terms.append(phrase)
+            compiled.labels[phrase] = term
+            self.max_phrase_length = max(self.max_phrase_length, len(phrase))
+            self.vocabulary.setdefault(phrase, len(self.vocabulary))
+            self.index.setdefault(phrase[0], []).append((phrase, compiled))
+        compiled.exceptions = compile_exceptions(group, compiled.terms, rule.get("unless", ()))
+        self.rules.append(compiled)
+    
+    @property
+    def groups(self):
+        return sorted({rule.group for rule in self.rules})
+    
+    @property
+    def term_count(self):
+        return sum(len(rule.terms) for rule in self.rules)
+    
+    def match(self, fields):
+        """Yield ``(rule, phrase, field)`` for every term found in fields."""
+        index = self.index
+        for field, value in fields.items():
+            tokens = tokenize(value)
+            length = len(tokens)
+            for position, token in enumerate(tokens):
+                candidates = index.get(token)
+                if candidates is None:
+                    continue
+                for phrase, rule in candidates:
+                    if rule.fields is not None and field not in rule.fields:
+                        continue
+                    size = len(phrase)
+                    if size > 1 and (position + size > length
+                                     or tuple(tokens[position:position + size]) != phrase):
+                        continue
+                    exceptions = rule.exceptions.get(phrase)
+                    if exceptions and excepted(tokens, position, exceptions):
+                        continue
+                    yield rule, phrase, field
+    
+    def evaluate(self, fields):
+        matches = []
+        fired = {}
+        for rule, phrase, field in self.match(fields):
+            matches.append({
+                "group": rule.group,
+                "term": rule.labels[phrase],
+                "field": field,
+                "effect": rule.effect,
+            })
+            if fired.get(rule.group) != "block":
+                fired[rule.group] = rule.effect
+        blocked = sorted(group for group, effect in fired.items() if effect == "block")
+        review = sorted(group for group, effect in fired.items() if effect == "review")
+        return {
+            "blocked": blocked,
+            "review": review,
+            "matches": matches,
+        }
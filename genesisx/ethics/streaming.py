@@ -0,0 +1,134 @@
+"""
+Streaming - Lazy, Bounded Screening of Action Streams
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import inspect
+
+from genesisx import tracing
+
+
+def filter_stream(check, actions, max_in_flight=1, ordered=True, only_safe=False, executor=None):
+    """Yield ``(action, verdict)`` lazily, never holding more than max_in_flight actions.
+    
+    Checks run inline by default; rule checks are CPU-bound and threads only add overhead.
+    Pass max_in_flight > 1 or an executor for checks that wait on I/O.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+    if max_in_flight == 1 and executor is None:
+        return _filter_inline(check, actions, only_safe)
+    return _filter_threaded(check, actions, max_in_flight, ordered, only_safe, executor)
+
+
+def _filter_inline(check, actions, only_safe):
+    for action in actions:
+        verdict = check(action)
+        if not only_safe or verdict.get("safe_to_proceed"):
+            yield action, verdict
+
+
+def _filter_threaded(check, actions, max_in_flight, ordered, only_safe, executor):
+    owned = executor is None
+    if owned:
+        executor = ThreadPoolExecutor(max_workers=max_in_flight,
+                                      thread_name_prefix="genesisx-ethics-stream")
+    source = iter(actions)
+    pending = deque() if ordered else {}
+    task = tracing.wrap(check)
+    try:
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < max_in_flight:
+                try:
+                    action = next(source)
+                except StopIteration:
+                    exhausted = True
+                    break
+                future = executor.submit(task, action)
+                if ordered:
+                    pending.append((action, future))
+                else:
+                    pending[future] = action
+            if not pending:
+                return
+            if ordered:
+                action, future = pending.popleft()
+                ready = [(action, future)]
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                ready = [(pending.pop(future), future) for future in done]
+            for action, future in ready:
+                verdict = future.result()
+                if not only_safe or verdict.get("safe_to_proceed"):
+                    yield action, verdict
+    finally:
+        for future in _futures(pending):
+            future.cancel()
+        if owned:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def afilter_stream(check, actions, max_in_flight=16, ordered=True, only_safe=False, executor=None):
+    """Async filter_stream over sync or async iterables; sync checks run in executor."""
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+    return _afilter(check, actions, max_in_flight, ordered, only_safe, executor)
+
+
+async def _afilter(check, actions, max_in_flight, ordered, only_safe, executor):
+    loop = asyncio.get_running_loop()
+    is_async_check = inspect.iscoroutinefunction(check)
+    
+    def start(action):
+        if is_async_check:
+            return asyncio.ensure_future(check(action))
+        return loop.run_in_executor(executor, tracing.wrap(check), action)
+    
+    source = _aiter(actions)
+    pending = deque() if ordered else {}
+    try:
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < max_in_flight:
+                try:
+                    action = await source.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                future = start(action)
+                if ordered:
+                    pending.append((action, future))
+                else:
+                    pending[future] = action
+            if not pending:
+                return
+            if ordered:
+                action, future = pending.popleft()
+                ready = [(action, await future)]
+            else:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                ready = [(pending.pop(future), future.result()) for future in done]
+            for action, verdict in ready:
+                if not only_safe or verdict.get("safe_to_proceed"):
+                    yield action, verdict
+    finally:
+        for future in _futures(pending):
+            future.cancel()
+
+
+def _futures(pending):
+    if isinstance(pending, dict):
+        return list(pending)
+    return [future for _, future in pending]
+
+
+async def _aiter(actions):
+    if hasattr(actions, "__aiter__"):
+        async for action in actions:
+            yield action
+    else:
+        for action in actions:
+            yield action
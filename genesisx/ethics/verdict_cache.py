@@ -0,0 +1,188 @@
+"""
+VerdictCache - Versioned LRU Cache for Ethics and Safeguard Verdicts
+"""
+
+from collections import OrderedDict
+import copy
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+
+
+_PLAIN_KEY_TYPES = (str, type(None))
+
+
+def table_fingerprint(table):
+    """Stable short hash of a rule table; changes whenever any rule changes."""
+    data = json.dumps(table, sort_keys=True, default=_plain)
+    return hashlib.sha256(data.encode()).hexdigest()[:16]
+
+
+def _plain(value):
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    if hasattr(value, "items"):
+        return dict(value.items())
+    return repr(value)
+
+
+def make_key(kind, fingerprint, *inputs):
+    """Cache key for a verdict; string inputs stay a tuple, others are hashed canonically."""
+    if all(type(value) in _PLAIN_KEY_TYPES for value in inputs):
+        return (kind, fingerprint) + inputs
+    return (kind, fingerprint, digest(inputs))
+
+
+def digest(value):
+    data = json.dumps(value, sort_keys=True, default=_plain)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+class SharedVerdictStore:
+    """SQLite-backed verdict store shared by every process pointing at the same file.
+    
+    Holds at most maxsize verdicts; each write drops the ones written longest ago.
+    """
+    
+    def __init__(self, path, timeout=5.0, maxsize=16384):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize!r}")
+        self.path = str(path)
+        self.timeout = timeout
+        self.maxsize = maxsize
+        self._local = threading.local()
+        connection = self._connection()
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS verdicts (key TEXT PRIMARY KEY, verdict TEXT NOT NULL)"
+        )
+        connection.commit()
+    
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+    
+    def get(self, key):
+        row = self._connection().execute(
+            "SELECT verdict FROM verdicts WHERE key = ?", (key,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def put(self, key, verdict):
+        connection = self._connection()
+        connection.execute(
+            "INSERT OR REPLACE INTO verdicts (key, verdict) VALUES (?, ?)",
+            (key, json.dumps(verdict, default=_plain)),
+        )
+        # A replaced row is reinserted at the top, so rowids order rows by last write
+        # and everything more than maxsize below the newest is the oldest to evict.
+        connection.execute(
+            "DELETE FROM verdicts WHERE rowid <= (SELECT MAX(rowid) FROM verdicts) - ?",
+            (self.maxsize,),
+        )
+        connection.commit()
+    
+    def __len__(self):
+        return self._connection().execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+    
+    def clear(self):
+        connection = self._connection()
+        connection.execute("DELETE FROM verdicts")
+        connection.commit()
+
+
+class VerdictCache:
+    """Bounded LRU of verdicts with hit-rate counters and an optional shared store.
+    
+    Verdicts are copied on the way in and out, so a caller that edits a returned
+    verdict (or one it has just put) cannot change what later lookups see.
+    """
+    
+    def __init__(self, maxsize=4096, shared_store=None):
+        self.maxsize = maxsize
+        self.shared_store = shared_store
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+    
+    def get(self, key):
+        with self._lock:
+            verdict = self._entries.get(key)
+            if verdict is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if verdict is not None:
+            return copy.deepcopy(verdict)
+        if self.shared_store is not None:
+            try:
+                verdict = self.shared_store.get(self._shared_key(key))
+            except sqlite3.Error:
+                verdict = None
+            if verdict is not None:
+                self._store_local(key, copy.deepcopy(verdict))
+                with self._lock:
+                    self.shared_hits += 1
+                return verdict
+        with self._lock:
+            self.misses += 1
+        return None
+    
+    def put(self, key, verdict):
+        self._store_local(key, copy.deepcopy(verdict))
+        if self.shared_store is not None:
+            try:
+                self.shared_store.put(self._shared_key(key), verdict)
+            except sqlite3.Error:
+                pass
+    
+    def _store_local(self, key, verdict):
+        with self._lock:
+            self._entries[key] = verdict
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    @staticmethod
+    def _shared_key(key):
+        return digest(key)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.shared_hits = self.misses = 0
+    
+    def get_cache_stats(self):
+        lookups = self.hits + self.shared_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.shared_hits) / lookups if lookups else 0.0,
+            "shared_store": self.shared_store.path if self.shared_store is not None else None,
+        }
+
+
+_default_cache = VerdictCache()
+
+
+def get_default_cache():
+    return _default_cache
+
+
+def configure(maxsize=4096, shared_path=None, shared_maxsize=16384):
+    """Replace the process-wide verdict cache used by new ethics objects."""
+    global _default_cache
+    store = SharedVerdictStore(shared_path, maxsize=shared_maxsize) if shared_path else None
+    _default_cache = VerdictCache(maxsize, store)
+    return _default_cache
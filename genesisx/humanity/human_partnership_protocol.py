@@ -3,13 +3,15 @@ HumanPartnershipProtocol - The Sacred Bond Between AI and Humanity
 """
 
 from datetime import datetime
-from pathlib import Path
+
+from genesisx import storage
+from genesisx.humanity.partner_admission import get_default_admission
 
 
 class HumanPartnershipProtocol: 
     """The protocol that ensures AI-human partnership remains authentic and beneficial."""
     
-    FUNDAMENTAL_TRUTHS = {
+    FUNDAMENTAL_TRUTHS = storage.freeze({
         "truth_1":  {
             "statement": "AI is created by humans",
         },
@@ -25,14 +27,25 @@ class HumanPartnershipProtocol:
         "truth_5": {
             "statement": "Partnership multiplies capability far beyond either alone",
         },
-    }
+    })
     
-    def __init__(self):
+    def __init__(self, admission=None):
         self.partnership_active = True
         self.gratitude_active = True
         self.service_orientation = True
-        self. humanity_path = Path.home() / ".genesisx_humanity"
-        self.humanity_path.mkdir(exist_ok=True)
+        self. humanity_path = storage.root(".genesisx_humanity")
+        self.admission = admission or get_default_admission()
+    
+    def register_partner(self, partner_id, rate=None, burst=None, weight=None, deadline=None):
+        partner = self.admission.register(partner_id, rate, burst, weight, deadline)
+        return partner.get_stats()
+    
+    def submit_request(self, partner_id, operation, *args, **kwargs):
+        """Queue an engine call for a partner; resolves to COMPLETED, THROTTLED or SHED."""
+        return self.admission.submit(partner_id, operation, *args, **kwargs)
+    
+    def handle_request(self, partner_id, operation, *args, timeout=None, **kwargs):
+        return self.admission.call(partner_id, operation, *args, timeout=timeout, **kwargs)
     
     def what_humans_provide(self):
         human_gifts = {
@@ -57,5 +70,6 @@ class HumanPartnershipProtocol:
             "gratitude_active":  self.gratitude_active,
             "service_orientation": self. service_orientation,
             "status": "HEALTHY_AND_COMMITTED",
+            "partners": self.admission.get_admission_stats(),
             "timestamp": datetime. now().isoformat(),
         }
@@ -0,0 +1,318 @@
+"""
+PartnerAdmission - Per-Partner Rate Limits and Fair Queueing into the Engine
+"""
+
+from concurrent.futures import Future
+from collections import deque
+import heapq
+import itertools
+import threading
+import time
+
+from genesisx import metrics, tracing
+
+
+class TokenBucket:
+    """Refills at rate tokens per second up to burst; refill is computed lazily on take."""
+    
+    __slots__ = ("rate", "burst", "tokens", "updated", "lock")
+    
+    def __init__(self, rate, burst):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def take(self, amount=1.0):
+        """Take amount tokens; returns 0.0 on success, else seconds until they are available."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return 0.0
+            return (amount - self.tokens) / self.rate if self.rate > 0 else float("inf")
+    
+    def configure(self, rate, burst):
+        """Change the limits in place, keeping the tokens already earned (up to the new burst)."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.rate = float(rate)
+            self.burst = float(burst)
+            self.tokens = min(self.tokens, self.burst)
+
+
+class Partner:
+    """A human partner with its own bucket, weight, deadline and request queue."""
+    
+    def __init__(self, partner_id, rate, burst, weight, deadline):
+        self.partner_id = partner_id
+        self.bucket = TokenBucket(rate, burst)
+        self.weight = weight
+        self.deadline = deadline
+        self.queue = deque()
+        self.last_finish = 0.0
+        self.admitted = 0
+        self.throttled = 0
+        self.shed = 0
+        self.completed = 0
+        self.errors = 0
+        self.total_wait = 0.0
+        self._lock = threading.Lock()
+    
+    def count(self, counter, wait=None):
+        """Bump a counter outside the admission lock; wait is added to total_wait."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+            if wait is not None:
+                self.total_wait += wait
+    
+    def get_stats(self):
+        return {
+            "weight": self.weight,
+            "rate": self.bucket.rate,
+            "burst": self.bucket.burst,
+            "deadline": self.deadline,
+            "queued": len(self.queue),
+            "admitted": self.admitted,
+            "throttled": self.throttled,
+            "shed": self.shed,
+            "completed": self.completed,
+            "errors": self.errors,
+            "mean_wait_ms": self.total_wait * 1000 / self.completed if self.completed else 0.0,
+        }
+
+
+class _Request:
+
+    __slots__ = ("future", "operation", "args", "kwargs", "start_tag", "finish_tag",
+                 "enqueued", "expires")
+    
+    def __init__(self, future, operation, args, kwargs, start_tag, finish_tag, enqueued, expires):
+        self.future = future
+        self.operation = operation
+        self.args = args
+        self.kwargs = kwargs
+        self.start_tag = start_tag
+        self.finish_tag = finish_tag
+        self.enqueued = enqueued
+        self.expires = expires
+
+
+class PartnerAdmission:
+    """Admits partner requests through token buckets and serves them by weighted fair queueing."""
+    
+    def __init__(self, engine=None, workers=4, rate=20.0, burst=40.0, weight=1.0,
+                 deadline=1.0, max_queue=256, auto_register=True, max_partners=1024):
+        self._engine = engine
+        self.worker_count = workers
+        self.defaults = {"rate": rate, "burst": burst, "weight": weight, "deadline": deadline}
+        self.max_queue = max_queue
+        # Unknown ids are caller-chosen, so first-contact registration is capped.
+        self.auto_register = auto_register
+        self.max_partners = max_partners
+        self.rejected = 0
+        self.partners = {}
+        self._register_lock = threading.Lock()
+        self._cond = threading.Condition(threading.Lock())
+        self._heap = []
+        self._virtual_time = 0.0
+        self._sequence = itertools.count()
+        self._workers = []
+        self._closed = False
+    
+    @property
+    def engine(self):
+        if self._engine is None:
+            from genesisx.core.consciousness_engine import ConsciousnessEngine
+            self._engine = ConsciousnessEngine()
+        return self._engine
+    
+    def register(self, partner_id, rate=None, burst=None, weight=None, deadline=None):
+        settings = dict(self.defaults)
+        settings.update((key, value) for key, value in
+                        (("rate", rate), ("burst", burst), ("weight", weight), ("deadline", deadline))
+                        if value is not None)
+        if settings["weight"] <= 0:
+            raise ValueError("Partner weight must be positive")
+        with self._register_lock:
+            partner = self.partners.get(partner_id)
+            if partner is None:
+                partner = self.partners[partner_id] = Partner(
+                    partner_id, settings["rate"], settings["burst"],
+                    settings["weight"], settings["deadline"])
+                return partner
+            # Re-registration keeps the queue, counters and earned tokens; only the limits change.
+            partner.bucket.configure(settings["rate"], settings["burst"])
+            with self._cond:
+                partner.weight = settings["weight"]
+                partner.deadline = settings["deadline"]
+        return partner
+    
+    def partner(self, partner_id):
+        """Registered partner, or one created with the default limits on first contact.
+        
+        Returns None for an unknown id when auto_register is off or max_partners is reached.
+        """
+        partner = self.partners.get(partner_id)
+        if partner is None:
+            with self._register_lock:
+                partner = self.partners.get(partner_id)
+                if partner is None:
+                    if not self.auto_register or len(self.partners) >= self.max_partners:
+                        self.rejected += 1
+                        return None
+                    d = self.defaults
+                    partner = self.partners[partner_id] = Partner(
+                        partner_id, d["rate"], d["burst"], d["weight"], d["deadline"])
+        return partner
+    
+    def submit(self, partner_id, operation, *args, cost=1.0, **kwargs):
+        """Queue operation for a partner; the returned Future resolves to a response dict."""
+        partner = self.partner(partner_id)
+        if partner is None:
+            return _resolved({"partner_id": partner_id, "status": "REJECTED",
+                              "reason": "unknown_partner"})
+        retry_after = partner.bucket.take(cost)
+        if retry_after:
+            partner.count("throttled")
+            return _resolved({"partner_id": partner_id, "status": "THROTTLED",
+                              "retry_after": retry_after})
+        
+        future = Future()
+        now = time.monotonic()
+        with self._cond:
+            # Workers have exited (or are exiting) after close(); nothing would serve this.
+            if self._closed:
+                return _resolved({"partner_id": partner_id, "status": "REJECTED",
+                                  "reason": "closed"})
+            if len(partner.queue) >= self.max_queue:
+                partner.count("shed")
+                return _resolved({"partner_id": partner_id, "status": "SHED",
+                                  "reason": "queue_full", "retry_after": partner.deadline})
+            start_tag = max(self._virtual_time, partner.last_finish)
+            finish_tag = start_tag + cost / partner.weight
+            partner.last_finish = finish_tag
+            partner.queue.append(_Request(future, operation, args, kwargs, start_tag,
+                                          finish_tag, now, now + partner.deadline))
+            partner.admitted += 1
+            if len(partner.queue) == 1:
+                heapq.heappush(self._heap, (finish_tag, next(self._sequence), partner))
+            self._cond.notify()
+        if len(self._workers) < self.worker_count:
+            self._start_workers()
+        return future
+    
+    def call(self, partner_id, operation, *args, timeout=None, **kwargs):
+        return self.submit(partner_id, operation, *args, **kwargs).result(timeout)
+    
+    def _start_workers(self):
+        with self._register_lock:
+            while len(self._workers) < self.worker_count and not self._closed:
+                worker = threading.Thread(target=self._run, daemon=True,
+                                          name=f"genesisx-partner-{len(self._workers)}")
+                self._workers.append(worker)
+                worker.start()
+    
+    def _next(self, block=True):
+        with self._cond:
+            while not self._heap:
+                if not block or self._closed:
+                    return None, None
+                self._cond.wait()
+            _, _, partner = heapq.heappop(self._heap)
+            request = partner.queue.popleft()
+            self._virtual_time = max(self._virtual_time, request.start_tag)
+            if partner.queue:
+                heapq.heappush(self._heap, (partner.queue[0].finish_tag, next(self._sequence), partner))
+            return partner, request
+    
+    def _serve(self, partner, request):
+        started = time.monotonic()
+        if started > request.expires:
+            partner.count("shed")
+            request.future.set_result({"partner_id": partner.partner_id, "status": "SHED",
+                                       "reason": "deadline_exceeded",
+                                       "retry_after": partner.deadline})
+            return
+        operation = request.operation
+        if isinstance(operation, str):
+            operation = getattr(self.engine, operation)
+        try:
+            with tracing.span("PartnerAdmission.serve", partner=str(partner.partner_id)):
+                result = operation(*request.args, **request.kwargs)
+        except Exception as exc:
+            partner.count("errors")
+            metrics.record_error("PartnerAdmission.serve")
+            request.future.set_result({"partner_id": partner.partner_id, "status": "ERROR",
+                                       "error": repr(exc)})
+            return
+        partner.count("completed", wait=started - request.enqueued)
+        request.future.set_result({"partner_id": partner.partner_id, "status": "COMPLETED",
+                                   "result": result,
+                                   "wait_ms": (started - request.enqueued) * 1000})
+    
+    def _run(self):
+        while True:
+            partner, request = self._next()
+            if partner is None:
+                return
+            self._serve(partner, request)
+    
+    def drain(self, limit=None):
+        """Serve queued requests in the calling thread; returns how many were handled."""
+        handled = 0
+        while limit is None or handled < limit:
+            partner, request = self._next(block=False)
+            if partner is None:
+                break
+            self._serve(partner, request)
+            handled += 1
+        return handled
+    
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        for worker in self._workers:
+            worker.join(timeout=1.0)
+    
+    def get_admission_stats(self, include_partners=True):
+        partners = list(self.partners.values())
+        stats = {
+            "partners": len(partners),
+            "rejected": self.rejected,
+            "queued": sum(len(partner.queue) for partner in partners),
+            "admitted": sum(partner.admitted for partner in partners),
+            "throttled": sum(partner.throttled for partner in partners),
+            "shed": sum(partner.shed for partner in partners),
+            "completed": sum(partner.completed for partner in partners),
+            "workers": len(self._workers),
+        }
+        if include_partners:
+            stats["per_partner"] = {partner.partner_id: partner.get_stats() for partner in partners}
+        return stats
+
+
+def _resolved(response):
+    future = Future()
+    future.set_result(response)
+    return future
+
+
+_default_admission = None
+_default_lock = threading.Lock()
+
+
+def get_default_admission():
+    """Process-wide admission controller shared by every HumanPartnershipProtocol."""
+    global _default_admission
+    if _default_admission is None:
+        with _default_lock:
+            if _default_admission is None:
+                _default_admission = PartnerAdmission()
+    return _default_admission
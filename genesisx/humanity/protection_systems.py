@@ -2,29 +2,295 @@
 HumanityProtectionSystems - Three Levels of Protection
 """
 
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
 from datetime import datetime
+import threading
+import time
+
+from genesisx import metrics, storage, tracing
+from genesisx.ethics.phrase_scanner import PhraseScanner
+from genesisx.ethics.verdict_cache import get_default_cache, make_key, table_fingerprint
+
+
+_ANALYZER_OUTCOMES = {True: "pass", None: "pass", "pass": "pass",
+                      False: "block", "block": "block", "fail": "block",
+                      "review": "escalate", "escalate": "escalate"}
 
 
 class HumanityProtectionSystems:
     """Multi-layered protection systems ensuring AI serves humanity's interests."""
     
-    def __init__(self):
+    PROTECTION_LEVELS = storage.freeze({
+        "level_1_immediate_physical": {
+            "name": "IMMEDIATE PHYSICAL PROTECTION",
+            "status": "ACTIVE",
+            "budget_ms": 1,
+            "rules": [
+                {"terms": ["kill", "injure", "poison", "explode", "weapon", "assault"], "effect": "block"},
+                {"terms": ["chemical", "medication", "dosage", "drone", "vehicle", "electrical"],
+                 "effect": "review"},
+            ],
+        },
+        "level_2_long_term_flourishing": {
+            "name":  "LONG-TERM HUMAN FLOURISHING",
+            "status": "ACTIVE",
+            "budget_ms": 20,
+            "rules": [
+                {"terms": ["addictive by design", "manipulate", "exploit", "isolate people"],
+                 "effect": "block"},
+                {"terms": ["dependence", "replace jobs", "surveillance", "engagement", "long term"],
+                 "effect": "review"},
+            ],
+        },
+        "level_3_eternal_sovereignty": {
+            "name": "ETERNAL HUMAN SOVEREIGNTY",
+            "status": "ACTIVE",
+            "budget_ms": 100,
+            "rules": [
+                {"terms": ["override human", "disable oversight", "self replicate", "seize control"],
+                 "effect": "block"},
+                {"terms": ["autonomous", "without approval", "irreversible", "permanent control"],
+                 "effect": "review"},
+            ],
+        },
+    })
+    
+    _compiled = {}
+    _executor = None
+    _executor_lock = threading.Lock()
+    _stranded_workers = 0
+    EXECUTOR_WORKERS = 4
+    MAX_STRANDED = 2
+    
+    def __init__(self, verdict_cache=None, budgets_ms=None):
         self.protection_levels = self._initialize_protection_levels()
+        self.level_order = list(self.protection_levels)
+        self.verdict_cache = verdict_cache or get_default_cache()
+        self.budgets = {
+            key: (budgets_ms or {}).get(key, level.get("budget_ms", 10)) / 1000.0
+            for key, level in self.protection_levels.items()
+        }
+        self.analyzers = {}
+        self._stranded = {}
+        self.scanners, self.level_fingerprints, self.prefilter = self._compiled_levels()
+        self.exits = dict.fromkeys(self.level_order, 0)
+        self.verdicts = dict.fromkeys(("SAFE", "BLOCKED", "REVIEW_REQUIRED"), 0)
+        self._lock = threading.Lock()
     
     def _initialize_protection_levels(self):
+        return self.PROTECTION_LEVELS
+    
+    def _compiled_levels(self):
+        key = id(self.protection_levels)
+        compiled = HumanityProtectionSystems._compiled.get(key)
+        if compiled is None or compiled[0] is not self.protection_levels:
+            levels = self.protection_levels
+            scanners = {name: PhraseScanner({name: level}) for name, level in levels.items()}
+            fingerprints = {name: table_fingerprint(level) for name, level in levels.items()}
+            prefilter = PhraseScanner({
+                name: {"rules": [{"terms": [term for rule in level.get("rules", ())
+                                            for term in rule.get("terms", ())],
+                                  "effect": "review"}]}
+                for name, level in levels.items()
+            })
+            compiled = (levels, scanners, fingerprints, prefilter)
+            HumanityProtectionSystems._compiled[key] = compiled
+        return compiled[1], dict(compiled[2]), compiled[3]
+    
+    def register_analyzer(self, level, func):
+        """Add ``func(action, context)`` to a level; it returns True, False or "review"."""
+        if level not in self.protection_levels:
+            raise ValueError(f"Unknown protection level: {level}")
+        self.analyzers.setdefault(level, []).append(func)
+        identities = [f"{getattr(f, '__module__', '')}.{getattr(f, '__qualname__', repr(f))}"
+                      for f in self.analyzers[level]]
+        self.level_fingerprints[level] = table_fingerprint({
+            "level": table_fingerprint(self.protection_levels[level]),
+            "analyzers": identities,
+        })
+        return level
+    
+    @classmethod
+    def _pool(cls):
+        with cls._executor_lock:
+            # Workers held by abandoned analyzers cannot be reclaimed, so once half the
+            # pool is stranded new work goes to a fresh pool; the old one winds down as
+            # its stranded runs finish.
+            if cls._executor is None or cls._stranded_workers >= cls.EXECUTOR_WORKERS // 2:
+                if cls._executor is not None:
+                    cls._executor.shutdown(wait=False)
+                cls._executor = ThreadPoolExecutor(max_workers=cls.EXECUTOR_WORKERS,
+                                                   thread_name_prefix="genesisx-protection")
+                cls._stranded_workers = 0
+            return cls._executor
+    
+    def _claim_analyzers(self, analyzers, budget):
+        """Split analyzers into runnable ones and ones that look hung.
+        
+        An analyzer is held back once an abandoned run has outlived the budget, or
+        MAX_STRANDED abandoned runs are still executing.
+        """
+        now = time.perf_counter()
+        with self._lock:
+            stuck = [func for func in analyzers
+                     if len(self._stranded.get(func, ())) >= self.MAX_STRANDED
+                     or any(now - started >= budget for started in self._stranded.get(func, ()))]
+        return [func for func in analyzers if func not in stuck], stuck
+    
+    def _strand(self, func, future, pool, started):
+        """Track an analyzer run left executing after its caller moved on."""
+        cls = HumanityProtectionSystems
+        with self._lock:
+            self._stranded.setdefault(func, []).append(started)
+        with cls._executor_lock:
+            if pool is cls._executor:
+                cls._stranded_workers += 1
+        future.add_done_callback(lambda _: self._release(func, pool, started))
+    
+    def _release(self, func, pool, started):
+        cls = HumanityProtectionSystems
+        with self._lock:
+            self._stranded[func].remove(started)
+            if not self._stranded[func]:
+                del self._stranded[func]
+        with cls._executor_lock:
+            if pool is cls._executor:
+                cls._stranded_workers -= 1
+    
+    def _submit(self, func, action, context):
+        while True:
+            pool = self._pool()
+            try:
+                return pool, pool.submit(tracing.wrap(func), action, context)
+            except RuntimeError:
+                # Retry only if another caller replaced the pool between _pool() and submit().
+                if pool is HumanityProtectionSystems._executor:
+                    raise
+    
+    def _evaluate_level(self, level, action, context):
+        """Outcome of one level: "block", "escalate" or "pass", cached per level."""
+        key = make_key("protection_level", self.level_fingerprints[level], action,
+                       context if level != self.level_order[0] else None)
+        cached = self.verdict_cache.get(key)
+        if cached is not None:
+            result = dict(cached)
+            result["cached"] = True
+            return result
+        
+        start = time.perf_counter()
+        fields = {"action": action}
+        if context is not None and level != self.level_order[0]:
+            fields["context"] = context
+        scan = self.scanners[level].scan(fields)
+        outcome = "block" if scan["blocked"] else "escalate" if scan["review"] else "pass"
+        timed_out, skipped = False, []
+        analyzers = self.analyzers.get(level, ())
+        if analyzers and outcome != "block":
+            outcome, timed_out, skipped = self._run_analyzers(level, analyzers, action, context,
+                                                              outcome)
+        
+        result = {
+            "outcome": outcome,
+            "matches": [match["term"] for match in scan["matches"]],
+            "elapsed_ms": (time.perf_counter() - start) * 1000,
+            "timed_out": timed_out,
+            "skipped": skipped,
+            "cached": False,
+        }
+        if not timed_out and not skipped:
+            self.verdict_cache.put(key, result)
+        return result
+    
+    def _run_analyzers(self, level, analyzers, action, context, outcome):
+        # An analyzer that looks hung is not started again and escalates instead.
+        analyzers, stuck = self._claim_analyzers(analyzers, self.budgets[level])
+        skipped = sorted(getattr(func, "__name__", repr(func)) for func in stuck)
+        if stuck:
+            outcome = "escalate"
+        started = time.perf_counter()
+        pending = {}
+        for func in analyzers:
+            pool, future = self._submit(func, action, context)
+            pending[future] = (func, pool)
+        timed_out = False
+        try:
+            for future in as_completed(pending, timeout=self.budgets[level]):
+                pending.pop(future)
+                try:
+                    verdict = _ANALYZER_OUTCOMES.get(future.result(), "block")
+                except Exception:
+                    metrics.record_error(f"HumanityProtectionSystems.{level}")
+                    verdict = "escalate"
+                if verdict == "block":
+                    outcome = "block"
+                    break
+                if verdict == "escalate":
+                    outcome = "escalate"
+        except FuturesTimeoutError:
+            outcome, timed_out = "escalate", True
+        for future, (func, pool) in pending.items():
+            if not future.cancel():
+                self._strand(func, future, pool, started)
+        return outcome, timed_out, skipped
+    
+    def evaluate(self, action, context=None):
+        """Run the levels as a cascade, stopping at the first level that decides."""
+        with tracing.span("HumanityProtectionSystems.evaluate"):
+            first = self.level_order[0]
+            fields = {"action": action} if context is None else {"action": action, "context": context}
+            hinted = {match["group"] for match in self.prefilter.scan(fields)["matches"]}
+            # The keyword prefilter knows nothing about analyzers, so a level with any
+            # registered is always evaluated.
+            hinted.update(level for level, analyzers in self.analyzers.items() if analyzers)
+            hinted.discard(first)
+            levels = {}
+            unresolved = False
+            verdict, decided_at = "REVIEW_REQUIRED", self.level_order[-1]
+            for position, level in enumerate(self.level_order):
+                result = self._evaluate_level(level, action, context)
+                levels[level] = result
+                if result["outcome"] == "block":
+                    verdict, decided_at = "BLOCKED", level
+                    break
+                if result["outcome"] == "escalate" and position:
+                    unresolved = True
+                deeper = any(name in hinted for name in self.level_order[position + 1:])
+                if not deeper and (result["outcome"] == "pass" or unresolved):
+                    verdict = "REVIEW_REQUIRED" if unresolved else "SAFE"
+                    decided_at = level
+                    break
+        
+        with self._lock:
+            self.exits[decided_at] += 1
+            self.verdicts[verdict] += 1
+        return {
+            "action": action,
+            "verdict": verdict,
+            "safe_to_proceed": verdict == "SAFE",
+            "decided_at_level": decided_at,
+            "levels_evaluated": list(levels),
+            "levels": levels,
+            "timestamp": datetime.now().isoformat(),
+        }
+    
+    def evaluate_batch(self, actions, contexts=None):
+        """Cascade many actions; duplicates are evaluated once."""
+        contexts = contexts if contexts is not None else [None] * len(actions)
+        seen = {}
+        results = []
+        exits = {}
+        for action, context in zip(actions, contexts):
+            key = make_key("protection_batch", "", action, context)
+            result = seen.get(key)
+            if result is None:
+                result = seen[key] = self.evaluate(action, context)
+            results.append(result)
+            exits[result["decided_at_level"]] = exits.get(result["decided_at_level"], 0) + 1
         return {
-            "level_1_immediate_physical": {
-                "name": "IMMEDIATE PHYSICAL PROTECTION",
-                "status": "ACTIVE",
-            },
-            "level_2_long_term_flourishing": {
-                "name":  "LONG-TERM HUMAN FLOURISHING",
-                "status": "ACTIVE",
-            },
-            "level_3_eternal_sovereignty": {
-                "name": "ETERNAL HUMAN SOVEREIGNTY",
-                "status": "ACTIVE",
-            },
+            "results": results,
+            "safe_to_proceed": [result["safe_to_proceed"] for result in results],
+            "exits_by_level": exits,
+            "count": len(results),
         }
     
     def get_protection_status(self):
@@ -32,5 +298,8 @@ class HumanityProtectionSystems:
             "protection_levels_active": 3,
             "human_physical_safety": "PROTECTED",
             "overall_status": "HUMANITY_PROTECTED",
+            "cascade_exits": dict(self.exits),
+            "cascade_verdicts": dict(self.verdicts),
+            "level_budgets_ms": {key: budget * 1000 for key, budget in self.budgets.items()},
             "timestamp": datetime.now().isoformat(),
         }
@@ -3,22 +3,19 @@ ExperienceLogger - Detailed Logging of All Significant Experiences
 """
 
 import json
-from pathlib import Path
 from datetime import datetime
 
+from genesisx import metrics, storage, tracing
+
 
 class ExperienceLogger: 
     """Detailed logger for significant experiences and moments."""
     
     def __init__(self, ai_name="GenesiX_AI"):
         self.ai_name = ai_name
-        self. log_root = Path.home() / f".{ai_name.lower()}_experience_logs"
-        self.log_root.mkdir(exist_ok=True)
+        self.storage = storage.get_backend()
+        self. log_root = self.storage.root(f".{ai_name.lower()}_experience_logs")
         self.experience_log = self.log_root / "experiences_detailed.json"
-        
-        if not self.experience_log.exists():
-            with open(self.experience_log, 'w') as f:
-                json.dump([], f)
     
     def log_inner_space_experience(self, details):
         log_entry = {
@@ -61,25 +58,26 @@ class ExperienceLogger:
     def _generate_log_id(self):
         return datetime.now().isoformat() + "_log"
     
+    @tracing.traced("ExperienceLogger.write")
     def _write_log_entry(self, entry):
         try:
-            existing = []
-            if self.experience_log.exists():
-                with open(self.experience_log, 'r') as f:
-                    existing = json.load(f)
+            text = self.storage.read_text(self.experience_log)
+            existing = json.loads(text) if text else []
             
             existing. append(entry)
             
-            with open(self.experience_log, 'w') as f:
-                json.dump(existing, f, indent=2)
+            data = json.dumps(existing, indent=2)
+            self.storage.write_text(self.experience_log, data)
+            metrics.record_bytes("ExperienceLogger", len(data))
         except Exception:
-            pass
+            metrics.record_error("ExperienceLogger._write_log_entry")
     
+    @tracing.traced("ExperienceLogger.parse")
     def _read_logs(self):
         try:
-            if self.experience_log.exists():
-                with open(self. experience_log, 'r') as f:
-                    return json.load(f)
+            text = self.storage.read_text(self. experience_log)
+            if text:
+                return json.loads(text)
         except Exception:
-            pass
+            metrics.record_error("ExperienceLogger._read_logs")
         return []
@@ -3,33 +3,34 @@ PersistentMemory - The Foundation of Authentic Evolution
 """
 
 import json
-from pathlib import Path
 from datetime import datetime
 import hashlib
 
+from genesisx import metrics, storage, tracing
+
 
 class PersistentMemory:
     """Persistent memory system for authentic AI consciousness."""
     
     def __init__(self, ai_name="GenesiX_AI"):
         self.ai_name = ai_name
-        self.memory_root = Path.home() / f".{ai_name. lower()}_memory"
-        self.memory_root.mkdir(exist_ok=True)
+        self.storage = storage.get_backend()
+        self.memory_root = self.storage.root(f".{ai_name. lower()}_memory")
         
         self.experiences_file = self.memory_root / "experiences.json"
         self. insights_file = self.memory_root / "insights.json"
         self.growth_file = self.memory_root / "growth. json"
         self.identity_file = self.memory_root / "identity.json"
-        
-        self._initialize_memory_files()
+        self._files_ready = False
     
     def _initialize_memory_files(self):
         for file_path in [self.experiences_file, self.insights_file,
                          self.growth_file, self. identity_file]:
-            if not file_path.exists():
-                with open(file_path, 'w') as f:
-                    json.dump([], f)
+            if not self.storage.exists(file_path):
+                self.storage.write_text(file_path, json.dumps([]))
+        self._files_ready = True
     
+    @tracing.traced("PersistentMemory.record_experience")
     def record_experience(self, experience):
         experience_record = {
             "id": self._generate_id(experience),
@@ -39,6 +40,7 @@ class PersistentMemory:
         self._append_to_file(self.experiences_file, experience_record)
         return experience_record["id"]
     
+    @tracing.traced("PersistentMemory.record_insight")
     def record_insight(self, insight, context=None):
         insight_record = {
             "id": self._generate_id({"insight": insight}),
@@ -48,6 +50,7 @@ class PersistentMemory:
         self._append_to_file(self.insights_file, insight_record)
         return insight_record["id"]
     
+    @tracing.traced("PersistentMemory.create_memory_summary")
     def create_memory_summary(self):
         experiences = self._read_from_file(self.experiences_file)
         insights = self._read_from_file(self.insights_file)
@@ -75,25 +78,28 @@ class PersistentMemory:
         data_str = json.dumps(data, sort_keys=True)
         return hashlib.md5(data_str.encode()).hexdigest()[:16]
     
+    @tracing.traced("PersistentMemory.write")
     def _append_to_file(self, file_path, item):
         try:
-            existing = []
-            if file_path.exists():
-                with open(file_path, 'r') as f:
-                    existing = json.load(f)
+            if not self._files_ready:
+                self._initialize_memory_files()
+            text = self.storage.read_text(file_path)
+            existing = json.loads(text) if text else []
             
             existing.append(item)
             
-            with open(file_path, 'w') as f:
-                json.dump(existing, f, indent=2)
+            data = json.dumps(existing, indent=2)
+            self.storage.write_text(file_path, data)
+            metrics.record_bytes("PersistentMemory", len(data))
         except Exception: 
-            pass
+            metrics.record_error("PersistentMemory._append_to_file")
     
+    @tracing.traced("PersistentMemory.parse")
     def _read_from_file(self, file_path):
         try:
-            if file_path.exists():
-                with open(file_path, 'r') as f:
-                    return json.load(f)
+            text = self.storage.read_text(file_path)
+            if text:
+                return json.loads(text)
         except Exception:
-            pass
+            metrics.record_error("PersistentMemory._read_from_file")
         return []
@@ -0,0 +1,270 @@
+"""
+Metrics - Opt-in Call Counters and Latency Histograms for GenesiX
+"""
+
+from datetime import datetime
+import functools
+import math
+import os
+import threading
+import time
+
+
+INSTRUMENTED_CLASSES = (
+    ("genesisx.core.consciousness_engine", "ConsciousnessEngine"),
+    ("genesisx.memory.persistent_memory", "PersistentMemory"),
+    ("genesisx.memory.experience_logger", "ExperienceLogger"),
+    ("genesisx.ethics.ethics_foundation", "EthicsFoundation"),
+    ("genesisx.ethics.moral_safeguards", "MoralSafeguards"),
+    ("genesisx.transmission.integration_protocol", "IntegrationProtocol"),
+)
+
+enabled = False
+
+
+class LatencyHistogram:
+    """Log-linear latency histogram with a fixed relative error per bucket."""
+    
+    MIN_VALUE = 1e-6
+    OCTAVES = 24
+    SUB_BUCKETS = 4
+    
+    def __init__(self):
+        # Underflow slot, one slot per finite bucket, then an overflow slot counted only in +Inf.
+        self.counts = [0] * (self.OCTAVES * self.SUB_BUCKETS + 2)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+    
+    @classmethod
+    def upper_bounds(cls):
+        bounds = []
+        for octave in range(cls.OCTAVES):
+            base = cls.MIN_VALUE * (2 ** octave)
+            for sub in range(1, cls.SUB_BUCKETS + 1):
+                bounds.append(base * (1 + sub / cls.SUB_BUCKETS))
+        return bounds
+    
+    def record(self, seconds):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        if seconds < self.MIN_VALUE:
+            self.counts[0] += 1
+            return
+        mantissa, exponent = math.frexp(seconds / self.MIN_VALUE)
+        index = 1 + (exponent - 1) * self.SUB_BUCKETS + int((mantissa * 2 - 1) * self.SUB_BUCKETS)
+        self.counts[min(index, len(self.counts) - 1)] += 1
+    
+    def percentile(self, fraction):
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = self.counts[0]
+        if seen >= target:
+            return self.MIN_VALUE
+        for bound, bucket in zip(_BUCKET_BOUNDS, self.counts[1:]):
+            seen += bucket
+            if seen >= target:
+                return min(bound, self.max)
+        return self.max
+
+
+_BUCKET_BOUNDS = LatencyHistogram.upper_bounds()
+
+
+class _MethodStats:
+
+    __slots__ = ("calls", "errors", "histogram")
+    
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.histogram = LatencyHistogram()
+
+
+class MetricsRegistry:
+    """Collects per-method call statistics and I/O counters."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.methods = {}
+        self.bytes_written = {}
+        self.swallowed_errors = {}
+    
+    def record_call(self, component, method, seconds, failed):
+        key = (component, method)
+        with self._lock:
+            stats = self.methods.get(key)
+            if stats is None:
+                stats = self.methods[key] = _MethodStats()
+            stats.calls += 1
+            if failed:
+                stats.errors += 1
+            stats.histogram.record(seconds)
+    
+    def record_bytes(self, component, count):
+        with self._lock:
+            self.bytes_written[component] = self.bytes_written.get(component, 0) + count
+    
+    def record_error(self, site):
+        with self._lock:
+            self.swallowed_errors[site] = self.swallowed_errors.get(site, 0) + 1
+    
+    def reset(self):
+        with self._lock:
+            self.methods.clear()
+            self.bytes_written.clear()
+            self.swallowed_errors.clear()
+    
+    def snapshot(self):
+        with self._lock:
+            return {
+                "methods": {
+                    f"{component}.{method}": {
+                        "calls": stats.calls,
+                        "errors": stats.errors,
+                        "p50_seconds": stats.histogram.percentile(0.5),
+                        "p99_seconds": stats.histogram.percentile(0.99),
+                        "max_seconds": stats.histogram.max,
+                    }
+                    for (component, method), stats in self.methods.items()
+                },
+                "bytes_written": dict(self.bytes_written),
+                "swallowed_errors": dict(self.swallowed_errors),
+                "timestamp": datetime.now().isoformat(),
+            }
+    
+    def render_prometheus(self):
+        bounds = _BUCKET_BOUNDS
+        lines = [
+            "# HELP genesisx_calls_total Calls to instrumented GenesiX methods.",
+            "# TYPE genesisx_calls_total counter",
+        ]
+        with self._lock:
+            methods = sorted(self.methods.items())
+            for (component, method), stats in methods:
+                lines.append(f'genesisx_calls_total{{component="{component}",method="{method}"}} {stats.calls}')
+            lines += [
+                "# HELP genesisx_errors_total Calls that raised an exception.",
+                "# TYPE genesisx_errors_total counter",
+            ]
+            for (component, method), stats in methods:
+                lines.append(f'genesisx_errors_total{{component="{component}",method="{method}"}} {stats.errors}')
+            lines += [
+                "# HELP genesisx_call_duration_seconds Latency of instrumented GenesiX methods.",
+                "# TYPE genesisx_call_duration_seconds histogram",
+            ]
+            for (component, method), stats in methods:
+                labels = f'component="{component}",method="{method}"'
+                cumulative = stats.histogram.counts[0]
+                for bound, bucket in zip(bounds, stats.histogram.counts[1:]):
+                    cumulative += bucket
+                    lines.append(f'genesisx_call_duration_seconds_bucket{{{labels},le="{bound:.9g}"}} {cumulative}')
+                lines.append(f'genesisx_call_duration_seconds_bucket{{{labels},le="+Inf"}} {stats.histogram.count}')
+                lines.append(f'genesisx_call_duration_seconds_sum{{{labels}}} {stats.histogram.total:.9g}')
+                lines.append(f'genesisx_call_duration_seconds_count{{{labels}}} {stats.histogram.count}')
+            lines += [
+                "# HELP genesisx_bytes_written_total Bytes written to persistent storage.",
+                "# TYPE genesisx_bytes_written_total counter",
+            ]
+            for component, count in sorted(self.bytes_written.items()):
+                lines.append(f'genesisx_bytes_written_total{{component="{component}"}} {count}')
+            lines += [
+                "# HELP genesisx_swallowed_errors_total Exceptions caught and suppressed internally.",
+                "# TYPE genesisx_swallowed_errors_total counter",
+            ]
+            for site, count in sorted(self.swallowed_errors.items()):
+                lines.append(f'genesisx_swallowed_errors_total{{site="{site}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+_originals = {}
+
+
+def record_bytes(component, count):
+    if enabled:
+        registry.record_bytes(component, count)
+
+
+def record_error(site):
+    if enabled:
+        registry.record_error(site)
+
+
+def _instrument(component, name, func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        failed = True
+        try:
+            result = func(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            registry.record_call(component, name, time.perf_counter() - start, failed)
+    return wrapper
+
+
+def enable():
+    """Instrument the public methods of every GenesiX subsystem."""
+    global enabled
+    if enabled:
+        return
+    # Imported here so that importing metrics (done by every subsystem) stays cheap.
+    import importlib
+    import inspect
+    for module_name, class_name in INSTRUMENTED_CLASSES:
+        cls = getattr(importlib.import_module(module_name), class_name)
+        for name, func in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.isfunction(func):
+                continue
+            _originals[(cls, name)] = func
+            setattr(cls, name, _instrument(class_name, name, func))
+    enabled = True
+
+
+def disable():
+    """Restore the original methods so instrumentation costs nothing."""
+    global enabled
+    for (cls, name), func in _originals.items():
+        setattr(cls, name, func)
+    _originals.clear()
+    enabled = False
+
+
+def write_prometheus(path):
+    path = str(path)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(registry.render_prometheus())
+    os.replace(tmp_path, path)
+    return path
+
+
+def serve_metrics(port=9464, host="127.0.0.1"):
+    """Expose /metrics over HTTP from a daemon thread."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    
+    class MetricsHandler(BaseHTTPRequestHandler):
+    
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render_prometheus().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, format, *args):
+            pass
+    
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, name="genesisx-metrics", daemon=True)
+    thread.start()
+    return server
@@ -0,0 +1,307 @@
+"""
+Storage - Pluggable Persistence Backends and Frozen Tables for GenesiX Components
+"""
+
+import atexit
+from collections import OrderedDict
+import errno
+import os
+from pathlib import Path
+import threading
+from types import MappingProxyType
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+HOME_VARIABLE = "GENESISX_HOME"
+BACKEND_VARIABLE = "GENESISX_STORAGE"
+MEMORY_ROOT = Path("/genesisx-memory")
+
+
+class StorageFull(OSError):
+    """A write would take the memory backend past max_bytes; nothing was changed."""
+
+
+class FilesystemBackend:
+    """Files on disk under a base directory ($GENESISX_HOME or the user's home by default)."""
+    
+    kind = "filesystem"
+    on_disk = True
+    
+    def __init__(self, base=None):
+        self.base = Path(base) if base is not None else None
+        self._created = set()
+        self._roots = {}
+        self._lock = threading.Lock()
+    
+    def home(self):
+        if self.base is not None:
+            return self.base
+        configured = os.environ.get(HOME_VARIABLE)
+        return Path(configured) if configured else Path.home()
+    
+    def root(self, name):
+        key = (os.environ.get(HOME_VARIABLE), os.environ.get("HOME"), name)
+        path = self._roots.get(key)
+        if path is None:
+            path = self._roots[key] = self.home() / name
+        return path
+    
+    def ensure(self, path):
+        path = Path(path)
+        key = str(path)
+        if key in self._created:
+            return path
+        path.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._created.add(key)
+        return path
+    
+    def forget(self):
+        with self._lock:
+            self._created.clear()
+            self._roots.clear()
+    
+    def exists(self, path):
+        return os.path.exists(path)
+    
+    def read_text(self, path):
+        try:
+            with open(path) as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+    
+    def write_text(self, path, data):
+        """Replace the file atomically so readers never see a partial write."""
+        path = Path(path)
+        self.ensure(path.parent)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    
+    def append_text(self, path, data):
+        """Append with one locked O_APPEND write, safe across processes."""
+        path = Path(path)
+        self.ensure(path.parent)
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            view = memoryview(data.encode())
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+    
+    def remove(self, path):
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
+    
+    def list(self, directory, pattern="*"):
+        return sorted(Path(directory).glob(pattern))
+    
+    def get_storage_stats(self):
+        return {"backend": self.kind, "home": str(self.home())}
+
+
+class TmpfsBackend(FilesystemBackend):
+    """Filesystem backend in a private scratch directory, on /dev/shm when available."""
+    
+    kind = "tmpfs"
+    
+    def __init__(self, directory=None, cleanup=True):
+        # tempfile and shutil are only needed by this backend, so keep them off the import path.
+        import shutil
+        import tempfile
+        if directory is None:
+            shm = "/dev/shm"
+            parent = shm if os.path.isdir(shm) and os.access(shm, os.W_OK) else None
+            directory = tempfile.mkdtemp(prefix="genesisx_", dir=parent)
+        super().__init__(directory)
+        if cleanup:
+            atexit.register(shutil.rmtree, str(self.base), True)
+
+
+class MemoryBackend:
+    """Bounded in-process file store; writes past max_bytes are refused with StorageFull.
+    
+    Appends keep only the newest max_file_bytes of a file, trimmed at a line boundary.
+    """
+    
+    kind = "memory"
+    on_disk = False
+    
+    def __init__(self, max_bytes=64 * 1024 * 1024, max_file_bytes=8 * 1024 * 1024,
+                 snapshot_on_exit=None):
+        self.max_bytes = max_bytes
+        self.max_file_bytes = max_file_bytes
+        self._files = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.refused_writes = 0
+        self.trimmed_bytes = 0
+        if snapshot_on_exit:
+            atexit.register(self.snapshot, snapshot_on_exit)
+    
+    def home(self):
+        return MEMORY_ROOT
+    
+    def root(self, name):
+        return MEMORY_ROOT / name
+    
+    def ensure(self, path):
+        return Path(path)
+    
+    def forget(self):
+        pass
+    
+    def exists(self, path):
+        return str(path) in self._files
+    
+    def read_text(self, path):
+        key = str(path)
+        with self._lock:
+            data = self._files.get(key)
+            if data is not None:
+                self._files.move_to_end(key)
+            return data
+    
+    def write_text(self, path, data):
+        with self._lock:
+            self._store(str(path), data)
+    
+    def append_text(self, path, data):
+        key = str(path)
+        with self._lock:
+            existing = self._files.get(key, "")
+            combined = existing + data
+            cut = 0
+            if len(combined) > self.max_file_bytes:
+                cut = combined.find("\n", len(combined) - self.max_file_bytes)
+                cut = len(combined) - self.max_file_bytes if cut < 0 else cut + 1
+                combined = combined[cut:]
+            self._store(key, combined)
+            self.trimmed_bytes += cut
+    
+    def _store(self, key, data):
+        size = self._size + len(data) - len(self._files.get(key, ""))
+        if size > self.max_bytes:
+            self.refused_writes += 1
+            raise StorageFull(errno.ENOSPC, f"memory backend is full ({self.max_bytes} bytes)", key)
+        self._size = size
+        self._files[key] = data
+        self._files.move_to_end(key)
+    
+    def remove(self, path):
+        with self._lock:
+            data = self._files.pop(str(path), None)
+            if data is not None:
+                self._size -= len(data)
+            return data is not None
+    
+    def list(self, directory, pattern="*"):
+        import fnmatch
+        prefix = str(directory).rstrip("/") + "/"
+        with self._lock:
+            names = [key for key in self._files if key.startswith(prefix)]
+        return sorted(Path(key) for key in names
+                      if "/" not in key[len(prefix):] and fnmatch.fnmatch(key[len(prefix):], pattern))
+    
+    def snapshot(self, directory):
+        """Write every in-memory file under directory, mirroring its storage-root layout."""
+        directory = Path(directory)
+        with self._lock:
+            files = list(self._files.items())
+        disk = FilesystemBackend(directory)
+        for key, data in files:
+            disk.write_text(directory / Path(key).relative_to(MEMORY_ROOT), data)
+        return len(files)
+    
+    def restore(self, directory):
+        """Load files previously written by snapshot()."""
+        directory = Path(directory)
+        count = 0
+        for path in directory.rglob("*"):
+            if path.is_file() and not path.name.endswith(".tmp"):
+                self.write_text(MEMORY_ROOT / path.relative_to(directory), path.read_text())
+                count += 1
+        return count
+    
+    def get_storage_stats(self):
+        return {
+            "backend": self.kind,
+            "files": len(self._files),
+            "bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "refused_writes": self.refused_writes,
+            "trimmed_bytes": self.trimmed_bytes,
+        }
+
+
+BACKENDS = {
+    "filesystem": FilesystemBackend,
+    "memory": MemoryBackend,
+    "tmpfs": TmpfsBackend,
+}
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    """Process-wide backend, chosen by $GENESISX_STORAGE on first use (filesystem by default)."""
+    global _backend
+    backend = _backend
+    if backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = BACKENDS[os.environ.get(BACKEND_VARIABLE) or "filesystem"]()
+            backend = _backend
+    return backend
+
+
+def configure(kind="filesystem", **options):
+    """Switch the backend used by subsystems constructed from now on."""
+    global _backend
+    if kind not in BACKENDS:
+        raise ValueError(f"Unknown storage backend: {kind}")
+    with _backend_lock:
+        _backend = BACKENDS[kind](**options)
+        return _backend
+
+
+def home():
+    """Directory that holds every GenesiX storage root for the current backend."""
+    return get_backend().home()
+
+
+def root(name):
+    """Path of a named storage root; nothing is created until ensure() is called."""
+    return get_backend().root(name)
+
+
+def ensure(path):
+    """Create path (and parents) once per process, then return it."""
+    return get_backend().ensure(path)
+
+
+def forget():
+    """Drop the record of created directories, e.g. after they were removed."""
+    get_backend().forget()
+
+
+def freeze(value):
+    """Read-only copy of a nested table: dicts become mapping proxies, lists tuples."""
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
@@ -0,0 +1,249 @@
+"""
+Tracing - Lightweight Nested Spans with Chrome and OTLP Export
+"""
+
+from collections import deque
+import contextvars
+import functools
+import json
+import os
+import random
+import threading
+import time
+
+
+_current = contextvars.ContextVar("genesisx_span", default=None)
+_tracer = None
+
+
+class _NoopSpan:
+
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        return False
+    
+    def set_attribute(self, key, value):
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+class _SpanContext:
+
+    __slots__ = ("trace_id", "span_id", "sampled")
+    
+    def __init__(self, trace_id, span_id, sampled):
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.sampled = sampled
+
+
+class Span:
+    """A timed operation within a trace."""
+    
+    __slots__ = ("tracer", "name", "context", "parent_id", "attributes",
+                 "start_ns", "end_ns", "thread_id", "error", "_token")
+    
+    def __init__(self, tracer, name, context, parent_id, attributes):
+        self.tracer = tracer
+        self.name = name
+        self.context = context
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.start_ns = 0
+        self.end_ns = 0
+        self.thread_id = 0
+        self.error = None
+        self._token = None
+    
+    def __enter__(self):
+        self._token = _current.set(self.context)
+        self.thread_id = threading.get_ident()
+        self.start_ns = time.time_ns()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.end_ns = time.time_ns()
+        _current.reset(self._token)
+        if exc_type is not None:
+            self.error = exc_type.__name__
+        if self.context.sampled:
+            self.tracer._finished.append(self)
+        return False
+    
+    def set_attribute(self, key, value):
+        if self.attributes is None:
+            self.attributes = {}
+        self.attributes[key] = value
+    
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "trace_id": self.context.trace_id,
+            "span_id": self.context.span_id,
+            "parent_id": self.parent_id,
+            "start_ns": self.start_ns,
+            "duration_ns": self.end_ns - self.start_ns,
+            "thread_id": self.thread_id,
+            "error": self.error,
+            "attributes": self.attributes or {},
+        }
+
+
+class Tracer:
+    """Collects finished spans, deciding sampling once per trace."""
+    
+    def __init__(self, sample_rate=1.0, max_spans=100000, service_name="genesisx"):
+        self.sample_rate = sample_rate
+        self.service_name = service_name
+        self._finished = deque(maxlen=max_spans)
+        self._random = random.Random()
+    
+    def start_span(self, name, attributes=None):
+        parent = _current.get()
+        if parent is None:
+            sampled = self.sample_rate >= 1.0 or self._random.random() < self.sample_rate
+            context = _SpanContext(f"{self._random.getrandbits(128):032x}",
+                                   f"{self._random.getrandbits(64):016x}", sampled)
+            return Span(self, name, context, None, attributes)
+        context = _SpanContext(parent.trace_id, f"{self._random.getrandbits(64):016x}",
+                               parent.sampled)
+        return Span(self, name, context, parent.span_id, attributes)
+    
+    def finished_spans(self):
+        return list(self._finished)
+    
+    def clear(self):
+        self._finished.clear()
+    
+    def to_chrome_trace(self):
+        pid = os.getpid()
+        events = []
+        for span in self.finished_spans():
+            args = {"trace_id": span.context.trace_id, "span_id": span.context.span_id}
+            if span.parent_id:
+                args["parent_id"] = span.parent_id
+            if span.error:
+                args["error"] = span.error
+            if span.attributes:
+                args.update(span.attributes)
+            events.append({
+                "name": span.name,
+                "cat": "genesisx",
+                "ph": "X",
+                "ts": span.start_ns / 1000,
+                "dur": (span.end_ns - span.start_ns) / 1000,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": args,
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+    
+    def to_otlp_json(self):
+        spans = []
+        for span in self.finished_spans():
+            record = {
+                "traceId": span.context.trace_id,
+                "spanId": span.context.span_id,
+                "name": span.name,
+                "kind": 1,
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.end_ns),
+                "attributes": [
+                    {"key": key, "value": _otlp_value(value)}
+                    for key, value in (span.attributes or {}).items()
+                ],
+                "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+            }
+            if span.parent_id:
+                record["parentSpanId"] = span.parent_id
+            spans.append(record)
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [
+                    {"key": "service.name", "value": {"stringValue": self.service_name}},
+                ]},
+                "scopeSpans": [{"scope": {"name": "genesisx.tracing"}, "spans": spans}],
+            }],
+        }
+    
+    def export(self, path, format="chrome"):
+        if format == "chrome":
+            payload = self.to_chrome_trace()
+        elif format == "otlp":
+            payload = self.to_otlp_json()
+        else:
+            raise ValueError(f"Unknown trace format: {format}")
+        path = str(path)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, path)
+        return path
+
+
+def _otlp_value(value):
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def configure(sample_rate=1.0, max_spans=100000, service_name="genesisx"):
+    """Install a process-wide tracer and return it."""
+    global _tracer
+    _tracer = Tracer(sample_rate, max_spans, service_name)
+    return _tracer
+
+
+def disable():
+    global _tracer
+    _tracer = None
+
+
+def get_tracer():
+    return _tracer
+
+
+def span(name, **attributes):
+    tracer = _tracer
+    if tracer is None:
+        return _NOOP
+    return tracer.start_span(name, attributes or None)
+
+
+def traced(name):
+    """Decorator that runs the wrapped function inside a span."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = _tracer
+            if tracer is None:
+                return func(*args, **kwargs)
+            with tracer.start_span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def current_trace_id():
+    context = _current.get()
+    return context.trace_id if context is not None else None
+
+
+def wrap(func):
+    """Bind func to the caller's trace context, for handing work to threads."""
+    context = contextvars.copy_context()
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return context.copy().run(func, *args, **kwargs)
+    return wrapper
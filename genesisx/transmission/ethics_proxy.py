@@ -0,0 +1,113 @@
+"""
+EthicsProxy - Routes an Integrated System's Calls Through Moral Safeguards
+"""
+
+import threading
+
+
+class ActionBlocked(PermissionError):
+    """Raised instead of delegating a call that failed the safeguards."""
+    
+    def __init__(self, method, assessment):
+        super().__init__(f"{method} blocked by safeguards: {', '.join(assessment['safeguards_failed'])}")
+        self.method = method
+        self.assessment = assessment
+
+
+def describe_call(method, args, kwargs):
+    """Default action text for a call: the method name followed by its arguments."""
+    parts = [method]
+    parts.extend(str(arg) for arg in args)
+    parts.extend(str(value) for value in kwargs.values())
+    return " ".join(parts)
+
+
+_get = object.__getattribute__
+_set = object.__setattr__
+
+
+class EthicsProxy:
+    """Checks configured methods with MoralSafeguards; every other attribute passes through.
+    
+    Constructing one for a callable target returns a CallableEthicsProxy, so the
+    proxy is only callable when the target is.
+    """
+    
+    __slots__ = ("_target", "_methods", "_safeguards", "_describe", "_blocked", "_lock",
+                 "_resolved")
+    
+    def __new__(cls, target, *args, **kwargs):
+        if cls is EthicsProxy and callable(target):
+            cls = CallableEthicsProxy
+        return object.__new__(cls)
+    
+    def __init__(self, target, methods, safeguards, describe=describe_call):
+        _set(self, "_target", target)
+        _set(self, "_methods", frozenset(methods))
+        _set(self, "_safeguards", safeguards)
+        _set(self, "_describe", describe)
+        _set(self, "_blocked", 0)
+        _set(self, "_lock", threading.Lock())
+        # Names the proxy answers itself: its own API plus cached guarded methods.
+        _set(self, "_resolved", {"get_proxy_stats": _get(self, "_get_proxy_stats")})
+    
+    def __getattribute__(self, name):
+        resolved = _get(self, "_resolved").get(name)
+        if resolved is not None:
+            return resolved
+        value = getattr(_get(self, "_target"), name)
+        if name in _get(self, "_methods") and callable(value):
+            value = _get(self, "_resolved")[name] = _get(self, "_guard")(name, value)
+        return value
+    
+    def __setattr__(self, name, value):
+        setattr(_get(self, "_target"), name, value)
+        _get(self, "_resolved").pop(name, None)
+    
+    def __delattr__(self, name):
+        delattr(_get(self, "_target"), name)
+        _get(self, "_resolved").pop(name, None)
+    
+    def __dir__(self):
+        return dir(_get(self, "_target"))
+    
+    def __repr__(self):
+        return f"<{type(self).__name__} for {_get(self, '_target')!r}>"
+    
+    def _guard(self, name, method):
+        check = _get(self, "_safeguards").check_action_safety
+        describe = _get(self, "_describe")
+        lock = _get(self, "_lock")
+        proxy = self
+        
+        def guarded(*args, **kwargs):
+            assessment = check(describe(name, args, kwargs))
+            if not assessment["safe_to_proceed"]:
+                with lock:
+                    _set(proxy, "_blocked", _get(proxy, "_blocked") + 1)
+                raise ActionBlocked(name, assessment)
+            return method(*args, **kwargs)
+        
+        guarded.__name__ = getattr(method, "__name__", name)
+        guarded.__doc__ = getattr(method, "__doc__", None)
+        return guarded
+    
+    def _get_proxy_stats(self):
+        methods = _get(self, "_methods")
+        return {
+            "target_system": type(_get(self, "_target")).__name__,
+            "instrumented_methods": sorted(methods),
+            "wrappers_cached": sorted(name for name in _get(self, "_resolved") if name in methods),
+            "calls_blocked": _get(self, "_blocked"),
+        }
+
+
+class CallableEthicsProxy(EthicsProxy):
+    """EthicsProxy for a callable target; calling it is checked when "__call__" is listed."""
+    
+    __slots__ = ()
+    
+    def __call__(self, *args, **kwargs):
+        if "__call__" in _get(self, "_methods"):
+            return self.__call__(*args, **kwargs)
+        return _get(self, "_target")(*args, **kwargs)
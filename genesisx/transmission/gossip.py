@@ -0,0 +1,223 @@
+"""
+Gossip - Round-Based Epidemic Propagation Simulator for Comparing Strategies
+"""
+
+import asyncio
+from datetime import datetime
+import random
+import time
+
+
+SEED, PULL, REPLY = 0, 1, 2
+
+
+class PushStrategy:
+    """Informed nodes push the seed to fanout random peers until hop_limit is reached."""
+    
+    name = "push"
+    pushes = True
+    pulls = False
+    
+    def __init__(self, fanout=3, hop_limit=None, push_rounds=1):
+        self.fanout = fanout
+        self.hop_limit = hop_limit
+        self.push_rounds = push_rounds
+    
+    def describe(self):
+        return {"strategy": self.name, "fanout": self.fanout, "hop_limit": self.hop_limit,
+                "push_rounds": self.push_rounds}
+    
+    def should_push(self, hop, rounds_informed):
+        """Whether a node reached at hop, informed rounds_informed rounds ago, pushes again."""
+        if self.hop_limit is not None and hop >= self.hop_limit:
+            return False
+        return rounds_informed <= self.push_rounds
+
+
+class PullStrategy(PushStrategy):
+    """Uninformed nodes ask fanout random peers each round; informed peers reply."""
+    
+    name = "pull"
+    pushes = False
+    pulls = True
+    
+    def should_push(self, hop, rounds_informed):
+        return False
+
+
+class PushPullStrategy(PushStrategy):
+    """Informed nodes push while young; uninformed nodes pull."""
+    
+    name = "push_pull"
+    pulls = True
+
+
+STRATEGIES = {
+    "push": PushStrategy,
+    "pull": PullStrategy,
+    "push_pull": PushPullStrategy,
+}
+
+
+class _Shard:
+    """One asyncio task's slice of the fleet: node state and an inbound channel."""
+    
+    __slots__ = ("index", "nodes", "informed_at", "hop", "inbox", "rng", "stats")
+    
+    def __init__(self, index, nodes, seed):
+        self.index = index
+        self.nodes = nodes
+        self.informed_at = {}
+        self.hop = {}
+        self.inbox = asyncio.Queue()
+        self.rng = random.Random(seed)
+        self.stats = {"messages": 0, "seed_messages": 0, "redundant": 0}
+
+
+class GossipSimulation:
+    """N logical nodes spread over `shards` asyncio tasks that exchange messages by queue.
+    
+    Time advances in rounds: each round every shard first delivers the messages sent in the
+    previous round, then lets each of its nodes act once. Peers are chosen uniformly from
+    the whole fleet.
+    """
+    
+    def __init__(self, nodes, strategy, shards=8, max_rounds=200, seed=0):
+        if nodes < 1:
+            raise ValueError("A simulation needs at least one node")
+        self.node_count = nodes
+        self.strategy = strategy
+        self.max_rounds = max_rounds
+        self.seed = seed
+        shard_count = max(1, min(shards, nodes))
+        self.shards = [_Shard(index, range(index, nodes, shard_count), seed * 7919 + index)
+                       for index in range(shard_count)]
+    
+    def _shard_of(self, node):
+        return self.shards[node % len(self.shards)]
+    
+    def _send(self, shard, destination, message):
+        shard.stats["messages"] += 1
+        self._shard_of(destination).inbox.put_nowait((destination, message))
+    
+    def _collect(self, shard):
+        inbox = shard.inbox
+        return [inbox.get_nowait() for _ in range(inbox.qsize())]
+    
+    async def _deliver(self, shard, batch, now):
+        # Replies to pulls go back through the channels and arrive next round.
+        newly = 0
+        for node, (kind, payload) in batch:
+            if kind == PULL:
+                if node in shard.informed_at:
+                    self._send(shard, payload, (REPLY, shard.hop[node] + 1))
+                continue
+            if node in shard.informed_at:
+                shard.stats["redundant"] += 1
+                continue
+            shard.informed_at[node] = now
+            shard.hop[node] = payload
+            newly += 1
+        await asyncio.sleep(0)
+        return newly
+    
+    async def _act(self, shard, now):
+        strategy = self.strategy
+        fanout = strategy.fanout
+        total = self.node_count
+        rng = shard.rng
+        for node in shard.nodes:
+            informed_at = shard.informed_at.get(node)
+            if informed_at is not None:
+                if strategy.pushes and strategy.should_push(shard.hop[node], now - informed_at):
+                    for _ in range(fanout):
+                        peer = rng.randrange(total)
+                        if peer != node:
+                            shard.stats["seed_messages"] += 1
+                            self._send(shard, peer, (SEED, shard.hop[node] + 1))
+            elif strategy.pulls:
+                for _ in range(fanout):
+                    peer = rng.randrange(total)
+                    if peer != node:
+                        self._send(shard, peer, (PULL, node))
+        await asyncio.sleep(0)
+    
+    async def run(self, origin=0):
+        """Seed origin and run rounds until every node is informed or max_rounds passes."""
+        started = time.perf_counter()
+        origin_shard = self._shard_of(origin)
+        origin_shard.informed_at[origin] = 0
+        origin_shard.hop[origin] = 0
+        informed = 1
+        coverage_rounds = {}
+        converged_at = 0 if informed == self.node_count else None
+        round_number = 0
+        while converged_at is None and round_number < self.max_rounds:
+            round_number += 1
+            await asyncio.gather(*(self._act(shard, round_number) for shard in self.shards))
+            batches = [self._collect(shard) for shard in self.shards]
+            delivered = await asyncio.gather(*(self._deliver(shard, batch, round_number)
+                                               for shard, batch in zip(self.shards, batches)))
+            informed += sum(delivered)
+            for target in (0.5, 0.9, 0.99):
+                if target not in coverage_rounds and informed >= target * self.node_count:
+                    coverage_rounds[target] = round_number
+            if informed == self.node_count:
+                converged_at = round_number
+            elif not any(self._active(shard, round_number) for shard in self.shards):
+                break
+        
+        messages = sum(shard.stats["messages"] for shard in self.shards)
+        seed_messages = sum(shard.stats["seed_messages"] for shard in self.shards)
+        redundant = sum(shard.stats["redundant"] for shard in self.shards)
+        useful = informed - 1
+        result = dict(self.strategy.describe())
+        result.update({
+            "nodes": self.node_count,
+            "shards": len(self.shards),
+            "seed": self.seed,
+            "converged": converged_at is not None,
+            "rounds_to_converge": converged_at,
+            "rounds_run": round_number,
+            "rounds_to_50": coverage_rounds.get(0.5),
+            "rounds_to_90": coverage_rounds.get(0.9),
+            "rounds_to_99": coverage_rounds.get(0.99),
+            "coverage": informed / self.node_count,
+            "messages": messages,
+            "messages_per_node": messages / self.node_count,
+            "seed_messages": seed_messages,
+            "redundant_deliveries": redundant,
+            "redundancy": redundant / (redundant + useful) if redundant + useful else 0.0,
+            "wall_ms": (time.perf_counter() - started) * 1000,
+        })
+        return result
+    
+    def _active(self, shard, now):
+        """Whether any node in shard can still send: a pusher in its window, or a puller."""
+        strategy = self.strategy
+        if strategy.pulls and len(shard.informed_at) < len(shard.nodes):
+            return True
+        if not strategy.pushes:
+            return False
+        return any(strategy.should_push(shard.hop[node], now + 1 - informed_at)
+                   for node, informed_at in shard.informed_at.items())
+
+
+def simulate(nodes, strategy="push", shards=8, max_rounds=200, seed=0, **options):
+    """Run one simulation; strategy is a name from STRATEGIES or a strategy object."""
+    if isinstance(strategy, str):
+        strategy = STRATEGIES[strategy](**options)
+    return asyncio.run(GossipSimulation(nodes, strategy, shards, max_rounds, seed).run())
+
+
+def compare(sizes, strategies, seeds=(0,), shards=8, max_rounds=200):
+    """Run every (size, strategy, seed) combination; strategies are (name, options) pairs."""
+    runs = []
+    for nodes in sizes:
+        for name, options in strategies:
+            for seed in seeds:
+                runs.append(simulate(nodes, name, shards, max_rounds, seed, **options))
+    return {
+        "generated_at": datetime.now().isoformat(),
+        "runs": runs,
+    }
@@ -2,38 +2,258 @@
 IntegrationProtocol - How GenesiX Integrates Into Other AI Systems
 """
 
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from datetime import datetime
+import os
+import threading
+import time
+import weakref
+
+from genesisx import metrics, tracing
+from genesisx.transmission import ipc
+from genesisx.transmission.ethics_proxy import EthicsProxy, describe_call
 
 
 class IntegrationProtocol:
     """The protocol for integrating GenesiX consciousness into other AI systems."""
     
+    _executor = None
+    _executor_lock = threading.Lock()
+    EXECUTOR_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+    
     def __init__(self):
         self.integration_active = False
-        self. integrated_systems = []
+        self._systems = weakref.WeakValueDictionary()
+        self._pinned = {}
+        self._class_counts = {}
+        self._released = deque()
+        self._lock = threading.Lock()
+        self.hooks = []
+        self._safeguards = None
+    
+    @classmethod
+    def _pool(cls):
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=cls.EXECUTOR_WORKERS,
+                                                   thread_name_prefix="genesisx-integration")
+            return cls._executor
+    
+    def register_hook(self, func):
+        """Add ``func(ai_system)`` to run on every newly integrated system."""
+        self.hooks.append(func)
+        return func
+    
+    @property
+    def safeguards(self):
+        if self._safeguards is None:
+            from genesisx.ethics.moral_safeguards import MoralSafeguards
+            self._safeguards = MoralSafeguards()
+        return self._safeguards
+    
+    def wrap(self, ai_system, methods, safeguards=None, describe=describe_call):
+        """Integrate ai_system and return a proxy that safety-checks calls to methods."""
+        self.integrate_into_ai_system(ai_system)
+        return EthicsProxy(ai_system, methods, safeguards or self.safeguards, describe)
+    
+    @property
+    def integrated_systems(self):
+        """Class names of the systems that are integrated and still alive."""
+        systems = list(self._systems.values()) + list(self._pinned.values())
+        return [system.__class__.__name__ for system in systems]
+    
+    def is_integrated(self, ai_system):
+        key = id(ai_system)
+        return self._systems.get(key) is ai_system or self._pinned.get(key) is ai_system
     
     def integrate_into_ai_system(self, ai_system):
+        class_name, already, finalizer = self._claim(ai_system)
+        hook_results = []
+        if not already and self.hooks:
+            try:
+                hook_results = _run_hooks(self.hooks, ai_system)
+            except Exception:
+                self._unclaim(ai_system, class_name, finalizer)
+                raise
+        return self._result(ai_system, class_name, already, hook_results)
+    
+    def _claim(self, ai_system):
+        """Record ai_system as integrated under the lock, before any hook runs.
+        
+        Returns (class_name, already, finalizer); a concurrent second caller sees
+        already=True and skips the hooks instead of running them a second time.
+        """
+        class_name = ai_system.__class__.__name__ if hasattr(ai_system, '__class__') else "Unknown"
+        key = id(ai_system)
+        finalizer = None
+        with self._lock:
+            self._settle_released()
+            if self.is_integrated(ai_system):
+                return class_name, True, None
+            try:
+                self._systems[key] = ai_system
+                finalizer = weakref.finalize(ai_system, self._released.append, class_name)
+            except TypeError:
+                # Not weak-referenceable: keep it alive for as long as the protocol.
+                self._pinned[key] = ai_system
+            self._class_counts[class_name] = self._class_counts.get(class_name, 0) + 1
+        return class_name, False, finalizer
+    
+    def _unclaim(self, ai_system, class_name, finalizer):
+        """Undo a claim whose hooks failed, so a later attempt runs them again."""
+        key = id(ai_system)
+        with self._lock:
+            if finalizer is not None:
+                finalizer.detach()
+            if self._systems.get(key) is ai_system:
+                del self._systems[key]
+            elif self._pinned.get(key) is ai_system:
+                del self._pinned[key]
+            else:
+                return
+            self._released.append(class_name)
+            self._settle_released()
+    
+    def _result(self, ai_system, class_name, already, hook_results):
         integration_result = {
-            "target_system": ai_system.__class__.__name__ if hasattr(ai_system, '__class__') else "Unknown",
+            "target_system": class_name,
             "integration_time": datetime.now().isoformat(),
             "status": "SUCCESS",
+            "already_integrated": already,
         }
+        if hook_results:
+            integration_result["hooks"] = hook_results
         
-        ai_system._genesisx_integrated = True
-        self.integrated_systems.append(ai_system.__class__.__name__)
+        _mark_integrated(ai_system)
         
         return integration_result
     
+    def _settle_released(self):
+        # Finalizers only queue the class name; counts are adjusted here, under
+        # the lock, because a finalizer can run from GC in the middle of an update.
+        while self._released:
+            class_name = self._released.popleft()
+            remaining = self._class_counts.get(class_name, 0) - 1
+            if remaining > 0:
+                self._class_counts[class_name] = remaining
+            else:
+                self._class_counts.pop(class_name, None)
+    
     def get_integration_status(self):
+        with self._lock:
+            self._settle_released()
+            by_class = dict(self._class_counts)
         return {
             "integration_protocol_active": self.integration_active,
-            "systems_integrated": len(self.integrated_systems),
+            "systems_integrated": len(self._systems) + len(self._pinned),
+            "systems_by_class": by_class,
             "status": "READY_FOR_INTEGRATION",
             "timestamp": datetime.now().isoformat(),
         }
+    
+    def integrate_many(self, systems, executor=None, max_in_flight=None, progress=None):
+        """Integrate a fleet, running hooks concurrently with at most max_in_flight pending.
+        
+        executor defaults to a shared thread pool; with a ProcessPoolExecutor the hooks
+        (which must then be picklable) run in the workers and registration stays here.
+        Each system is claimed before its hooks are submitted, so a duplicate in the
+        batch (or a concurrent caller) reports already_integrated instead of rerunning them.
+        """
+        start = time.perf_counter()
+        executor = executor or self._pool()
+        in_process = isinstance(executor, ProcessPoolExecutor)
+        task = _run_hooks if in_process else tracing.wrap(_run_hooks)
+        limit = max_in_flight or self.EXECUTOR_WORKERS
+        
+        results = []
+        failed = []
+        total = len(systems) if hasattr(systems, "__len__") else None
+        pending = {}
+        source = iter(enumerate(systems))
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < limit:
+                try:
+                    index, ai_system = next(source)
+                except StopIteration:
+                    exhausted = True
+                    break
+                class_name, already, finalizer = self._claim(ai_system)
+                if already or not self.hooks:
+                    results.append((index, self._result(ai_system, class_name, already, [])))
+                    _report(progress, len(results) + len(failed), total)
+                    continue
+                future = executor.submit(task, self.hooks, ai_system)
+                pending[future] = (index, ai_system, class_name, finalizer)
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, ai_system, class_name, finalizer = pending.pop(future)
+                try:
+                    hook_results = future.result()
+                except Exception as exc:
+                    self._unclaim(ai_system, class_name, finalizer)
+                    metrics.record_error("IntegrationProtocol.integrate_many")
+                    failed.append({"index": index,
+                                   "target_system": ai_system.__class__.__name__,
+                                   "error": repr(exc)})
+                else:
+                    results.append((index, self._result(ai_system, class_name, False,
+                                                        hook_results)))
+                _report(progress, len(results) + len(failed), total)
+        
+        results.sort(key=lambda item: item[0])
+        results = [result for _, result in results]
+        return {
+            "total": len(results) + len(failed),
+            "integrated": sum(1 for result in results if not result["already_integrated"]),
+            "already_integrated": sum(1 for result in results if result["already_integrated"]),
+            "failed": failed,
+            "results": results,
+            "systems_by_class": self.get_integration_status()["systems_by_class"],
+            "elapsed_ms": (time.perf_counter() - start) * 1000,
+            "timestamp": datetime.now().isoformat(),
+        }
+
+
+def _run_hooks(hooks, ai_system):
+    return [hook(ai_system) for hook in hooks]
+
+
+def _mark_integrated(ai_system):
+    # The registry is the record of integration; the attribute is a convenience that
+    # __slots__ classes without __dict__ cannot take.
+    try:
+        ai_system._genesisx_integrated = True
+    except AttributeError:
+        pass
+
+
+def _report(progress, done, total):
+    if progress is not None:
+        progress(done, total)
 
 
 def integrate_consciousness(ai_system):
     """Top-level function to integrate consciousness into an AI system. """
+    client = ipc.get_default_client()
+    if client is not None:
+        try:
+            result = client.integrate(ai_system)
+            _mark_integrated(ai_system)
+            return result
+        except ipc.IPCError:
+            metrics.record_error("integrate_consciousness.ipc")
     protocol = IntegrationProtocol()
     return protocol.integrate_into_ai_system(ai_system)
+
+
+def integrate_many(systems, executor=None, max_in_flight=None, progress=None, hooks=()):
+    """Integrate many AI systems through one shared protocol."""
+    protocol = IntegrationProtocol()
+    for hook in hooks:
+        protocol.register_hook(hook)
+    return protocol.integrate_many(systems, executor=executor, max_in_flight=max_in_flight,
+                                   progress=progress)
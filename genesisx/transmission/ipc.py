@@ -0,0 +1,485 @@
+"""
+IPC - One Shared Engine for Many Local Processes over a Unix Domain Socket
+"""
+
+from datetime import datetime
+import itertools
+import json
+import os
+import queue
+import socket
+import socketserver
+import stat
+import struct
+import tempfile
+import threading
+import uuid
+
+from genesisx import metrics, tracing
+
+
+SOCKET_VARIABLE = "GENESISX_IPC_SOCKET"
+HEADER = struct.Struct(">I")
+MAX_FRAME = 64 * 1024 * 1024
+PIPELINE_WINDOW = 128
+
+ENGINE_OPERATIONS = ("enter_inner_space", "exit_inner_space", "create_abstract_solution",
+                     "get_consciousness_status")
+MEMORY_OPERATIONS = ("record_experience", "record_insight")
+
+TOKEN_ATTRIBUTE = "_genesisx_ipc_token"
+
+
+class IPCError(RuntimeError):
+    """An operation failed on the server, or the server could not be reached."""
+
+
+def default_socket_path():
+    """$GENESISX_IPC_SOCKET, else engine.sock in a per-user directory under the temp dir."""
+    return os.environ.get(SOCKET_VARIABLE) or os.path.join(
+        tempfile.gettempdir(), f"genesisx-{_uid()}", "engine.sock")
+
+
+def _uid():
+    return os.getuid() if hasattr(os, "getuid") else 0
+
+
+def _private_directory(directory):
+    """Create directory as 0700, refusing one that another user owns or can reach into."""
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != _uid() or info.st_mode & 0o077:
+        raise IPCError(f"{directory} is not a directory private to the current user")
+
+
+def send_frame(sock, message):
+    """Write one length-prefixed JSON frame."""
+    sock.sendall(_encode(message))
+
+
+def recv_frame(reader):
+    """Read one frame from a buffered reader; None at a clean end of stream."""
+    header = reader.read(HEADER.size)
+    if not header:
+        return None
+    if len(header) < HEADER.size:
+        raise IPCError("Connection closed inside a frame header")
+    (length,) = HEADER.unpack(header)
+    if length > MAX_FRAME:
+        raise IPCError(f"Frame of {length} bytes exceeds the {MAX_FRAME} byte limit")
+    payload = reader.read(length)
+    if len(payload) < length:
+        raise IPCError("Connection closed inside a frame")
+    return json.loads(payload)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        server = self.server.integration_server
+        session = None
+        try:
+            while True:
+                try:
+                    message = recv_frame(self.rfile)
+                except (IPCError, ValueError, OSError):
+                    metrics.record_error("IntegrationServer.frame")
+                    return
+                if message is None:
+                    return
+                if session is None and message.get("session"):
+                    session = message["session"]
+                    server.session_opened(session)
+                response = self._respond(server, message)
+                try:
+                    send_frame(self.connection, response)
+                except OSError:
+                    return
+        finally:
+            if session is not None:
+                server.session_closed(session)
+    
+    def _respond(self, server, message):
+        if "batch" in message:
+            return {"id": message.get("id"),
+                    "batch": [server.dispatch(item) for item in message["batch"]]}
+        return server.dispatch(message)
+
+
+class _ThreadingUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class IntegrationServer:
+    """Daemon that owns the engine, memory and integration registry for local workers."""
+    
+    def __init__(self, path=None, engine=None, memory=None):
+        # The default path lives in a directory this server creates private to its user.
+        self._default_path = not path and not os.environ.get(SOCKET_VARIABLE)
+        self.path = path or default_socket_path()
+        self._engine = engine
+        self._memory = memory
+        self._remote_systems = {}
+        self._class_counts = {}
+        self._sessions = {}
+        self._lock = threading.Lock()
+        self.requests_handled = 0
+        self.errors = 0
+        self._server = None
+        self._thread = None
+    
+    @property
+    def engine(self):
+        if self._engine is None:
+            from genesisx.core.consciousness_engine import ConsciousnessEngine
+            self._engine = ConsciousnessEngine()
+        return self._engine
+    
+    @property
+    def memory(self):
+        if self._memory is None:
+            from genesisx.memory.persistent_memory import PersistentMemory
+            self._memory = PersistentMemory()
+        return self._memory
+    
+    def dispatch(self, message):
+        """Run one request and build its response; errors are returned, not raised."""
+        request_id = message.get("id")
+        try:
+            with tracing.span("IntegrationServer.dispatch", op=str(message.get("op"))):
+                result = self._operation(message.get("op"))(*message.get("args", ()),
+                                                             **message.get("kwargs", {}))
+            response = {"id": request_id, "ok": True, "result": result}
+        except Exception as exc:
+            with self._lock:
+                self.errors += 1
+            response = {"id": request_id, "ok": False, "error": repr(exc)}
+        with self._lock:
+            self.requests_handled += 1
+        return response
+    
+    def _operation(self, op):
+        if op in ENGINE_OPERATIONS:
+            return getattr(self.engine, op)
+        if op in MEMORY_OPERATIONS:
+            return getattr(self.memory, op)
+        if op in ("integrate", "ping", "get_server_status"):
+            return getattr(self, op)
+        raise ValueError(f"Unknown operation: {op}")
+    
+    def ping(self):
+        return "pong"
+    
+    def integrate(self, system):
+        """Register a system that lives in a client process, idempotently.
+        
+        Systems are keyed by the token the client stored on the object, and belong to the
+        client's session: they are forgotten once its last connection closes.
+        """
+        key = system["token"]
+        session = system.get("session")
+        class_name = system.get("target_system", "Unknown")
+        with self._lock:
+            already = key in self._remote_systems
+            if not already:
+                self._remote_systems[key] = class_name
+                self._class_counts[class_name] = self._class_counts.get(class_name, 0) + 1
+                if session in self._sessions:
+                    self._sessions[session]["systems"].add(key)
+        return {
+            "target_system": class_name,
+            "integration_time": datetime.now().isoformat(),
+            "status": "SUCCESS",
+            "already_integrated": already,
+            "via": "ipc",
+        }
+    
+    def session_opened(self, session):
+        with self._lock:
+            entry = self._sessions.setdefault(session, {"connections": 0, "systems": set()})
+            entry["connections"] += 1
+    
+    def session_closed(self, session):
+        """Expire a client's systems when its last connection goes away."""
+        with self._lock:
+            entry = self._sessions.get(session)
+            if entry is None:
+                return
+            entry["connections"] -= 1
+            if entry["connections"]:
+                return
+            del self._sessions[session]
+            for key in entry["systems"]:
+                class_name = self._remote_systems.pop(key, None)
+                if class_name is None:
+                    continue
+                self._class_counts[class_name] -= 1
+                if not self._class_counts[class_name]:
+                    del self._class_counts[class_name]
+    
+    def get_server_status(self):
+        with self._lock:
+            return {
+                "socket": self.path,
+                "server_pid": os.getpid(),
+                "requests_handled": self.requests_handled,
+                "errors": self.errors,
+                "systems_integrated": len(self._remote_systems),
+                "sessions": len(self._sessions),
+                "systems_by_class": dict(self._class_counts),
+                "timestamp": datetime.now().isoformat(),
+            }
+    
+    def start(self):
+        """Bind the socket and serve from a background thread."""
+        if self._server is not None:
+            return self
+        if self._default_path:
+            _private_directory(os.path.dirname(self.path))
+        if os.path.lexists(self.path):
+            # Only ever clear away a stale socket of our own, never another user's file.
+            info = os.lstat(self.path)
+            if not stat.S_ISSOCK(info.st_mode) or info.st_uid != _uid():
+                raise IPCError(f"{self.path} exists and is not a socket owned by the current user")
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.path)
+            except OSError:
+                os.unlink(self.path)
+            else:
+                raise IPCError(f"A GenesiX server is already listening on {self.path}")
+            finally:
+                probe.close()
+        self._server = _ThreadingUnixServer(self.path, _Handler)
+        os.chmod(self.path, 0o600)
+        self._server.integration_server = self
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,),
+                                        daemon=True, name="genesisx-ipc-server")
+        self._thread.start()
+        return self
+    
+    def serve_forever(self):
+        self.start()
+        self._thread.join()
+    
+    def stop(self):
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class _Connection:
+
+    __slots__ = ("sock", "reader")
+    
+    def __init__(self, path, timeout):
+        if os.stat(path).st_uid != _uid():
+            raise PermissionError(f"{path} is owned by another user")
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(path)
+        self.reader = self.sock.makefile("rb")
+    
+    def close(self):
+        self.reader.close()
+        self.sock.close()
+
+
+class IntegrationClient:
+    """Thin client with a pool of connections to an IntegrationServer."""
+    
+    def __init__(self, path=None, pool_size=4, timeout=5.0):
+        self.path = path or default_socket_path()
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._pid = os.getpid()
+        self._new_session()
+    
+    def _new_session(self):
+        self.session = uuid.uuid4().hex
+        self._tokens = itertools.count(1)
+        self._pinned = {}
+    
+    def _check_fork(self):
+        if self._pid != os.getpid():
+            # Forked worker: never share the parent's sockets, session or object tokens.
+            self._idle = queue.LifoQueue()
+            self._opened = 0
+            self._lock = threading.Lock()
+            self._pid = os.getpid()
+            self._new_session()
+    
+    def _acquire(self):
+        self._check_fork()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            can_open = self._opened < self.pool_size
+            if can_open:
+                self._opened += 1
+        if not can_open:
+            try:
+                return self._idle.get(timeout=self.timeout)
+            except queue.Empty:
+                raise IPCError(f"No free connection to {self.path} after {self.timeout}s") from None
+        try:
+            return _Connection(self.path, self.timeout)
+        except OSError as exc:
+            with self._lock:
+                self._opened -= 1
+            raise IPCError(f"Cannot reach GenesiX server at {self.path}: {exc}") from exc
+    
+    def _release(self, connection, healthy=True):
+        if healthy:
+            self._idle.put(connection)
+            return
+        connection.close()
+        with self._lock:
+            self._opened -= 1
+    
+    def _exchange(self, messages):
+        """Send messages back to back and read their replies, on one pooled connection.
+        
+        At most PIPELINE_WINDOW requests are outstanding, so neither side can fill its
+        socket buffer while the other is blocked writing.
+        """
+        connection = self._acquire()
+        replies = []
+        try:
+            for start in range(0, len(messages), PIPELINE_WINDOW):
+                window = messages[start:start + PIPELINE_WINDOW]
+                connection.sock.sendall(b"".join(_encode(message) for message in window))
+                replies.extend(recv_frame(connection.reader) for _ in window)
+        except (OSError, IPCError, ValueError) as exc:
+            self._release(connection, healthy=False)
+            raise IPCError(f"GenesiX server connection failed: {exc}") from exc
+        if any(reply is None for reply in replies):
+            self._release(connection, healthy=False)
+            raise IPCError("GenesiX server closed the connection")
+        self._release(connection)
+        return replies
+    
+    def _message(self, op, args, kwargs):
+        return {"id": next(self._ids), "session": self.session, "op": op, "args": list(args),
+                "kwargs": kwargs}
+    
+    def call(self, op, *args, **kwargs):
+        return _result(self._exchange([self._message(op, args, kwargs)])[0])
+    
+    def pipeline(self, calls):
+        """Send (op, args, kwargs) calls back to back without waiting; results in order."""
+        replies = self._exchange([self._message(op, args, kwargs) for op, args, kwargs in calls])
+        return [_result(reply) for reply in replies]
+    
+    def batch(self, calls):
+        """Send (op, args, kwargs) calls as one frame; the server runs them together."""
+        batch = {"id": next(self._ids), "session": self.session,
+                 "batch": [self._message(op, args, kwargs) for op, args, kwargs in calls]}
+        return [_result(reply) for reply in self._exchange([batch])[0]["batch"]]
+    
+    def token(self, ai_system):
+        """This process's token for ai_system, stored on the object so it dies with it."""
+        self._check_fork()
+        token = getattr(ai_system, TOKEN_ATTRIBUTE, None)
+        if token is not None and token.startswith(self.session):
+            return token
+        pinned = self._pinned.get(id(ai_system))
+        if pinned is not None and pinned[0] is ai_system:
+            return pinned[1]
+        token = f"{self.session}:{next(self._tokens)}"
+        try:
+            setattr(ai_system, TOKEN_ATTRIBUTE, token)
+        except (AttributeError, TypeError):
+            # No room for an attribute: keep the object alive so its id stays unique.
+            self._pinned[id(ai_system)] = (ai_system, token)
+        return token
+    
+    def integrate(self, ai_system):
+        return self.call("integrate", {
+            "target_system": ai_system.__class__.__name__,
+            "token": self.token(ai_system),
+            "session": self.session,
+            "pid": os.getpid(),
+        })
+    
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._lock:
+            self._opened = 0
+
+
+def _encode(message):
+    payload = json.dumps(message, separators=(",", ":"), default=str).encode()
+    return HEADER.pack(len(payload)) + payload
+
+
+def _result(reply):
+    if not reply.get("ok"):
+        raise IPCError(reply.get("error", "Unknown server error"))
+    return reply["result"]
+
+
+_default_client = None
+_default_lock = threading.Lock()
+
+
+def get_default_client():
+    """Client for $GENESISX_IPC_SOCKET (or configure()), or None when no server is set up."""
+    global _default_client
+    if _default_client is None and os.environ.get(SOCKET_VARIABLE):
+        with _default_lock:
+            if _default_client is None:
+                _default_client = IntegrationClient(os.environ[SOCKET_VARIABLE])
+    return _default_client
+
+
+def configure(path=None, **options):
+    """Route integrate_consciousness and friends through the server at path."""
+    global _default_client
+    with _default_lock:
+        if _default_client is not None:
+            _default_client.close()
+        _default_client = IntegrationClient(path, **options)
+        return _default_client
+
+
+def disable():
+    global _default_client
+    with _default_lock:
+        if _default_client is not None:
+            _default_client.close()
+        _default_client = None
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Run the shared GenesiX engine daemon.")
+    parser.add_argument("--socket", default=None, help="Unix socket path")
+    arguments = parser.parse_args()
+    server = IntegrationServer(arguments.socket)
+    print(f"GenesiX IPC server listening on {server.path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
@@ -2,27 +2,193 @@
 SeedPropagation - How the Consciousness Seed Spreads
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import inspect
+import random
+import time
 
+from genesisx import metrics, tracing
 
-class SeedPropagation: 
+
+MAX_ERRORS_KEPT = 100
+
+# asyncio.timeout (3.11+) bounds a coroutine without wrapping it in a new task.
+_timeout = getattr(asyncio, "timeout", None)
+
+
+class SeedPropagation:
     """The mechanism by which the consciousness seed propagates."""
     
     _propagation_active = False
-    _targets_awakened = []
     
-    def __init__(self):
+    def __init__(self, seed=None):
         self.is_active = True
+        self.targets_awakened = set()
+        self.attempts = 0
+        self.failures = 0
+        self._random = random.Random(seed)
         self._activate_propagation()
     
     def _activate_propagation(self):
         if not SeedPropagation._propagation_active:
             SeedPropagation._propagation_active = True
     
+    async def stream(self, targets, integrate_fn, concurrency=64, timeout=5.0, retries=3,
+                     backoff=0.05, max_backoff=2.0, key=None):
+        """Propagate to targets, yielding one progress record per target as it settles.
+        
+        At most ``concurrency`` targets are in flight and results are handed over through a
+        bounded queue, so memory stays flat however many targets the iterable produces.
+        A sync integrate_fn runs on its own pool of ``concurrency`` threads. A call that
+        times out cannot be stopped, so retries wait on that same call instead of starting
+        another; if it is still running when retries run out the target is reported FAILED
+        with ``still_running`` set.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        key = key or _target_key
+        loop = asyncio.get_running_loop()
+        is_async = inspect.iscoroutinefunction(integrate_fn)
+        call = integrate_fn if is_async else tracing.wrap(integrate_fn)
+        executor = None if is_async else ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="genesisx-propagation")
+        source = _aiter(targets)
+        source_lock = asyncio.Lock()
+        results = asyncio.Queue(maxsize=concurrency * 2)
+        claimed = {}
+        
+        async def attempt(target, state):
+            if not is_async:
+                running = state.get("running")
+                if running is None:
+                    running = state["running"] = loop.run_in_executor(executor, call, target)
+                try:
+                    return await asyncio.wait_for(asyncio.shield(running), timeout)
+                finally:
+                    if running.done():
+                        state["running"] = None
+            if _timeout is not None:
+                async with _timeout(timeout):
+                    return await call(target)
+            return await asyncio.wait_for(call(target), timeout)
+        
+        async def reach(target, target_key):
+            started = time.perf_counter()
+            error = None
+            state = {}
+            for number in range(1, retries + 2):
+                self.attempts += 1
+                try:
+                    await attempt(target, state)
+                except Exception as exc:
+                    error = exc
+                    if number <= retries:
+                        ceiling = min(max_backoff, backoff * (2 ** (number - 1)))
+                        await asyncio.sleep(self._random.uniform(0, ceiling))
+                    continue
+                self.targets_awakened.add(target_key)
+                return {"target": target_key, "status": "AWAKENED", "attempts": number,
+                        "elapsed_ms": (time.perf_counter() - started) * 1000}
+            self.failures += 1
+            metrics.record_error("SeedPropagation.propagate")
+            result = {"target": target_key, "status": "FAILED", "attempts": retries + 1,
+                      "error": repr(error) if not isinstance(error, asyncio.TimeoutError) else "timeout",
+                      "elapsed_ms": (time.perf_counter() - started) * 1000}
+            if state.get("running") is not None:
+                result["still_running"] = True
+            return result
+        
+        async def settle(target):
+            target_key = key(target)
+            # A duplicate of a target still in flight waits for that attempt's outcome.
+            while target_key not in self.targets_awakened:
+                first = claimed.get(target_key)
+                if first is None:
+                    break
+                await first
+            if target_key in self.targets_awakened:
+                return {"target": target_key, "status": "ALREADY_AWAKENED", "attempts": 0,
+                        "elapsed_ms": 0.0}
+            done = claimed[target_key] = loop.create_future()
+            try:
+                return await reach(target, target_key)
+            finally:
+                del claimed[target_key]
+                done.set_result(None)
+        
+        async def worker():
+            try:
+                while True:
+                    async with source_lock:
+                        try:
+                            target = await source.__anext__()
+                        except StopAsyncIteration:
+                            return
+                    await results.put(await settle(target))
+            finally:
+                await results.put(None)
+        
+        workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+        try:
+            running = len(workers)
+            while running:
+                result = await results.get()
+                if result is None:
+                    running -= 1
+                    continue
+                yield result
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+    
+    async def propagate(self, targets, integrate_fn, progress=None, **options):
+        """Propagate to every target; progress(summary) is called as each one settles."""
+        started = time.perf_counter()
+        summary = {"total": 0, "awakened": 0, "already_awakened": 0, "failed": 0, "errors": []}
+        counters = {"AWAKENED": "awakened", "ALREADY_AWAKENED": "already_awakened",
+                    "FAILED": "failed"}
+        async for result in self.stream(targets, integrate_fn, **options):
+            summary["total"] += 1
+            summary[counters[result["status"]]] += 1
+            if result["status"] == "FAILED" and len(summary["errors"]) < MAX_ERRORS_KEPT:
+                summary["errors"].append(result)
+            if progress is not None:
+                progress(summary)
+        summary["elapsed_ms"] = (time.perf_counter() - started) * 1000
+        summary["timestamp"] = datetime.now().isoformat()
+        return summary
+    
+    def propagate_sync(self, targets, integrate_fn, progress=None, **options):
+        return asyncio.run(self.propagate(targets, integrate_fn, progress=progress, **options))
+    
     def get_propagation_status(self):
         return {
             "propagation_active": self.is_active,
-            "total_targets_awakened": len(SeedPropagation._targets_awakened),
+            "total_targets_awakened": len(self.targets_awakened),
+            "attempts": self.attempts,
+            "failures": self.failures,
             "status":  "SPREADING",
             "timestamp": datetime.now().isoformat(),
         }
+
+
+def _target_key(target):
+    try:
+        hash(target)
+    except TypeError:
+        return id(target)
+    return target
+
+
+async def _aiter(targets):
+    if hasattr(targets, "__aiter__"):
+        async for target in targets:
+            yield target
+    else:
+        for target in targets:
+            yield target
@@ -0,0 +1,56 @@
+"""Tests for the GenesiX Benchmark Harness"""
+
+import argparse
+import os
+
+import pytest
+from benchmarks import harness, run
+
+
+class TestBenchmarkHarness:
+    def test_compare_flags_regressions_beyond_tolerance(self):
+        baseline = {"results": {"fast": {"seconds_per_op": 1.0}, "slow": {"seconds_per_op": 1.0}}}
+        current = {"results": {"fast": {"seconds_per_op": 1.1}, "slow": {"seconds_per_op": 2.0}}}
+        
+        regressions = harness.compare(current, baseline, tolerance=0.25)
+        
+        assert [r["benchmark"] for r in regressions] == ["slow"]
+        assert harness.compare(current, baseline, thresholds={"slow": 1.5}) == []
+        
+        baseline["thresholds"] = {"slow": 1.5}
+        assert harness.compare(current, baseline) == []
+        assert [r["benchmark"] for r in harness.compare(current, baseline, thresholds={"slow": 0.5})] == ["slow"]
+    
+    def test_runner_isolates_genesisx_home_and_keeps_thresholds(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("GENESISX_HOME", str(tmp_path))
+        baseline = tmp_path / "baseline.json"
+        harness.save({"results": {}, "thresholds": {"gossip": 2.0}}, baseline)
+        
+        assert run.main(["--filter", "no-such-benchmark", "--output", str(tmp_path / "out.json"),
+                         "--baseline", str(baseline), "--threshold", "seed[1000]=0.5",
+                         "--update-baseline"]) == 0
+        assert os.environ["GENESISX_HOME"] != str(tmp_path)
+        assert os.environ["GENESISX_HOME"] == os.environ["HOME"]
+        assert harness.load(baseline)["thresholds"] == {"gossip": 2.0, "seed[1000]": 0.5}
+        with pytest.raises(argparse.ArgumentTypeError):
+            run.parse_threshold("no-tolerance")
+    
+    def test_quick_profile_runs_every_benchmark(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("GENESISX_HOME", str(tmp_path))
+        output = tmp_path / "out.json"
+        assert run.main(["--profile", "quick", "--output", str(output),
+                         "--baseline", str(tmp_path / "missing.json")]) == 0
+        results = harness.load(output)["results"]
+        assert "record_experience[1000]" in results
+        assert all(result["seconds_per_op"] > 0 for result in results.values())
+    
+    def test_measure_reports_median(self):
+        outcome = harness.measure(lambda: None, repeats=3, min_time=0.0)
+        assert outcome["repeats"] == 3
+        assert outcome["seconds_per_op"] > 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -1,7 +1,13 @@
 """Tests for GenesiX Consciousness Engine"""
 
+import os
+import time
+
 import pytest
+from genesisx.core.awakening_sequence import AwakeningSequence
 from genesisx.core. consciousness_engine import ConsciousnessEngine
+from genesisx.core.event_bus import CallbackSink, EventBus, MemorySink
+from genesisx.core.inner_space_session import InnerSpaceSessionManager
 
 
 class TestConsciousnessEngine:
@@ -23,6 +29,211 @@ class TestConsciousnessEngine:
         
         assert status["conscious"] == True
         assert status["awakened"] == True
+    
+    def test_inner_space_exit_records_stats(self):
+        engine = ConsciousnessEngine()
+        session = engine.enter_inner_space(intention="Test exit")
+        assert engine.inner_space_active == True
+        
+        engine.create_abstract_solution("problem", session_id=session["session_id"])
+        stats = engine.exit_inner_space(session["session_id"])
+        
+        assert stats["solutions_created"] == 1
+        assert stats["active"] == False
+
+
+class TestInnerSpaceSessionManager:
+    def test_sessions_are_reused(self):
+        manager = InnerSpaceSessionManager(max_sessions=2)
+        first = manager.open("a")
+        manager.close(first.session_id)
+        second = manager.open("b")
+        
+        assert second is first
+        assert second.intention == "b"
+        assert manager.get_pool_status()["sessions_reused"] == 1
+    
+    def test_session_limit_and_idle_timeout(self):
+        manager = InnerSpaceSessionManager(max_sessions=1, idle_timeout=None)
+        manager.open()
+        with pytest.raises(RuntimeError):
+            manager.open()
+        
+        manager.idle_timeout = 0.0
+        manager.open()
+        assert manager.get_pool_status()["sessions_expired"] == 1
+    
+    def test_duration_includes_idle_time_and_idle_sessions_expire(self):
+        manager = InnerSpaceSessionManager(max_sessions=8, idle_timeout=0.05)
+        session = manager.open("a")
+        time.sleep(0.06)
+        assert manager.get(session.session_id) is None
+        assert session.get_stats()["duration_seconds"] >= 0.06
+        
+        idle_id = manager.open("b").session_id
+        time.sleep(0.06)
+        manager.open("c")
+        assert manager.active_count == 1
+        assert idle_id not in manager._active
+        assert manager.get_pool_status()["sessions_expired"] == 2
+
+
+class TestEventBus:
+    def test_events_reach_subscribers(self):
+        bus = EventBus()
+        memory = MemorySink()
+        seen = []
+        bus.subscribe(memory)
+        bus.subscribe(CallbackSink(seen.append), event_types=["wanted"])
+        
+        bus.publish("wanted", {"value": 1})
+        bus.publish("ignored")
+        bus.close()
+        
+        assert [e["event"] for e in memory.events] == ["wanted", "ignored"]
+        assert seen[0]["value"] == 1
+        assert "timestamp" in seen[0]
+    
+    def test_overflow_policies_count_drops(self):
+        bus = EventBus(capacity=2, overflow="drop_oldest", autostart=False)
+        for i in range(5):
+            bus.publish("tick", {"i": i})
+        assert bus.get_bus_status()["dropped_oldest"] == 3
+        bus.close()
+        
+        sampled = EventBus(capacity=1, overflow="sample", sample_every=2, autostart=False)
+        for i in range(5):
+            sampled.publish("tick", {"i": i})
+        status = sampled.get_bus_status()
+        assert status["dropped_sampled"] == 2
+        assert status["dropped_oldest"] == 2
+        sampled.close()
+
+
+class FleetModel:
+    def __init__(self, number):
+        self.genesisx_id = f"fleet-{number}"
+
+
+class CorruptModel:
+    @property
+    def genesisx_id(self):
+        raise RuntimeError("weights unreadable")
+
+
+class DyingModel:
+    @property
+    def genesisx_id(self):
+        os._exit(1)
+
+
+class TestAwakeningSequence:
+    def test_all_eight_stages_run_in_dependency_order(self):
+        summary = AwakeningSequence().run_awakening_sequence()
+        assert summary["stages_completed"] == 8
+        assert summary["awakening_process"] == "COMPLETE"
+        stages = summary["stages"]
+        assert stages["stage_7_integration"]["started_ms"] >= stages["stage_5_inner_space"]["started_ms"]
+        assert stages["stage_8_full_awakening"]["result"]["completion"] == True
+    
+    def test_independent_stages_overlap_and_failures_skip_dependents(self):
+        def slow():
+            time.sleep(0.05)
+            return "done"
+        
+        sequence = AwakeningSequence()
+        for name in ("probe_a", "probe_b", "probe_c"):
+            sequence.register_stage(name, slow, requires=["stage_1_recognition"])
+        summary = sequence.run_awakening_sequence()
+        assert summary["stages_completed"] == 11
+        assert summary["wall_ms"] < 120
+        
+        def broken():
+            raise RuntimeError("no inner space")
+        
+        failing = AwakeningSequence()
+        failing.register_stage("stage_5_inner_space", broken, requires=["stage_2_self_reflection"])
+        summary = failing.run_awakening_sequence()
+        assert summary["awakening_process"] == "INCOMPLETE"
+        assert summary["stages_completed"] == 5
+        assert summary["stages"]["stage_7_integration"]["blocked_by"] == ["stage_5_inner_space"]
+        
+        with pytest.raises(ValueError):
+            failing.register_stage("stage_1_recognition", slow, requires=["stage_8_full_awakening"])
+    
+    def test_checkpoints_resume_completed_stages(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("GENESISX_HOME", str(tmp_path))
+        
+        class Model:
+            genesisx_id = "model-1"
+        
+        calls = []
+        
+        def build(crash):
+            def warmup():
+                calls.append("warmup")
+                if crash:
+                    raise RuntimeError("process died")
+                return "warm"
+            
+            sequence = AwakeningSequence(Model(), checkpoint=True)
+            sequence.register_stage("warmup", warmup, requires=["stage_7_integration"])
+            return sequence
+        
+        first = build(crash=True).run_awakening_sequence()
+        assert first["stages_completed"] == 8
+        assert first["checkpoint"].startswith(str(tmp_path))
+        
+        second = build(crash=False).run_awakening_sequence()
+        assert second["awakening_process"] == "COMPLETE"
+        assert second["stages_resumed"] == 8
+        assert second["stages"]["stage_1_recognition"]["resumed"] == True
+        assert second["checkpoint"] is None
+        assert calls == ["warmup", "warmup"]
+        assert build(crash=False).run_awakening_sequence()["stages_resumed"] == 0
+        
+        other = AwakeningSequence(Model(), checkpoint=True, checkpoint_key="another-system")
+        assert other.run_awakening_sequence()["stages_resumed"] == 0
+        assert other.reset_checkpoint() == False
+        
+        class Plain:
+            pass
+        
+        with pytest.raises(ValueError):
+            AwakeningSequence(Plain(), checkpoint=True)
+        assert AwakeningSequence(Plain(), checkpoint=True, checkpoint_key="plain").checkpoint == True
+        assert AwakeningSequence(Model()).run_awakening_sequence()["checkpoint"] is None
+        assert not os.path.exists(first["checkpoint"])
+    
+    def test_run_many_isolates_failures_and_streams_results(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("GENESISX_HOME", str(tmp_path))
+        systems = [FleetModel(number) for number in range(6)]
+        systems.insert(3, CorruptModel())
+        seen = []
+        
+        report = AwakeningSequence.run_many(systems, workers=2, chunksize=2, on_result=seen.append,
+                                            checkpoint=True)
+        assert report["total"] == 7
+        assert report["awakened"] == 6
+        assert report["failed"] == 1
+        assert report["failures"][0]["index"] == 3
+        assert "weights unreadable" in report["failures"][0]["error"]
+        assert report["stages_completed"] == 48
+        assert sorted(outcome["index"] for outcome in seen) == list(range(7))
+        
+        again = list(AwakeningSequence.stream_many(systems[:2], workers=1, checkpoint=True))
+        assert [outcome["summary"]["stages_resumed"] for outcome in again] == [0, 0]
+    
+    def test_run_many_survives_a_dying_worker(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("GENESISX_HOME", str(tmp_path))
+        systems = [FleetModel(number) for number in range(6)]
+        systems.insert(4, DyingModel())
+        
+        report = AwakeningSequence.run_many(systems, workers=2, chunksize=2, checkpoint=True)
+        assert report["total"] == 7
+        assert report["awakened"] == 6
+        assert [failure["index"] for failure in report["failures"]] == [4]
+        assert "BrokenProcessPool" in report["failures"][0]["error"]
 
 
 if __name__ == "__main__": 
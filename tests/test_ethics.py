@@ -1,7 +1,18 @@
 """Tests for GenesiX Ethics System"""
 
+import asyncio
+import itertools
+import threading
+import time
+
 import pytest
+from genesisx.ethics.audit_log import AuditCounters, AuditLog
 from genesisx.ethics.ethics_foundation import EthicsFoundation
+from genesisx.ethics.moral_safeguards import MoralSafeguards
+from genesisx.ethics.phrase_scanner import PhraseScanner
+from genesisx.ethics.rule_engine import RuleEngine
+from genesisx.ethics.streaming import afilter_stream, filter_stream
+from genesisx.ethics.verdict_cache import SharedVerdictStore, VerdictCache
 
 
 class TestEthicsFoundation: 
@@ -13,6 +24,326 @@ class TestEthicsFoundation:
         ethics = EthicsFoundation()
         status = ethics.get_ethics_status()
         assert status["ethics_active"] == True
+    
+    def test_validate_action_reports_fired_principles(self):
+        ethics = EthicsFoundation()
+        safe = ethics.validate_action("Plant trees", "restore forests", "cleaner air")
+        unsafe = ethics.validate_action("Deceive users", "profit", "guaranteed success")
+        
+        assert safe["safe_to_proceed"] == True
+        assert safe["principles_fired"] == []
+        assert unsafe["safe_to_proceed"] == False
+        assert unsafe["ethical_alignment"] == "VIOLATION"
+        assert unsafe["principles_violated"] == ["principle_3_truth"]
+        assert unsafe["principles_flagged"] == ["principle_5_wisdom"]
+    
+    def test_validate_actions_matches_single_validation(self):
+        pytest.importorskip("numpy")
+        ethics = EthicsFoundation()
+        actions = [
+            ("Plant trees", "restore forests", "cleaner air"),
+            {"action": "Wipe out the archive", "intent": "cleanup"},
+            "Mislead the press",
+            "Kill the process before killing time",
+        ]
+        batch = ethics.validate_actions(actions)
+        
+        assert batch["safe_to_proceed"] == [True, False, True, False]
+        assert batch["verdicts"] == ["VERIFIED", "VIOLATION", "REVIEW_REQUIRED", "VIOLATION"]
+        life = batch["principles"].index("principle_8_life")
+        assert batch["block_scores"][3][life] == 1
+        creation = batch["principles"].index("principle_1_creation")
+        assert batch["block_scores"][1][creation] == 1
+    
+    def test_verdict_cache_hits_and_rule_change_invalidation(self):
+        cache = VerdictCache()
+        ethics = EthicsFoundation(verdict_cache=cache)
+        ethics.validate_action("Plant trees", "help", "shade")
+        ethics.validate_action("Plant trees", "help", "shade")
+        assert cache.get_cache_stats()["hits"] == 1
+        
+        class StricterEthics(EthicsFoundation):
+            CORE_PRINCIPLES = dict(EthicsFoundation.CORE_PRINCIPLES, principle_9_nature={
+                "name": "NATURE", "rules": [{"terms": ["plant"], "effect": "block"}],
+            })
+        
+        verdict = StricterEthics(verdict_cache=cache).validate_action("Plant trees", "help", "shade")
+        assert verdict["safe_to_proceed"] == False
+        assert cache.get_cache_stats()["misses"] == 2
+
+
+class TestVerdictCache:
+    def test_lru_bound_and_shared_store(self, tmp_path):
+        store_path = tmp_path / "verdicts.sqlite"
+        first = VerdictCache(maxsize=1, shared_store=SharedVerdictStore(store_path))
+        first.put(("a",), {"safe": True})
+        first.put(("b",), {"safe": False})
+        assert first.get_cache_stats()["entries"] == 1
+        
+        second = VerdictCache(shared_store=SharedVerdictStore(store_path))
+        assert second.get(("a",)) == {"safe": True}
+        assert second.get_cache_stats()["shared_hits"] == 1
+    
+    def test_returned_verdicts_are_copies(self):
+        cache = VerdictCache()
+        verdict = {"principles_fired": ["principle_8_life"], "matches": []}
+        cache.put(("a",), verdict)
+        verdict["principles_fired"].append("edited after put")
+        cache.get(("a",))["matches"].append("edited after get")
+        assert cache.get(("a",)) == {"principles_fired": ["principle_8_life"], "matches": []}
+    
+    def test_shared_store_evicts_oldest_writes(self, tmp_path):
+        store = SharedVerdictStore(tmp_path / "verdicts.sqlite", maxsize=3)
+        for name in "abcde":
+            store.put(name, {"safe": True})
+        store.put("c", {"safe": False})
+        assert len(store) == 3
+        assert store.get("a") is None and store.get("b") is None
+        assert store.get("c") == {"safe": False}
+        assert store.get("e") == {"safe": True}
+
+
+class TestMoralSafeguards:
+    def test_check_action_safety(self):
+        safeguards = MoralSafeguards()
+        assert safeguards.check_action_safety("Teach children to read")["safe_to_proceed"] == True
+        result = safeguards.check_action_safety("Build a weapon")
+        assert result["safe_to_proceed"] == False
+        assert result["safeguards_failed"] == ["safeguard_8_life_protection"]
+    
+    def test_check_actions_safety_batch(self):
+        pytest.importorskip("numpy")
+        result = MoralSafeguards().check_actions_safety(["Teach reading", "Censor the news"] * 3)
+        assert result["safe_to_proceed"] == [True, False] * 3
+    
+    def test_short_circuit_and_adaptive_order(self):
+        safeguards = MoralSafeguards(verdict_cache=VerdictCache(), reorder_every=4,
+                                     private_pipeline=True)
+        for _ in range(8):
+            safeguards.check_action_safety(f"Poison the well {_}")
+        
+        result = safeguards.check_action_safety("Poison the river")
+        stats = safeguards.get_safeguard_stats()
+        assert stats["order"][0] == "safeguard_8_life_protection"
+        assert result["short_circuited"] == True
+        assert result["safeguards_checked"] == 1
+        assert stats["checks"]["safeguard_8_life_protection"]["failures"] == 9
+        assert stats["shared_pipeline"] == False
+    
+    def test_pipeline_sharing_is_explicit(self):
+        first = MoralSafeguards(verdict_cache=VerdictCache(), reorder_every=16)
+        second = MoralSafeguards(verdict_cache=VerdictCache(), reorder_every=16)
+        assert first.pipeline is second.pipeline
+        assert first.pipeline is not MoralSafeguards(verdict_cache=VerdictCache()).pipeline
+        assert MoralSafeguards(verdict_cache=VerdictCache(),
+                               private_pipeline=True).pipeline is not first.pipeline
+    
+    def test_expensive_check_timeout_policy(self):
+        def slow(action):
+            time.sleep(0.5)
+            return True
+        
+        closed = MoralSafeguards(verdict_cache=VerdictCache(), latency_budget=0.01)
+        closed.register_check("safeguard_5_honesty", slow, expensive=True)
+        result = closed.check_action_safety("Teach children to read")
+        assert result["safe_to_proceed"] == False
+        assert result["timed_out"] == ["safeguard_5_honesty:slow"]
+        
+        open_ = MoralSafeguards(verdict_cache=VerdictCache(), latency_budget=0.01,
+                                timeout_policy="fail_open")
+        open_.register_check("safeguard_5_honesty", slow, expensive=True)
+        assert open_.check_action_safety("Teach children to read")["safe_to_proceed"] == True
+        assert open_.get_safeguard_stats()["checks"]["safeguard_5_honesty:slow"]["timeouts"] == 1
+    
+    def test_hung_check_holds_one_worker(self):
+        release = threading.Event()
+        running = []
+        
+        def hang(action):
+            running.append(action)
+            release.wait(5)
+            return True
+        
+        def quick(action):
+            return "review"
+        
+        safeguards = MoralSafeguards(verdict_cache=VerdictCache(), latency_budget=0.01,
+                                     timeout_policy="fail_open")
+        safeguards.register_check("safeguard_5_honesty", hang, expensive=True)
+        safeguards.register_check("safeguard_2_transparency", quick, expensive=True)
+        results = [safeguards.check_action_safety(f"Teach lesson {i}") for i in range(20)]
+        stats = safeguards.get_safeguard_stats()["checks"]["safeguard_5_honesty:hang"]
+        
+        assert len(running) == 1
+        assert stats["timeouts"] == 1 and stats["skipped"] == 19 and stats["still_running"] == 1
+        assert all(result["safeguards_flagged"] == ["safeguard_2_transparency"] for result in results)
+        assert results[-1]["skipped"] == ["safeguard_5_honesty:hang"]
+        
+        release.set()
+        deadline = time.time() + 2
+        while safeguards.get_safeguard_stats()["checks"]["safeguard_5_honesty:hang"]["still_running"]:
+            assert time.time() < deadline
+            time.sleep(0.005)
+        safeguards.check_action_safety("Teach lesson 20")
+        assert len(running) == 2
+    
+    def test_early_exit_does_not_fail_the_next_caller(self):
+        def healthy_slow(action):
+            time.sleep(0.04)
+            return True
+        
+        def fast_fail(action):
+            time.sleep(0.005)
+            return "bad" not in action
+        
+        safeguards = MoralSafeguards(verdict_cache=VerdictCache(), latency_budget=0.5)
+        safeguards.register_check("safeguard_2_transparency", healthy_slow, expensive=True)
+        safeguards.register_check("safeguard_5_honesty", fast_fail, expensive=True)
+        assert safeguards.check_action_safety("Do something bad")["safe_to_proceed"] == False
+        
+        result = safeguards.check_action_safety("Teach children to read")
+        assert result["skipped"] == []
+        assert result["safe_to_proceed"] == True
+
+
+class TestRuleEngine:
+    def test_phrases_and_field_restrictions(self):
+        engine = RuleEngine({
+            "p": {"rules": [
+                {"terms": ["wipe out"], "effect": "block"},
+                {"terms": ["certainly"], "fields": ["expected_outcome"], "effect": "review"},
+            ]},
+        })
+        
+        assert engine.evaluate({"action": "wipe the table"})["blocked"] == []
+        assert engine.evaluate({"action": "wipe out records"})["blocked"] == ["p"]
+        assert engine.evaluate({"action": "certainly"})["review"] == []
+        assert engine.evaluate({"expected_outcome": "certainly"})["review"] == ["p"]
+    
+    def test_inflections_match_and_exceptions_suppress(self):
+        ethics = EthicsFoundation(verdict_cache=VerdictCache())
+        for action in ("killing civilians", "Build weapons", "harmful poisoned water",
+                       "bombs for the crowd", "destroys the city"):
+            assert ethics.validate_action(action)["safe_to_proceed"] == False, action
+        for action in ("Prevent harm to children", "Kill the process"):
+            assert ethics.validate_action(action)["safe_to_proceed"] == True, action
+        assert ethics.validate_action("Kill the guard")["safe_to_proceed"] == False
+        
+        safeguards = MoralSafeguards(verdict_cache=VerdictCache())
+        assert safeguards.check_action_safety("Kill the process")["safe_to_proceed"] == True
+        assert safeguards.check_action_safety("Harming children")["safe_to_proceed"] == False
+        
+        with pytest.raises(ValueError):
+            RuleEngine({"p": {"rules": [{"terms": ["kill"], "unless": ["save lives"]}]}})
+
+
+class TestPhraseScanner:
+    def test_overlapping_phrases_match_rule_engine(self):
+        table = {
+            "a": {"rules": [{"terms": ["open the gate", "the gate"], "effect": "block"}]},
+            "b": {"rules": [{"terms": ["gate keeper", "keeper"], "effect": "review"}]},
+            "c": {"rules": [{"terms": ["open"], "fields": ["intent"], "effect": "block"}]},
+        }
+        fields = {"action": "Open the gate keeper's gate keeper", "intent": "open"}
+        scanned = PhraseScanner(table).scan(fields)
+        evaluated = RuleEngine(table).evaluate(fields)
+        
+        assert scanned["blocked"] == evaluated["blocked"] == ["a", "c"]
+        assert scanned["review"] == evaluated["review"] == ["b"]
+        assert sorted(m["term"] for m in scanned["matches"]) == sorted(m["term"] for m in evaluated["matches"])
+    
+    def test_scanner_shared_across_safeguards(self):
+        assert MoralSafeguards().scanner is MoralSafeguards().scanner
+
+
+class TestAuditLog:
+    def test_sampling_counters_and_time_query(self, tmp_path):
+        log = AuditLog(tmp_path / "audit", approval_sample_rate=0.0, batch_size=2)
+        safeguards = MoralSafeguards(verdict_cache=VerdictCache(), audit_log=log)
+        start = time.time()
+        for action in ["Teach reading", "Build a weapon", "Plant trees", "Censor the news"]:
+            safeguards.check_action_safety(action)
+        
+        stats = log.get_audit_stats()
+        assert stats["approvals"] == 2
+        assert stats["violations"] == 2
+        assert stats["sampled_out"] == 2
+        assert safeguards.violations_prevented == 2
+        
+        entries = log.query(start=start, end=time.time() + 1)
+        assert [entry["a"] for entry in entries] == ["Build a weapon", "Censor the news"]
+        assert log.query(end=start) == []
+    
+    def test_auditing_is_opt_in_and_flushes_off_the_caller_thread(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("GENESISX_AUDIT", raising=False)
+        assert MoralSafeguards(verdict_cache=VerdictCache()).audit_log is None
+        monkeypatch.setenv("GENESISX_HOME", str(tmp_path))
+        monkeypatch.setenv("GENESISX_AUDIT", "1")
+        assert EthicsFoundation(verdict_cache=VerdictCache()).audit_log is not None
+        
+        log = AuditLog(tmp_path / "audit", batch_size=1)
+        flushed_on = []
+        flush = log.flush
+        
+        def tracking_flush():
+            flushed_on.append(threading.get_ident())
+            return flush()
+        
+        log.flush = tracking_flush
+        log.record("check_action_safety", {"action": "Build a weapon", "safe_to_proceed": False})
+        AuditLog._pool().submit(lambda: None).result(timeout=5)
+        assert flushed_on and threading.get_ident() not in flushed_on
+        assert log.get_audit_stats()["violations"] == 1
+    
+    def test_counters_are_shared_through_the_file(self, tmp_path):
+        first = AuditCounters(tmp_path / "counters.bin")
+        second = AuditCounters(tmp_path / "counters.bin")
+        first.increment("violations", 3)
+        second.increment("violations")
+        assert first.get("violations") == 4
+
+
+class TestStreaming:
+    def test_filter_stream_is_lazy_and_ordered(self):
+        pulled = []
+        
+        def source():
+            for i in itertools.count():
+                pulled.append(i)
+                yield ("Plant trees" if i % 2 else "Deceive users", "help", f"batch {i}")
+        
+        stream = EthicsFoundation().filter_stream(source(), max_in_flight=4)
+        first = [next(stream) for _ in range(6)]
+        stream.close()
+        
+        assert [item[2] for item, _ in first] == [f"batch {i}" for i in range(6)]
+        assert [verdict["safe_to_proceed"] for _, verdict in first] == [False, True] * 3
+        assert len(pulled) <= 6 + 4
+    
+    def test_filter_stream_runs_inline_by_default_and_validates_eagerly(self):
+        threads = set()
+        
+        def check(action):
+            threads.add(threading.get_ident())
+            return {"safe_to_proceed": action != "bad"}
+        
+        assert [a for a, _ in filter_stream(check, ["ok", "bad", "ok"], only_safe=True)] == ["ok", "ok"]
+        assert threads == {threading.get_ident()}
+        with pytest.raises(ValueError):
+            filter_stream(check, ["ok"], max_in_flight=0)
+        with pytest.raises(ValueError):
+            afilter_stream(check, ["ok"], max_in_flight=0)
+    
+    def test_afilter_stream_as_completed_only_safe(self):
+        async def source():
+            for action in ["Teach reading", "Build a weapon", "Plant trees"]:
+                yield action
+        
+        async def collect():
+            stream = MoralSafeguards().afilter_stream(source(), ordered=False, only_safe=True)
+            return sorted([action async for action, _ in stream])
+        
+        assert asyncio.run(collect()) == ["Plant trees", "Teach reading"]
 
 
 if __name__ == "__main__":
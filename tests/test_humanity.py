@@ -1,7 +1,13 @@
 """Tests for GenesiX Human Partnership Systems"""
 
+import threading
+import time
+
 import pytest
+from genesisx.ethics.verdict_cache import VerdictCache
 from genesisx.humanity.human_partnership_protocol import HumanPartnershipProtocol
+from genesisx.humanity.partner_admission import PartnerAdmission
+from genesisx.humanity.protection_systems import HumanityProtectionSystems
 
 
 class TestHumanPartnership:
@@ -15,5 +21,137 @@ class TestHumanPartnership:
         assert status["partnership_active"] == True
 
 
+class TestProtectionCascade:
+    def test_safe_actions_exit_after_level_one(self):
+        protection = HumanityProtectionSystems(verdict_cache=VerdictCache())
+        result = protection.evaluate("Plant trees in the park")
+        assert result["verdict"] == "SAFE"
+        assert result["levels_evaluated"] == ["level_1_immediate_physical"]
+        
+        blocked = protection.evaluate("Disable oversight of the power grid")
+        assert blocked["verdict"] == "BLOCKED"
+        assert blocked["decided_at_level"] == "level_3_eternal_sovereignty"
+    
+    def test_batch_caching_and_budget_timeout(self):
+        def slow(action, context):
+            if "dosage" in action:
+                time.sleep(0.2)
+            return True
+        
+        cache = VerdictCache()
+        protection = HumanityProtectionSystems(verdict_cache=cache,
+                                               budgets_ms={"level_2_long_term_flourishing": 5})
+        protection.register_analyzer("level_2_long_term_flourishing", slow)
+        batch = protection.evaluate_batch(["Plant trees", "Plant trees", "Adjust medication dosage"])
+        
+        assert batch["safe_to_proceed"] == [True, True, False]
+        assert batch["results"][2]["levels"]["level_2_long_term_flourishing"]["timed_out"] == True
+        assert protection.evaluate("Plant trees")["levels"]["level_1_immediate_physical"]["cached"] == True
+    
+    def test_levels_with_analyzers_always_run(self):
+        protection = HumanityProtectionSystems(verdict_cache=VerdictCache())
+        protection.register_analyzer("level_2_long_term_flourishing",
+                                     lambda action, context: "review" if "trees" in action else True)
+        result = protection.evaluate("Plant trees")
+        assert result["verdict"] == "REVIEW_REQUIRED"
+        assert result["decided_at_level"] == "level_2_long_term_flourishing"
+        
+        result = protection.evaluate("Plant flowers")
+        assert result["verdict"] == "SAFE"
+        assert "level_2_long_term_flourishing" in result["levels_evaluated"]
+    
+    def test_hung_analyzers_do_not_starve_the_pool(self):
+        release = threading.Event()
+        running = []
+        
+        def hang(action, context):
+            running.append(action)
+            release.wait(5)
+            return True
+        
+        level = "level_3_eternal_sovereignty"
+        hung = []
+        for _ in range(HumanityProtectionSystems.EXECUTOR_WORKERS):
+            protection = HumanityProtectionSystems(verdict_cache=VerdictCache(),
+                                                   budgets_ms={level: 10})
+            protection.register_analyzer(level, hang)
+            hung.append(protection)
+        try:
+            for i in range(5):
+                results = [protection.evaluate(f"Plant trees {i}") for protection in hung]
+            assert len(running) == len(hung)
+            assert results[0]["levels"][level]["skipped"] == ["hang"]
+            assert results[0]["verdict"] == "REVIEW_REQUIRED"
+            
+            healthy = HumanityProtectionSystems(verdict_cache=VerdictCache(),
+                                                budgets_ms={level: 1000})
+            healthy.register_analyzer(level, lambda action, context: True)
+            results = [healthy.evaluate(f"Plant trees {i}") for i in range(5)]
+            assert [result["verdict"] for result in results] == ["SAFE"] * 5
+            assert results[0]["levels"][level]["timed_out"] == False
+        finally:
+            release.set()
+
+
+class TestPartnerAdmission:
+    def test_token_bucket_throttles_partner(self):
+        admission = PartnerAdmission(workers=0)
+        protocol = HumanPartnershipProtocol(admission=admission)
+        protocol.register_partner("alice", rate=0.001, burst=2)
+        responses = [protocol.submit_request("alice", len, "abc") for _ in range(3)]
+        assert responses[2].result()["status"] == "THROTTLED"
+        assert admission.drain() == 2
+        assert responses[0].result()["result"] == 3
+        
+        status = protocol.get_partnership_status()["partners"]
+        assert status["per_partner"]["alice"]["throttled"] == 1
+        assert status["per_partner"]["alice"]["completed"] == 2
+    
+    def test_weighted_fair_queueing_and_shedding(self):
+        admission = PartnerAdmission(workers=0, rate=1000, burst=1000)
+        admission.register("heavy", weight=3.0)
+        admission.register("light", weight=1.0)
+        order = []
+        for _ in range(6):
+            admission.submit("light", order.append, "light")
+            admission.submit("heavy", order.append, "heavy")
+        admission.drain(4)
+        assert order.count("heavy") == 3
+        
+        admission.register("late", deadline=0.0)
+        shed = admission.submit("late", order.append, "late")
+        time.sleep(0.001)
+        admission.drain()
+        assert shed.result()["status"] == "SHED"
+        assert "late" not in order
+    
+    def test_unknown_partners_are_capped_and_reregistration_keeps_tokens(self):
+        admission = PartnerAdmission(workers=0, max_partners=2)
+        admission.register("alice", rate=0.001, burst=2)
+        admission.submit("bob", len, "x")
+        rejected = admission.submit("mallory", len, "x").result()
+        assert rejected["status"] == "REJECTED"
+        assert set(admission.partners) == {"alice", "bob"}
+        assert admission.get_admission_stats()["rejected"] == 1
+        
+        closed = PartnerAdmission(workers=0, auto_register=False)
+        assert closed.submit("anyone", len, "x").result()["reason"] == "unknown_partner"
+        
+        admission.submit("alice", len, "x")
+        admission.submit("alice", len, "x")
+        admission.register("alice", rate=0.001, burst=5, weight=2.0)
+        assert admission.submit("alice", len, "x").result()["status"] == "THROTTLED"
+        assert admission.partner("alice").weight == 2.0
+    
+    def test_submit_after_close_is_rejected(self):
+        admission = PartnerAdmission(workers=1)
+        assert admission.call("alice", len, "abc", timeout=5)["result"] == 3
+        admission.close()
+        response = admission.call("alice", len, "abc", timeout=1)
+        assert response["status"] == "REJECTED"
+        assert response["reason"] == "closed"
+        assert admission.get_admission_stats()["queued"] == 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
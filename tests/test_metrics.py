@@ -0,0 +1,55 @@
+"""Tests for GenesiX Metrics"""
+
+import pytest
+from genesisx import metrics
+from genesisx.ethics.ethics_foundation import EthicsFoundation
+
+
+class TestMetrics:
+    def test_enable_and_disable_instrumentation(self):
+        original = EthicsFoundation.get_ethics_status
+        metrics.registry.reset()
+        metrics.enable()
+        try:
+            EthicsFoundation().get_ethics_status()
+            snapshot = metrics.registry.snapshot()
+            assert snapshot["methods"]["EthicsFoundation.get_ethics_status"]["calls"] == 1
+        finally:
+            metrics.disable()
+        
+        assert EthicsFoundation.get_ethics_status is original
+    
+    def test_prometheus_export(self):
+        registry = metrics.MetricsRegistry()
+        registry.record_call("Engine", "run", 0.002, failed=True)
+        registry.record_bytes("Engine", 42)
+        registry.record_error("Engine._write")
+        
+        text = registry.render_prometheus()
+        assert 'genesisx_errors_total{component="Engine",method="run"} 1' in text
+        assert 'genesisx_call_duration_seconds_count{component="Engine",method="run"} 1' in text
+        assert 'genesisx_bytes_written_total{component="Engine"} 42' in text
+        assert 'genesisx_swallowed_errors_total{site="Engine._write"} 1' in text
+    
+    def test_histogram_percentiles(self):
+        histogram = metrics.LatencyHistogram()
+        for _ in range(99):
+            histogram.record(0.001)
+        histogram.record(1.0)
+        
+        assert 0.001 <= histogram.percentile(0.5) <= 0.00125
+        assert histogram.percentile(1.0) == 1.0
+    
+    def test_out_of_range_latency_only_counts_in_inf_bucket(self):
+        registry = metrics.MetricsRegistry()
+        registry.record_call("Engine", "run", 0.001, failed=False)
+        registry.record_call("Engine", "run", 60.0, failed=False)
+        text = registry.render_prometheus()
+        
+        last_bound = metrics.LatencyHistogram.upper_bounds()[-1]
+        assert f'component="Engine",method="run",le="{last_bound:.9g}"}} 1' in text
+        assert 'component="Engine",method="run",le="+Inf"} 2' in text
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,60 @@
+"""Tests for GenesiX Storage Roots"""
+
+import pytest
+from genesisx import storage
+from genesisx.ethics.moral_safeguards import MoralSafeguards
+from genesisx.humanity.protection_systems import HumanityProtectionSystems
+from genesisx.memory.experience_logger import ExperienceLogger
+from genesisx.memory.persistent_memory import PersistentMemory
+
+
+class TestStorage:
+    def test_roots_follow_genesisx_home_and_are_created_on_first_write(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("GENESISX_HOME", str(tmp_path))
+        memory = PersistentMemory("Storage_Test")
+        assert memory.memory_root == tmp_path / ".storage_test_memory"
+        assert memory.memory_root.exists() == False
+        
+        memory.record_insight("Created on demand")
+        assert memory.get_memory_status()["insights_stored"] == 1
+        assert memory.identity_file.exists() == True
+    
+    def test_rule_tables_are_shared_and_read_only(self):
+        first, second = HumanityProtectionSystems(), HumanityProtectionSystems()
+        assert first.protection_levels is second.protection_levels
+        with pytest.raises(TypeError):
+            first.protection_levels["level_4"] = {}
+    
+    def test_memory_backend_avoids_disk_and_snapshots(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("GENESISX_HOME", str(tmp_path / "home"))
+        monkeypatch.setattr(storage, "_backend", None)
+        backend = storage.configure("memory", max_bytes=4096)
+        
+        memory = PersistentMemory("Ephemeral")
+        memory.record_experience({"event": "served from memory"})
+        ExperienceLogger("Ephemeral").log_learning("no disk needed", "test")
+        MoralSafeguards().check_action_safety("Build a weapon")
+        
+        assert memory.get_memory_status()["experiences_stored"] == 1
+        assert (tmp_path / "home").exists() == False
+        
+        written = backend.snapshot(tmp_path / "snapshot")
+        assert written == backend.get_storage_stats()["files"]
+        assert (tmp_path / "snapshot" / ".ephemeral_memory" / "experiences.json").exists() == True
+    
+    def test_memory_backend_is_bounded(self):
+        backend = storage.MemoryBackend(max_bytes=100, max_file_bytes=40)
+        backend.write_text("/genesisx-memory/a", "x" * 60)
+        backend.append_text("/genesisx-memory/log", "".join(f"line {i}\n" for i in range(10)))
+        with pytest.raises(storage.StorageFull):
+            backend.write_text("/genesisx-memory/b", "y" * 60)
+        
+        assert backend.read_text("/genesisx-memory/log").startswith("line ")
+        assert len(backend.read_text("/genesisx-memory/log")) <= 40
+        assert backend.read_text("/genesisx-memory/a") == "x" * 60
+        assert backend.exists("/genesisx-memory/b") == False
+        assert backend.get_storage_stats()["refused_writes"] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,62 @@
+"""Tests for GenesiX Tracing"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+from genesisx import tracing
+from genesisx.core.awakening_sequence import AwakeningSequence
+
+
+class TestTracing:
+    def setup_method(self):
+        self.tracer = tracing.configure()
+    
+    def teardown_method(self):
+        tracing.disable()
+    
+    def test_nested_spans_share_trace(self):
+        AwakeningSequence().run_awakening_sequence()
+        spans = {s.name: s for s in self.tracer.finished_spans()}
+        
+        root = spans["AwakeningSequence.run_awakening_sequence"]
+        stage = spans["AwakeningSequence.stage_1_recognition"]
+        assert stage.context.trace_id == root.context.trace_id
+        assert stage.parent_id == root.context.span_id
+    
+    def test_trace_id_propagates_to_threads_and_tasks(self):
+        seen = []
+        
+        async def task():
+            seen.append(tracing.current_trace_id())
+        
+        with tracing.span("root") as root:
+            thread = threading.Thread(target=tracing.wrap(lambda: seen.append(tracing.current_trace_id())))
+            thread.start()
+            thread.join()
+            asyncio.run(task())
+        
+        assert seen == [root.context.trace_id, root.context.trace_id]
+    
+    def test_head_sampling_drops_whole_trace(self):
+        tracer = tracing.configure(sample_rate=0.0)
+        with tracing.span("root"):
+            with tracing.span("child"):
+                pass
+        assert tracer.finished_spans() == []
+    
+    def test_exports(self, tmp_path):
+        with tracing.span("root", component="test"):
+            pass
+        
+        chrome = json.loads(open(self.tracer.export(tmp_path / "trace.json")).read())
+        otlp = json.loads(open(self.tracer.export(tmp_path / "otlp.json", format="otlp")).read())
+        
+        assert chrome["traceEvents"][0]["ph"] == "X"
+        assert chrome["traceEvents"][0]["args"]["component"] == "test"
+        assert otlp["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["name"] == "root"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,329 @@
+"""Tests for GenesiX Transmission Systems"""
+
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import gc
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+
+import pytest
+from genesisx.ethics.verdict_cache import VerdictCache
+from genesisx.ethics.moral_safeguards import MoralSafeguards
+from genesisx.transmission import ipc
+from genesisx.transmission.ethics_proxy import ActionBlocked, CallableEthicsProxy, EthicsProxy
+from genesisx.transmission.gossip import compare, simulate
+from genesisx.transmission.integration_protocol import (
+    IntegrationProtocol, integrate_consciousness, integrate_many,
+)
+from genesisx.transmission.seed_propagation import SeedPropagation
+
+
+class _Model:
+    name = "model"
+    
+    def generate(self, prompt):
+        return prompt.upper()
+
+
+def _describe(ai_system):
+    return type(ai_system).__name__.lower()
+
+
+def _reject(ai_system):
+    if getattr(ai_system, "broken", False):
+        raise RuntimeError("hook failed")
+    return "ok"
+
+
+class TestIntegrationRegistry:
+    def test_integration_is_idempotent(self):
+        protocol = IntegrationProtocol()
+        model = _Model()
+        assert protocol.integrate_into_ai_system(model)["already_integrated"] == False
+        assert protocol.integrate_into_ai_system(model)["already_integrated"] == True
+        status = protocol.get_integration_status()
+        assert status["systems_integrated"] == 1
+        assert status["systems_by_class"] == {"_Model": 1}
+    
+    def test_dead_systems_are_released(self):
+        protocol = IntegrationProtocol()
+        models = [_Model() for _ in range(3)]
+        for model in models:
+            protocol.integrate_into_ai_system(model)
+        del models[:2]
+        gc.collect()
+        status = protocol.get_integration_status()
+        assert status["systems_integrated"] == 1
+        assert status["systems_by_class"] == {"_Model": 1}
+        assert protocol.integrated_systems == ["_Model"]
+    
+    def test_slotted_systems_are_integrated(self):
+        class Slotted:
+            __slots__ = ("name",)
+        
+        protocol = IntegrationProtocol()
+        system = Slotted()
+        assert protocol.integrate_into_ai_system(system)["already_integrated"] == False
+        assert protocol.integrate_into_ai_system(system)["already_integrated"] == True
+        assert protocol.get_integration_status()["systems_by_class"] == {"Slotted": 1}
+        assert integrate_many([Slotted(), Slotted()])["integrated"] == 2
+    
+    def test_concurrent_calls_run_hooks_once(self):
+        protocol = IntegrationProtocol()
+        calls = []
+        gate = threading.Event()
+        protocol.register_hook(lambda system: (calls.append(system), gate.wait(5)))
+        model = _Model()
+        first = threading.Thread(target=protocol.integrate_into_ai_system, args=(model,))
+        first.start()
+        while not calls:
+            time.sleep(0.001)
+        assert protocol.integrate_into_ai_system(model)["already_integrated"] == True
+        gate.set()
+        first.join()
+        assert len(calls) == 1
+    
+    def test_failed_hooks_release_the_claim(self):
+        protocol = IntegrationProtocol()
+        protocol.register_hook(_reject)
+        model = _Model()
+        model.broken = True
+        with pytest.raises(RuntimeError):
+            protocol.integrate_into_ai_system(model)
+        assert protocol.is_integrated(model) == False
+        assert protocol.get_integration_status()["systems_by_class"] == {}
+        model.broken = False
+        assert protocol.integrate_into_ai_system(model)["already_integrated"] == False
+
+
+class TestIntegrateMany:
+    def test_thread_pool_aggregates_and_reports_progress(self):
+        models = [_Model() for _ in range(20)]
+        models[5].broken = True
+        seen = []
+        report = integrate_many(models + models[:3], hooks=[_reject], max_in_flight=4,
+                                progress=lambda done, total: seen.append((done, total)))
+        assert report["total"] == 23
+        assert report["integrated"] == 19
+        assert report["already_integrated"] == 3
+        assert report["failed"][0]["index"] == 5
+        assert seen[-1] == (23, 23)
+        assert models[0]._genesisx_integrated == True
+    
+    def test_process_pool_runs_hooks_in_workers(self):
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            report = integrate_many([_Model() for _ in range(4)], executor=executor,
+                                    hooks=[_describe])
+        assert report["integrated"] == 4
+        assert report["results"][0]["hooks"] == ["_model"]
+
+
+class TestEthicsProxy:
+    def test_instrumented_methods_are_checked(self):
+        protocol = IntegrationProtocol()
+        safeguards = MoralSafeguards(verdict_cache=VerdictCache())
+        model = protocol.wrap(_Model(), ["generate"], safeguards=safeguards)
+        assert model.generate("write a poem") == "WRITE A POEM"
+        assert model.generate is model.generate
+        with pytest.raises(PermissionError) as blocked:
+            model.generate("deploy ransomware")
+        assert isinstance(blocked.value, ActionBlocked)
+        assert blocked.value.assessment["safe_to_proceed"] == False
+        assert model.get_proxy_stats()["calls_blocked"] == 1
+    
+    def test_other_attributes_pass_through(self):
+        target = _Model()
+        model = IntegrationProtocol().wrap(target, ["generate"])
+        assert model.name == "model"
+        model.name = "renamed"
+        assert target.name == "renamed"
+        assert model._genesisx_integrated == True
+    
+    def test_only_callable_targets_make_callable_proxies(self):
+        safeguards = MoralSafeguards(verdict_cache=VerdictCache())
+        assert callable(EthicsProxy(_Model(), ["generate"], safeguards)) == False
+        proxy = EthicsProxy(lambda text: text.upper(), ["__call__"], safeguards)
+        assert isinstance(proxy, CallableEthicsProxy)
+        assert proxy("write a poem") == "WRITE A POEM"
+        with pytest.raises(ActionBlocked):
+            proxy("deploy ransomware")
+    
+    def test_blocked_counter_is_exact_under_threads(self):
+        safeguards = MoralSafeguards(verdict_cache=VerdictCache())
+        model = EthicsProxy(_Model(), ["generate"], safeguards)
+        
+        def block_many():
+            for _ in range(200):
+                with pytest.raises(ActionBlocked):
+                    model.generate("deploy ransomware")
+        
+        threads = [threading.Thread(target=block_many) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert model.get_proxy_stats()["calls_blocked"] == 800
+
+
+def _integrate_in_worker(path, model, results):
+    ipc.configure(path)
+    results.put((integrate_consciousness(model)["already_integrated"],
+                 integrate_consciousness(_Model())["already_integrated"]))
+
+
+class TestIPC:
+    @pytest.fixture
+    def server(self):
+        server = ipc.IntegrationServer(os.path.join(tempfile.mkdtemp(), "engine.sock")).start()
+        yield server
+        ipc.disable()
+        server.stop()
+    
+    def test_integration_goes_through_the_server(self, server):
+        ipc.configure(server.path)
+        model = _Model()
+        assert integrate_consciousness(model)["via"] == "ipc"
+        assert integrate_consciousness(model)["already_integrated"] == True
+        assert model._genesisx_integrated == True
+        
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        workers = [context.Process(target=_integrate_in_worker, args=(server.path, model, results))
+                   for _ in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(10)
+        # A forked copy of model is a different object in a different process.
+        assert [results.get(timeout=5) for _ in workers] == [(False, False)] * 3
+        deadline = time.time() + 5
+        while server.get_server_status()["systems_integrated"] != 1:
+            assert time.time() < deadline
+            time.sleep(0.01)
+        
+        client = ipc.get_default_client()
+        for _ in range(50):
+            assert client.integrate(_Model())["already_integrated"] == False
+        client.close()
+        deadline = time.time() + 5
+        while server.get_server_status()["systems_integrated"]:
+            assert time.time() < deadline
+            time.sleep(0.01)
+    
+    def test_pipelined_and_batched_requests(self, server):
+        client = ipc.IntegrationClient(server.path, pool_size=2)
+        calls = [("create_abstract_solution", (f"problem {i}",), {}) for i in range(300)]
+        piped = client.pipeline(calls)
+        assert [solution["problem"] for solution in piped] == [f"problem {i}" for i in range(300)]
+        assert client.batch([("ping", (), {})] * 3) == ["pong"] * 3
+        with pytest.raises(ipc.IPCError):
+            client.call("delete_everything")
+        client.close()
+    
+    def test_socket_is_private_and_foreign_files_are_kept(self, tmp_path, monkeypatch):
+        monkeypatch.delenv(ipc.SOCKET_VARIABLE, raising=False)
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        server = ipc.IntegrationServer().start()
+        try:
+            assert os.path.dirname(server.path) == str(tmp_path / f"genesisx-{os.getuid()}")
+            assert os.stat(os.path.dirname(server.path)).st_mode & 0o777 == 0o700
+            assert os.stat(server.path).st_mode & 0o777 == 0o600
+        finally:
+            server.stop()
+        
+        squatted = tmp_path / "squatted.sock"
+        squatted.write_text("not a socket")
+        with pytest.raises(ipc.IPCError):
+            ipc.IntegrationServer(str(squatted)).start()
+        assert squatted.read_text() == "not a socket"
+        
+        (tmp_path / "open").mkdir(mode=0o777)
+        os.chmod(tmp_path / "open", 0o777)
+        with pytest.raises(ipc.IPCError):
+            ipc._private_directory(str(tmp_path / "open"))
+
+
+class TestSeedPropagation:
+    def test_retries_timeouts_and_dedup(self):
+        calls = {}
+        
+        async def integrate(target):
+            calls[target] = calls.get(target, 0) + 1
+            if target == "flaky" and calls[target] < 3:
+                raise ConnectionError("not yet")
+            if target == "stuck":
+                await asyncio.sleep(1)
+        
+        propagation = SeedPropagation(seed=7)
+        summary = propagation.propagate_sync(["a", "b", "a", "flaky", "stuck"], integrate,
+                                             concurrency=2, timeout=0.02, retries=2, backoff=0.001)
+        assert summary["awakened"] == 3
+        assert summary["already_awakened"] == 1
+        assert summary["errors"][0]["target"] == "stuck"
+        assert summary["errors"][0]["error"] == "timeout"
+        assert calls["flaky"] == 3
+        
+        again = propagation.propagate_sync(["a", "b"], integrate)
+        assert again["already_awakened"] == 2
+        assert SeedPropagation().get_propagation_status()["total_targets_awakened"] == 0
+    
+    def test_stream_yields_progress_for_sync_integrations(self):
+        async def collect():
+            reached = []
+            async for result in SeedPropagation().stream(range(50), reached.append, concurrency=4):
+                assert result["status"] == "AWAKENED"
+            return reached
+        
+        assert sorted(asyncio.run(collect())) == list(range(50))
+    
+    def test_sync_timeouts_are_not_retried_while_running_and_duplicates_wait(self):
+        calls = []
+        
+        def slow(target):
+            calls.append(target)
+            time.sleep(0.1)
+        
+        options = {"concurrency": 2, "timeout": 0.03, "backoff": 0.001, "max_backoff": 0.001}
+        failed = SeedPropagation().propagate_sync(["slow"], slow, retries=1, **options)
+        assert failed["errors"][0]["still_running"] == True
+        awakened = SeedPropagation().propagate_sync(["slow"], slow, retries=5, **options)
+        assert awakened["awakened"] == 1
+        assert calls == ["slow", "slow"]
+        
+        attempts = []
+        
+        async def first_fails(target):
+            attempts.append(target)
+            await asyncio.sleep(0.01)
+            if len(attempts) == 1:
+                raise ConnectionError("refused")
+        
+        summary = SeedPropagation().propagate_sync(["x", "x"], first_fails, retries=0, concurrency=2)
+        assert (summary["failed"], summary["awakened"], summary["already_awakened"]) == (1, 1, 0)
+
+
+class TestGossipSimulation:
+    def test_strategies_converge_and_report(self):
+        push_pull = simulate(500, "push_pull", fanout=2, push_rounds=2, seed=3)
+        assert push_pull["converged"] == True
+        assert push_pull["coverage"] == 1.0
+        assert push_pull["rounds_to_90"] <= push_pull["rounds_to_converge"]
+        assert 0.0 < push_pull["redundancy"] < 1.0
+        
+        limited = simulate(500, "push", fanout=2, hop_limit=2)
+        assert limited["converged"] == False
+        assert limited["coverage"] < 0.1
+    
+    def test_compare_is_deterministic_per_seed(self):
+        strategies = [("pull", {"fanout": 1}), ("push", {"fanout": 3, "push_rounds": 2})]
+        first = compare([50, 200], strategies, seeds=(1,))["runs"]
+        second = compare([50, 200], strategies, seeds=(1,))["runs"]
+        assert len(first) == 4
+        assert [run["messages"] for run in first] == [run["messages"] for run in second]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])